@@ -0,0 +1,125 @@
+"""add composite lookup index to forecastmodel
+
+Revision ID: 006_forecast_lookup_index
+Revises: 961ea7d38e2d
+Create Date: 2026-10-18 00:00:00.000000
+
+PURPOSE:
+Edit view previews and updates (reallocation, bench allocation, CPH update)
+filter forecastmodel by Month + Year and then match records on
+(Main_LOB, State, Case_Type, Call_Type_ID). The existing single-column
+indexes cannot serve that lookup, so every preview/update scans the whole
+month/year partition.
+
+This migration adds one composite index:
+- idx_forecast_lookup: (Month, Year, Main_LOB, State, Case_Type)
+
+Centene_Capacity_Plan_Call_Type_ID has no length (VARCHAR(MAX) on MSSQL) and
+cannot be an index key column there, so on MSSQL/PostgreSQL it is carried as
+an INCLUDE column together with Target_CPH. SQLite ignores INCLUDE.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+
+# revision identifiers, used by Alembic.
+revision = '006_forecast_lookup_index'
+down_revision = '961ea7d38e2d'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'idx_forecast_lookup'
+TABLE_NAME = 'forecastmodel'
+KEY_COLUMNS = [
+    'Month',
+    'Year',
+    'Centene_Capacity_Plan_Main_LOB',
+    'Centene_Capacity_Plan_State',
+    'Centene_Capacity_Plan_Case_Type',
+]
+INCLUDE_COLUMNS = [
+    'Centene_Capacity_Plan_Call_Type_ID',
+    'Centene_Capacity_Plan_Target_CPH',
+]
+
+
+def table_exists(table_name):
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = Inspector.from_engine(bind)
+    return table_name in inspector.get_table_names()
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = Inspector.from_engine(bind)
+    return index_name in [index['name'] for index in inspector.get_indexes(table_name)]
+
+
+def upgrade() -> None:
+    """
+    Create idx_forecast_lookup on forecastmodel.
+
+    Compatible with both SQLite (development) and MSSQL (production).
+
+    TRANSACTION SAFETY:
+    - Uses Alembic's transaction context (auto-rollback on error)
+    - Checks for an existing index before creating (idempotent)
+    """
+
+    try:
+        if not table_exists(TABLE_NAME):
+            print(f"! {TABLE_NAME} table does not exist, skipping...")
+            return
+
+        if not index_exists(TABLE_NAME, INDEX_NAME):
+            print(f"+ Creating {INDEX_NAME} index...")
+            op.create_index(
+                INDEX_NAME,
+                TABLE_NAME,
+                KEY_COLUMNS,
+                mssql_include=INCLUDE_COLUMNS,
+                postgresql_include=INCLUDE_COLUMNS
+            )
+            print(f"  {INDEX_NAME} index created")
+        else:
+            print(f"- {INDEX_NAME} index already exists, skipping...")
+
+        print("\n Migration 006 completed successfully!")
+
+    except Exception as e:
+        print(f"\n ERROR during migration: {e}")
+        print("  Transaction will be rolled back automatically by Alembic")
+        raise
+
+
+def downgrade() -> None:
+    """
+    Drop idx_forecast_lookup from forecastmodel.
+
+    TRANSACTION SAFETY:
+    - All operations within this function are in a single transaction
+    - Automatic rollback on error
+    """
+
+    try:
+        if not table_exists(TABLE_NAME):
+            print(f"- {TABLE_NAME} table does not exist, skipping...")
+            return
+
+        if index_exists(TABLE_NAME, INDEX_NAME):
+            print(f"- Dropping {INDEX_NAME} index...")
+            op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
+            print(f"  {INDEX_NAME} index dropped")
+        else:
+            print(f"- {INDEX_NAME} index does not exist, skipping...")
+
+        print("\n Migration 006 downgrade completed successfully!")
+
+    except Exception as e:
+        print(f"\n ERROR during downgrade: {e}")
+        print("  Transaction will be rolled back automatically by Alembic")
+        raise
@@ -0,0 +1,108 @@
+"""add allocation type index to fte_allocation_mapping
+
+Revision ID: 007_fte_mapping_clear_index
+Revises: 006_forecast_lookup_index
+Create Date: 2026-10-18 00:00:00.000000
+
+PURPOSE:
+Every allocation run clears the previous FTE mappings of its type with a
+DELETE filtered on (report_month, report_year, allocation_type). The existing
+indexes lead with (report_month, report_year) but do not include
+allocation_type, so the delete reads every mapping of the report period,
+primary and bench alike.
+
+This migration adds one composite index:
+- idx_fte_mapping_clear: (report_month, report_year, allocation_type)
+
+get_fte_mappings() filters on (report_month, report_year, main_lob, state,
+case_type), which idx_fte_mapping_query already covers.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+
+# revision identifiers, used by Alembic.
+revision = '007_fte_mapping_clear_index'
+down_revision = '006_forecast_lookup_index'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'idx_fte_mapping_clear'
+TABLE_NAME = 'fte_allocation_mapping'
+KEY_COLUMNS = ['report_month', 'report_year', 'allocation_type']
+
+
+def table_exists(table_name):
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = Inspector.from_engine(bind)
+    return table_name in inspector.get_table_names()
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = Inspector.from_engine(bind)
+    return index_name in [index['name'] for index in inspector.get_indexes(table_name)]
+
+
+def upgrade() -> None:
+    """
+    Create idx_fte_mapping_clear on fte_allocation_mapping.
+
+    Compatible with both SQLite (development) and MSSQL (production).
+
+    TRANSACTION SAFETY:
+    - Uses Alembic's transaction context (auto-rollback on error)
+    - Checks for an existing index before creating (idempotent)
+    """
+
+    try:
+        if not table_exists(TABLE_NAME):
+            print(f"! {TABLE_NAME} table does not exist, skipping...")
+            return
+
+        if not index_exists(TABLE_NAME, INDEX_NAME):
+            print(f"+ Creating {INDEX_NAME} index...")
+            op.create_index(INDEX_NAME, TABLE_NAME, KEY_COLUMNS)
+            print(f"  {INDEX_NAME} index created")
+        else:
+            print(f"- {INDEX_NAME} index already exists, skipping...")
+
+        print("\n Migration 007 completed successfully!")
+
+    except Exception as e:
+        print(f"\n ERROR during migration: {e}")
+        print("  Transaction will be rolled back automatically by Alembic")
+        raise
+
+
+def downgrade() -> None:
+    """
+    Drop idx_fte_mapping_clear from fte_allocation_mapping.
+
+    TRANSACTION SAFETY:
+    - All operations within this function are in a single transaction
+    - Automatic rollback on error
+    """
+
+    try:
+        if not table_exists(TABLE_NAME):
+            print(f"- {TABLE_NAME} table does not exist, skipping...")
+            return
+
+        if index_exists(TABLE_NAME, INDEX_NAME):
+            print(f"- Dropping {INDEX_NAME} index...")
+            op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
+            print(f"  {INDEX_NAME} index dropped")
+        else:
+            print(f"- {INDEX_NAME} index does not exist, skipping...")
+
+        print("\n Migration 007 downgrade completed successfully!")
+
+    except Exception as e:
+        print(f"\n ERROR during downgrade: {e}")
+        print("  Transaction will be rolled back automatically by Alembic")
+        raise
@@ -0,0 +1,117 @@
+"""add case-insensitive lookup index to fte_allocation_mapping
+
+Revision ID: 008_fte_mapping_ci_index
+Revises: 007_fte_mapping_clear_index
+Create Date: 2026-10-18 00:00:00.000000
+
+PURPOSE:
+get_fte_mappings() matches main_lob, state and case_type case-insensitively
+as lower(column) = lower(value). A plain index on the columns cannot serve
+that comparison on SQLite or PostgreSQL, so this migration adds an
+expression index:
+- idx_fte_mapping_query_ci: (report_month, report_year, lower(main_lob),
+  lower(state), lower(case_type))
+
+MSSQL does not support expression indexes and is skipped; its default
+case-insensitive collation already lets idx_fte_mapping_query serve lookups.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+
+# revision identifiers, used by Alembic.
+revision = '008_fte_mapping_ci_index'
+down_revision = '007_fte_mapping_clear_index'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'idx_fte_mapping_query_ci'
+TABLE_NAME = 'fte_allocation_mapping'
+KEY_COLUMNS = [
+    'report_month',
+    'report_year',
+    sa.text('lower(main_lob)'),
+    sa.text('lower(state)'),
+    sa.text('lower(case_type)'),
+]
+SUPPORTED_DIALECTS = ('sqlite', 'postgresql')
+
+
+def table_exists(table_name):
+    """Check if a table exists."""
+    bind = op.get_bind()
+    inspector = Inspector.from_engine(bind)
+    return table_name in inspector.get_table_names()
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = Inspector.from_engine(bind)
+    return index_name in [index['name'] for index in inspector.get_indexes(table_name)]
+
+
+def upgrade() -> None:
+    """
+    Create idx_fte_mapping_query_ci on fte_allocation_mapping.
+
+    Runs on SQLite (development); skipped on MSSQL (production).
+
+    TRANSACTION SAFETY:
+    - Uses Alembic's transaction context (auto-rollback on error)
+    - Checks for an existing index before creating (idempotent)
+    """
+
+    try:
+        if op.get_bind().dialect.name not in SUPPORTED_DIALECTS:
+            print(f"- Expression indexes not supported on {op.get_bind().dialect.name}, skipping...")
+            return
+
+        if not table_exists(TABLE_NAME):
+            print(f"! {TABLE_NAME} table does not exist, skipping...")
+            return
+
+        if not index_exists(TABLE_NAME, INDEX_NAME):
+            print(f"+ Creating {INDEX_NAME} index...")
+            op.create_index(INDEX_NAME, TABLE_NAME, KEY_COLUMNS)
+            print(f"  {INDEX_NAME} index created")
+        else:
+            print(f"- {INDEX_NAME} index already exists, skipping...")
+
+        print("\n Migration 008 completed successfully!")
+
+    except Exception as e:
+        print(f"\n ERROR during migration: {e}")
+        print("  Transaction will be rolled back automatically by Alembic")
+        raise
+
+
+def downgrade() -> None:
+    """
+    Drop idx_fte_mapping_query_ci from fte_allocation_mapping.
+
+    TRANSACTION SAFETY:
+    - All operations within this function are in a single transaction
+    - Automatic rollback on error
+    """
+
+    try:
+        if not table_exists(TABLE_NAME):
+            print(f"- {TABLE_NAME} table does not exist, skipping...")
+            return
+
+        if index_exists(TABLE_NAME, INDEX_NAME):
+            print(f"- Dropping {INDEX_NAME} index...")
+            op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
+            print(f"  {INDEX_NAME} index dropped")
+        else:
+            print(f"- {INDEX_NAME} index does not exist, skipping...")
+
+        print("\n Migration 008 downgrade completed successfully!")
+
+    except Exception as e:
+        print(f"\n ERROR during downgrade: {e}")
+        print("  Transaction will be rolled back automatically by Alembic")
+        raise
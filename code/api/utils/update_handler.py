@@ -11,7 +11,7 @@ from fastapi import HTTPException
 from sqlalchemy.exc import SQLAlchemyError
 
 from code.logics.core_utils import CoreUtils
-from code.logics.bench_allocation_transformer import calculate_summary_data
+from code.logics.bench_allocation_transformer import extract_changes_and_summary
 from code.logics.history_logger import create_complete_history_log
 from code.api.dependencies import get_logger
 
@@ -170,8 +170,8 @@ def execute_update_operation(
                     core_utils
                 )
 
-                # Step 7: Calculate summary data
-                summary_data = calculate_summary_data(
+                # Step 7: Extract field-level changes and summary data
+                changes, summary_data = extract_changes_and_summary(
                     history_records,
                     request.months,
                     request.month,
@@ -187,7 +187,8 @@ def execute_update_operation(
                     user_notes=request.user_notes if hasattr(request, 'user_notes') else None,
                     modified_records=history_records,
                     months_dict=request.months,
-                    summary_data=summary_data
+                    summary_data=summary_data,
+                    changes=changes
                 )
 
                 logger.info(
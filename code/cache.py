@@ -8,6 +8,7 @@ Cache Instances:
     - filters_cache: 5 minutes TTL, max 8 entries (for filter dropdowns)
     - data_cache: 60 seconds TTL, max 64 entries (for data responses)
     - month_config_cache: 15 minutes TTL, max 20 entries (for month configurations)
+    - forecast_month_config_cache: 15 minutes TTL, max 24 entries (for forecast month configs)
     - month_mappings_cache: 1 hour TTL, max 20 entries (for month mappings)
     - allocation_list_cache: 30 seconds TTL, max 50 entries (for execution lists)
     - allocation_detail_cache: dynamic TTL, max 100 entries (for execution details)
@@ -53,6 +54,12 @@ data_cache = TTLCache(max_size=64, ttl_seconds=60)
 # Keys: "month_config:v1:{month}:{year}:{work_type}"
 month_config_cache = TTLCache(max_size=20, ttl_seconds=900)
 
+# Forecast month configuration cache: Used by CPH updates and allocation
+# 15 minutes TTL, max 24 entries (12 report periods x 2 work types)
+# Keys: "forecast_month_config:v1:{month}:{year}:{work_type}"
+# Kept apart from month_config_cache so endpoint responses can't evict these
+forecast_month_config_cache = TTLCache(max_size=24, ttl_seconds=900)
+
 
 # ============ Target CPH Configuration Caches ============
 
@@ -117,6 +124,27 @@ def generate_month_config_cache_key(
     return f"month_config:v1:{month_part}:{year_part}:{work_type_part}"
 
 
+def generate_forecast_month_config_cache_key(month: str, year: int, work_type: str) -> str:
+    """
+    Generate cache key for the 6-month forecast config of a report period.
+
+    Stored in forecast_month_config_cache, which month config writes also clear.
+
+    Args:
+        month: Report month name (e.g., "April")
+        year: Report year (e.g., 2025)
+        work_type: Work type "Domestic" or "Global"
+
+    Returns:
+        Cache key string
+
+    Examples:
+        generate_forecast_month_config_cache_key("April", 2025, "Domestic")
+        -> "forecast_month_config:v1:April:2025:Domestic"
+    """
+    return f"forecast_month_config:v1:{month}:{year}:{work_type}"
+
+
 def generate_month_mappings_cache_key(month: str, year: int) -> str:
     """
     Generate cache key for month mappings queries.
@@ -241,7 +269,7 @@ def get_ttl_for_execution_status(status: str) -> int:
 
 def invalidate_month_config_cache() -> int:
     """
-    Invalidate all month configuration cache entries.
+    Invalidate all month configuration cache entries, including forecast month configs.
 
     Called when month configurations are created, updated, or deleted.
 
@@ -251,6 +279,7 @@ def invalidate_month_config_cache() -> int:
     try:
         # Clear all month config cache entries
         month_config_cache.clear()
+        forecast_month_config_cache.clear()
         count = month_config_cache.stats()["size"]
         logger.info(f"[Cache] Invalidated all month configuration cache entries")
         return count
@@ -376,6 +405,7 @@ def clear_all_caches() -> dict:
         - filters_cache (manager view filters, forecast cascade filters)
         - data_cache (manager view hierarchical data)
         - month_config_cache (month configurations)
+        - forecast_month_config_cache (forecast month configurations)
         - month_mappings_cache (month mappings)
         - allocation_list_cache (execution lists)
         - allocation_detail_cache (execution details)
@@ -389,6 +419,7 @@ def clear_all_caches() -> dict:
             "filters_cache": {"size": 0, "max_size": 8, "ttl_seconds": 300},
             "data_cache": {"size": 0, "max_size": 64, "ttl_seconds": 60},
             "month_config_cache": {"size": 0, "max_size": 20, "ttl_seconds": 900},
+            "forecast_month_config_cache": {"size": 0, "max_size": 24, "ttl_seconds": 900},
             "month_mappings_cache": {"size": 0, "max_size": 20, "ttl_seconds": 3600},
             "allocation_list_cache": {"size": 0, "max_size": 50, "ttl_seconds": 30},
             "allocation_detail_cache": {"size": 0, "max_size": 100, "ttl_seconds": 5},
@@ -403,6 +434,7 @@ def clear_all_caches() -> dict:
         filters_cache.clear()
         data_cache.clear()
         month_config_cache.clear()
+        forecast_month_config_cache.clear()
         month_mappings_cache.clear()
         allocation_list_cache.clear()
         allocation_detail_cache.clear()
@@ -416,6 +448,7 @@ def clear_all_caches() -> dict:
             f"filters_cache: {filters_cache.stats()}, "
             f"data_cache: {data_cache.stats()}, "
             f"month_config_cache: {month_config_cache.stats()}, "
+            f"forecast_month_config_cache: {forecast_month_config_cache.stats()}, "
             f"month_mappings_cache: {month_mappings_cache.stats()}, "
             f"allocation_list_cache: {allocation_list_cache.stats()}, "
             f"allocation_detail_cache: {allocation_detail_cache.stats()}, "
@@ -428,6 +461,7 @@ def clear_all_caches() -> dict:
             "filters_cache": filters_cache.stats(),
             "data_cache": data_cache.stats(),
             "month_config_cache": month_config_cache.stats(),
+            "forecast_month_config_cache": forecast_month_config_cache.stats(),
             "month_mappings_cache": month_mappings_cache.stats(),
             "allocation_list_cache": allocation_list_cache.stats(),
             "allocation_detail_cache": allocation_detail_cache.stats(),
@@ -449,12 +483,14 @@ __all__ = [
     'filters_cache',
     'data_cache',
     'month_config_cache',
+    'forecast_month_config_cache',
     'month_mappings_cache',
     'allocation_list_cache',
     'allocation_detail_cache',
     'target_cph_cache',
     'target_cph_lookup_cache',
     'generate_month_config_cache_key',
+    'generate_forecast_month_config_cache_key',
     'generate_month_mappings_cache_key',
     'generate_execution_list_cache_key',
     'generate_execution_detail_cache_key',
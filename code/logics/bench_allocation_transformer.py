@@ -6,7 +6,7 @@ field-level change data for history tracking.
 """
 
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from pydantic import BaseModel, ConfigDict, Field
 from code.logics.core_utils import CoreUtils
@@ -19,6 +19,8 @@ from code.logics.bench_allocation import AllocationResult
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED_RECORD_KEYS = ("main_lob", "state", "case_type", "case_id")
+
 
 # ============================================================================
 # TYPE-SAFE DATA STRUCTURES
@@ -291,11 +293,13 @@ def transform_allocation_result_to_preview(
 
             # Build record with Pydantic models
             month_data_dict = {}
-            modified_fields = []
+            # Ordered de-duplicated field paths (dict keys keep insertion order)
+            modified_fields = {}
 
-            # Initialize all 6 months (some may not have allocation records)
+            # Initialize all 6 months (some may not have allocation records);
+            # constant zeros need no field validation
             for month_idx, month_label in months_dict.items():
-                month_data_dict[month_label] = MonthDataResponse(
+                month_data_dict[month_label] = MonthDataResponse.model_construct(
                     forecast=0,
                     fte_req=0,
                     fte_avail=0,
@@ -365,19 +369,14 @@ def transform_allocation_result_to_preview(
                 )
 
                 if has_changes:
-                    # Add ALL fields for this month (complete snapshot of modified record)
-                    # Use set to avoid duplicates if multiple months for same record
-                    fields_to_add = [
+                    # Add ALL fields for this month (complete snapshot of modified record);
+                    # a month allocated more than once for the same record is added once
+                    modified_fields.update(dict.fromkeys((
                         f"{month_label}.forecast",
                         f"{month_label}.fte_req",
                         f"{month_label}.fte_avail",
                         f"{month_label}.capacity"
-                    ]
-
-                    # Only add if not already in list
-                    for field in fields_to_add:
-                        if field not in modified_fields:
-                            modified_fields.append(field)
+                    )))
 
                     # Update totals
                     total_fte_change += abs(allocation_record.fte_change)
@@ -392,7 +391,7 @@ def transform_allocation_result_to_preview(
                     case_id=first_row.call_type_id,  # Business identifier (used for database updates)
                     target_cph=first_row.target_cph,
                     target_cph_change=0,
-                    modified_fields=modified_fields,
+                    modified_fields=list(modified_fields),
                     months=month_data_dict
                 )
                 modified_records.append(record_response)
@@ -493,6 +492,159 @@ def _get_month_data(record: Dict, month_label: str) -> Optional[Dict]:
     return None
 
 
+def _append_record_changes(i: int, record: Dict, append_change) -> None:
+    """
+    Append the field-level changes of one modified record.
+
+    Args:
+        i: Index of the record (for error messages)
+        record: Modified record dict
+        append_change: Callable receiving each change dict
+
+    Raises:
+        ValueError: If the record or its month data is malformed
+        KeyError: If required keys are missing from the record
+    """
+    # Validate record structure
+    if not isinstance(record, dict):
+        raise ValueError(f"Record at index {i} is not a dict")
+
+    # Validate required keys
+    missing_keys = [k for k in _REQUIRED_RECORD_KEYS if k not in record]
+    if missing_keys:
+        raise KeyError(
+            f"Record at index {i} missing required keys: {missing_keys}"
+        )
+
+    main_lob = record["main_lob"]
+    state = record["state"]
+    case_type = record["case_type"]
+    case_id = record["case_id"]
+    modified_fields = record.get("modified_fields", [])
+
+    if not isinstance(modified_fields, list):
+        raise ValueError(f"Record at index {i}: modified_fields must be a list")
+
+    # Each month carries several modified fields; resolve its data once
+    month_data_by_label = {}
+
+    for field_path in modified_fields:
+        # Parse field path (DOT notation) using utility function
+        month_label, field_name = parse_field_path(field_path)
+
+        if month_label:
+            # Month-specific field: "Jun-25.fte_avail"
+            month_data = month_data_by_label.get(month_label)
+            if month_data is None:
+                # Use helper to extract month data (handles both flat and nested structures)
+                month_data = _get_month_data(record, month_label)
+
+                if not isinstance(month_data, dict):
+                    raise ValueError(
+                        f"Record at index {i}: month_label '{month_label}' not found or not a dict. "
+                        f"Expected either record['{month_label}'] or record['months']['{month_label}']"
+                    )
+                month_data_by_label[month_label] = month_data
+            source = month_data
+        else:
+            # Month-agnostic field: "target_cph"
+            source = record
+
+        # Get old/new values
+        new_value = source.get(field_name)
+        delta = source.get(f"{field_name}_change", 0)
+        old_value = new_value - delta if isinstance(new_value, (int, float)) else None
+
+        append_change({
+            "main_lob": main_lob,
+            "state": state,
+            "case_type": case_type,
+            "case_id": case_id,
+            "field_name": field_path,  # Keep DOT notation
+            "old_value": old_value,
+            "new_value": new_value,
+            "delta": delta,
+            "month_label": month_label or None  # None: no month context
+        })
+
+
+def _init_month_totals(months_dict: Dict[str, str]) -> Tuple[List[str], Dict]:
+    """Ordered month labels and zeroed before/after totals for each of them."""
+    try:
+        month_labels = get_ordered_month_labels(months_dict)
+        return month_labels, {
+            month_label: {
+                "total_forecast": {"old": 0, "new": 0},
+                "total_fte_required": {"old": 0, "new": 0},
+                "total_fte_available": {"old": 0, "new": 0},
+                "total_capacity": {"old": 0, "new": 0}
+            }
+            for month_label in month_labels
+        }
+    except Exception as e:
+        logger.error(f"Error initializing month totals: {e}", exc_info=True)
+        raise ValueError(f"Failed to initialize summary data: {e}")
+
+
+def _add_record_totals(
+    i: int,
+    record: Dict,
+    month_labels: List[str],
+    month_totals: Dict
+) -> None:
+    """
+    Add one modified record's month values to the running month totals.
+
+    Raises:
+        ValueError: If the record or its month data is not a dict
+    """
+    if not isinstance(record, dict):
+        raise ValueError(f"Record at index {i} is not a dict")
+
+    for month_label in month_labels:
+        month_data = record.get(month_label, {})
+
+        if month_data:
+            if not isinstance(month_data, dict):
+                raise ValueError(
+                    f"Record at index {i}: month_data for '{month_label}' is not a dict"
+                )
+
+            totals = month_totals[month_label]
+
+            # Forecast (no change expected in most cases)
+            forecast = month_data.get("forecast", 0)
+            forecast_change = month_data.get("forecast_change", 0)
+            totals["total_forecast"]["new"] += forecast
+            totals["total_forecast"]["old"] += (forecast - forecast_change)
+
+            # FTE Required
+            fte_req = month_data.get("fte_req", 0)
+            fte_req_change = month_data.get("fte_req_change", 0)
+            totals["total_fte_required"]["new"] += fte_req
+            totals["total_fte_required"]["old"] += (fte_req - fte_req_change)
+
+            # FTE Available
+            fte_avail = month_data.get("fte_avail", 0)
+            fte_avail_change = month_data.get("fte_avail_change", 0)
+            totals["total_fte_available"]["new"] += fte_avail
+            totals["total_fte_available"]["old"] += (fte_avail - fte_avail_change)
+
+            # Capacity
+            capacity = month_data.get("capacity", 0)
+            capacity_change = month_data.get("capacity_change", 0)
+            totals["total_capacity"]["new"] += capacity
+            totals["total_capacity"]["old"] += (capacity - capacity_change)
+
+
+def _validate_summary_params(month: str, year: int) -> None:
+    if not month or not isinstance(month, str):
+        raise ValueError(f"Invalid month parameter: {month}")
+
+    if not year or not isinstance(year, int):
+        raise ValueError(f"Invalid year parameter: {year}")
+
+
 def extract_specific_changes(
     modified_records: List[Dict],
     months_dict: Dict[str, str]
@@ -520,78 +672,11 @@ def extract_specific_changes(
         raise ValueError("months_dict must be a dict")
 
     all_changes = []
+    append_change = all_changes.append
 
     try:
         for i, record in enumerate(modified_records):
-            # Validate record structure
-            if not isinstance(record, dict):
-                raise ValueError(f"Record at index {i} is not a dict")
-
-            # Validate required keys
-            required_keys = ["main_lob", "state", "case_type", "case_id"]
-            missing_keys = [k for k in required_keys if k not in record]
-            if missing_keys:
-                raise KeyError(
-                    f"Record at index {i} missing required keys: {missing_keys}"
-                )
-
-            main_lob = record["main_lob"]
-            state = record["state"]
-            case_type = record["case_type"]
-            case_id = record["case_id"]
-            modified_fields = record.get("modified_fields", [])
-
-            if not isinstance(modified_fields, list):
-                raise ValueError(f"Record at index {i}: modified_fields must be a list")
-
-            for field_path in modified_fields:
-                # Parse field path (DOT notation) using utility function
-                month_label, field_name = parse_field_path(field_path)
-
-                if month_label:
-                    # Month-specific field: "Jun-25.fte_avail"
-                    # Use helper to extract month data (handles both flat and nested structures)
-                    month_data = _get_month_data(record, month_label)
-
-                    if not isinstance(month_data, dict):
-                        raise ValueError(
-                            f"Record at index {i}: month_label '{month_label}' not found or not a dict. "
-                            f"Expected either record['{month_label}'] or record['months']['{month_label}']"
-                        )
-
-                    # Get old/new values
-                    new_value = month_data.get(field_name)
-                    delta = month_data.get(f"{field_name}_change", 0)
-                    old_value = new_value - delta if isinstance(new_value, (int, float)) else None
-
-                    all_changes.append({
-                        "main_lob": main_lob,
-                        "state": state,
-                        "case_type": case_type,
-                        "case_id": case_id,
-                        "field_name": field_path,  # Keep DOT notation
-                        "old_value": old_value,
-                        "new_value": new_value,
-                        "delta": delta,
-                        "month_label": month_label
-                    })
-                else:
-                    # Month-agnostic field: "target_cph"
-                    new_value = record.get(field_path)
-                    delta = record.get(f"{field_path}_change", 0)
-                    old_value = new_value - delta if isinstance(new_value, (int, float)) else None
-
-                    all_changes.append({
-                        "main_lob": main_lob,
-                        "state": state,
-                        "case_type": case_type,
-                        "case_id": case_id,
-                        "field_name": field_path,
-                        "old_value": old_value,
-                        "new_value": new_value,
-                        "delta": delta,
-                        "month_label": None  # No month context
-                    })
+            _append_record_changes(i, record, append_change)
 
     except KeyError as e:
         logger.error(f"Missing required key in modified_records: {e}", exc_info=True)
@@ -635,80 +720,86 @@ def calculate_summary_data(
     if not isinstance(months_dict, dict):
         raise ValueError("months_dict must be a dict")
 
-    if not month or not isinstance(month, str):
-        raise ValueError(f"Invalid month parameter: {month}")
+    _validate_summary_params(month, year)
 
-    if not year or not isinstance(year, int):
-        raise ValueError(f"Invalid year parameter: {year}")
+    month_labels, month_totals = _init_month_totals(months_dict)
 
+    # Aggregate across all modified records
     try:
-        # Initialize aggregates per month
-        month_totals = {}
-        for month_label in get_ordered_month_labels(months_dict):
-            month_totals[month_label] = {
-                "total_forecast": {"old": 0, "new": 0},
-                "total_fte_required": {"old": 0, "new": 0},
-                "total_fte_available": {"old": 0, "new": 0},
-                "total_capacity": {"old": 0, "new": 0}
-            }
+        for i, record in enumerate(modified_records):
+            _add_record_totals(i, record, month_labels, month_totals)
 
+    except ValueError as e:
+        logger.error(f"Validation error in calculate_summary_data: {e}", exc_info=True)
+        raise
     except Exception as e:
-        logger.error(f"Error initializing month totals: {e}", exc_info=True)
-        raise ValueError(f"Failed to initialize summary data: {e}")
+        logger.error(f"Error aggregating summary data: {e}", exc_info=True)
+        raise
 
-    # Aggregate across all modified records
-    try:
-        for i, record in enumerate(modified_records):
-            if not isinstance(record, dict):
-                raise ValueError(f"Record at index {i} is not a dict")
+    return {
+        "report_month": month,
+        "report_year": year,
+        "months": month_labels,
+        "totals": month_totals
+    }
+
+
+def extract_changes_and_summary(
+    modified_records: List[Dict],
+    months_dict: Dict[str, str],
+    month: str,
+    year: int
+) -> Tuple[List[Dict], Dict]:
+    """
+    Extract field-level changes and calculate summary data in one pass.
 
-            for month_label in get_ordered_month_labels(months_dict):
-                if month_label not in month_totals:
-                    logger.warning(f"Month label '{month_label}' not in month_totals, skipping")
-                    continue
+    Equivalent to calling extract_specific_changes() and calculate_summary_data()
+    on the same records, but walks modified_records only once.
 
-                month_data = record.get(month_label, {})
+    Args:
+        modified_records: List of records from preview/update request
+        months_dict: Month index mapping (e.g., {"month1": "Jun-25"})
+        month: Report month
+        year: Report year
 
-                if month_data:
-                    if not isinstance(month_data, dict):
-                        raise ValueError(
-                            f"Record at index {i}: month_data for '{month_label}' is not a dict"
-                        )
+    Returns:
+        Tuple of (changes, summary_data)
+
+    Raises:
+        ValueError: If input parameters or records are invalid
+    """
+    # Input validation
+    if not isinstance(modified_records, list):
+        raise ValueError("modified_records must be a list")
 
-                    # Forecast (no change expected in most cases)
-                    forecast = month_data.get("forecast", 0)
-                    forecast_change = month_data.get("forecast_change", 0)
-                    month_totals[month_label]["total_forecast"]["new"] += forecast
-                    month_totals[month_label]["total_forecast"]["old"] += (forecast - forecast_change)
-
-                    # FTE Required
-                    fte_req = month_data.get("fte_req", 0)
-                    fte_req_change = month_data.get("fte_req_change", 0)
-                    month_totals[month_label]["total_fte_required"]["new"] += fte_req
-                    month_totals[month_label]["total_fte_required"]["old"] += (fte_req - fte_req_change)
-
-                    # FTE Available
-                    fte_avail = month_data.get("fte_avail", 0)
-                    fte_avail_change = month_data.get("fte_avail_change", 0)
-                    month_totals[month_label]["total_fte_available"]["new"] += fte_avail
-                    month_totals[month_label]["total_fte_available"]["old"] += (fte_avail - fte_avail_change)
-
-                    # Capacity
-                    capacity = month_data.get("capacity", 0)
-                    capacity_change = month_data.get("capacity_change", 0)
-                    month_totals[month_label]["total_capacity"]["new"] += capacity
-                    month_totals[month_label]["total_capacity"]["old"] += (capacity - capacity_change)
+    if not isinstance(months_dict, dict):
+        raise ValueError("months_dict must be a dict")
+
+    _validate_summary_params(month, year)
+
+    month_labels, month_totals = _init_month_totals(months_dict)
+    all_changes = []
+    append_change = all_changes.append
+
+    try:
+        for i, record in enumerate(modified_records):
+            _append_record_changes(i, record, append_change)
+            _add_record_totals(i, record, month_labels, month_totals)
 
+    except KeyError as e:
+        logger.error(f"Missing required key in modified_records: {e}", exc_info=True)
+        raise ValueError(f"Invalid record structure: {e}")
     except ValueError as e:
-        logger.error(f"Validation error in calculate_summary_data: {e}", exc_info=True)
+        logger.error(f"Validation error in extract_changes_and_summary: {e}", exc_info=True)
         raise
     except Exception as e:
-        logger.error(f"Error aggregating summary data: {e}", exc_info=True)
+        logger.error(f"Unexpected error in extract_changes_and_summary: {e}", exc_info=True)
         raise
 
-    return {
+    summary_data = {
         "report_month": month,
         "report_year": year,
-        "months": get_ordered_month_labels(months_dict),
+        "months": month_labels,
         "totals": month_totals
     }
+    return all_changes, summary_data
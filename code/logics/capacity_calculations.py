@@ -9,6 +9,8 @@ import math
 import logging
 from typing import Dict
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -194,6 +196,103 @@ def calculate_capacity(
         raise ValueError(f"Capacity calculation failed: {e}")
 
 
+def validate_config_arrays(
+    working_days: np.ndarray,
+    work_hours: np.ndarray,
+    shrinkage: np.ndarray
+) -> None:
+    """Array counterpart of the config checks in calculate_fte_required/calculate_capacity."""
+    if np.any(working_days <= 0):
+        raise ValueError(f"working_days must be positive: {working_days[working_days <= 0][0]}")
+
+    if np.any(work_hours <= 0):
+        raise ValueError(f"work_hours must be positive: {work_hours[work_hours <= 0][0]}")
+
+    bad_shrinkage = (shrinkage < 0.0) | (shrinkage >= 1.0)
+    if np.any(bad_shrinkage):
+        raise ValueError(f"shrinkage must be between 0.0 and 1.0: {shrinkage[bad_shrinkage][0]}")
+
+
+def calculate_fte_required_array(
+    forecast: np.ndarray,
+    working_days: np.ndarray,
+    work_hours: np.ndarray,
+    shrinkage: np.ndarray,
+    target_cph: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized calculate_fte_required over broadcastable float arrays.
+
+    Evaluates the same formula in the same operation order as the scalar
+    version, so results match it element for element.
+
+    Args:
+        forecast: Client forecast values (>= 0)
+        working_days: Working days per element
+        work_hours: Work hours per element
+        shrinkage: Shrinkage per element (0.0-1.0)
+        target_cph: Target CPH per element (>= 0, 0 yields 0)
+
+    Returns:
+        Integer array of FTE Required (ceiling), 0 where forecast or target_cph is 0
+
+    Raises:
+        ValueError: If any input is invalid
+    """
+    if np.any(forecast < 0):
+        raise ValueError(f"forecast cannot be negative: {forecast[forecast < 0][0]}")
+
+    if np.any(target_cph < 0):
+        raise ValueError(f"target_cph cannot be negative: {target_cph[target_cph < 0][0]}")
+
+    validate_config_arrays(working_days, work_hours, shrinkage)
+
+    denominator = working_days * work_hours * (1 - shrinkage) * target_cph
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fte_required = np.ceil(forecast / denominator)
+
+    zero = (forecast == 0) | (target_cph == 0)
+    return np.where(zero, 0, fte_required).astype(np.int64)
+
+
+def calculate_capacity_array(
+    fte_avail: np.ndarray,
+    working_days: np.ndarray,
+    work_hours: np.ndarray,
+    shrinkage: np.ndarray,
+    target_cph: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized calculate_capacity over broadcastable float arrays.
+
+    Evaluates the same formula in the same operation order as the scalar
+    version, so results match it element for element.
+
+    Args:
+        fte_avail: FTE Available values (>= 0)
+        working_days: Working days per element
+        work_hours: Work hours per element
+        shrinkage: Shrinkage per element (0.0-1.0)
+        target_cph: Target CPH per element (>= 0, 0 yields 0.0)
+
+    Returns:
+        Float array of Capacity, floored to integer values
+
+    Raises:
+        ValueError: If any input is invalid
+    """
+    if np.any(fte_avail < 0):
+        raise ValueError(f"fte_avail cannot be negative: {fte_avail[fte_avail < 0][0]}")
+
+    if np.any(target_cph < 0):
+        raise ValueError(f"target_cph cannot be negative: {target_cph[target_cph < 0][0]}")
+
+    validate_config_arrays(working_days, work_hours, shrinkage)
+
+    capacity = fte_avail * working_days * work_hours * (1 - shrinkage) * target_cph
+    return np.floor(capacity)
+
+
 def validate_month_config(config: Dict) -> None:
     """
     Validate month configuration structure and values.
@@ -7,13 +7,16 @@ for Target CPH modifications.
 
 import logging
 import uuid
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List, Tuple
 from code.logics.db import ForecastModel
 from code.logics.core_utils import CoreUtils
 from code.logics.edit_view_utils import (
     get_months_dict,
     parse_month_label,
-    get_forecast_column_name
+    get_forecast_column_name,
+    get_month_column_specs
 )
 from code.logics.capacity_calculations import calculate_fte_required, calculate_capacity
 from code.logics.bench_allocation_transformer import (
@@ -124,11 +127,20 @@ def get_month_config_for_forecast(
         # }
     """
     from code.logics.db import MonthConfigurationModel
+    from code.cache import forecast_month_config_cache, generate_forecast_month_config_cache_key
 
     # Validate work_type
     if work_type not in ["Domestic", "Global"]:
         raise ValueError(f"Invalid work_type: '{work_type}'. Must be 'Domestic' or 'Global'")
 
+    # Check cache first (copies, so callers can't mutate the cached configs)
+    cache_key = generate_forecast_month_config_cache_key(month, year, work_type)
+    cached_result = forecast_month_config_cache.get(cache_key)
+
+    if cached_result is not None:
+        logger.debug(f"[Cache HIT] Forecast month config for {month} {year} ({work_type})")
+        return {month_idx: dict(config) for month_idx, config in cached_result.items()}
+
     months_dict = get_months_dict(month, year, core_utils)
     month_config = {}
 
@@ -139,17 +151,25 @@ def get_month_config_for_forecast(
         select_columns=None
     )
 
-    with db_manager.SessionLocal() as session:
-        for month_idx, month_label in months_dict.items():
-            # Parse month label "Jun-25" → ("June", 2025)
-            full_month, full_year = parse_month_label(month_label)
+    # Parse month labels "Jun-25" → ("June", 2025)
+    month_periods = {
+        month_idx: parse_month_label(month_label)
+        for month_idx, month_label in months_dict.items()
+    }
 
-            # Query month config for specific WorkType
-            config_record = session.query(MonthConfigurationModel).filter(
-                MonthConfigurationModel.Month == full_month,
-                MonthConfigurationModel.Year == full_year,
-                MonthConfigurationModel.WorkType == work_type
-            ).first()
+    with db_manager.SessionLocal() as session:
+        # Query month configs for all 6 months of this WorkType at once;
+        # the IN filters are a superset, matched exactly per month below
+        config_records = {}
+        for config_record in session.query(MonthConfigurationModel).filter(
+            MonthConfigurationModel.Month.in_({m for m, _ in month_periods.values()}),
+            MonthConfigurationModel.Year.in_({y for _, y in month_periods.values()}),
+            MonthConfigurationModel.WorkType == work_type
+        ).order_by(MonthConfigurationModel.id).all():
+            config_records.setdefault((config_record.Month, config_record.Year), config_record)
+
+        for month_idx, (full_month, full_year) in month_periods.items():
+            config_record = config_records.get((full_month, full_year))
 
             if not config_record:
                 logger.warning(
@@ -177,9 +197,13 @@ def get_month_config_for_forecast(
                     f"S={config_record.Shrinkage}, O={config_record.Occupancy}"
                 )
 
+    # Cache the result
+    forecast_month_config_cache.set(cache_key, {month_idx: dict(config) for month_idx, config in month_config.items()})
+
     return month_config
 
 
+@lru_cache(maxsize=4096)
 def _get_work_type_from_main_lob(main_lob: str, case_type: str = None) -> str:
     """
     Extract work type (Domestic/Global) from Main LOB and/or case_type string.
@@ -196,6 +220,9 @@ def _get_work_type_from_main_lob(main_lob: str, case_type: str = None) -> str:
 
     Returns:
         "Domestic" if domestic found in locality or case_type (for OIC), otherwise "Global"
+
+    Pure function of its arguments; cached because a handful of distinct
+    LOBs repeat across every record of a preview/update.
     """
     from code.logics.manager_view import parse_main_lob
 
@@ -274,6 +301,21 @@ def calculate_cph_preview(
     # Get month mappings
     months_dict = get_months_dict(month, year, core_utils)
 
+    # (lazy import to avoid circular dependency with ramp_calculator)
+    from code.logics.ramp_calculator import (
+        get_ramp_contribution_for_month, _month_label_to_key
+    )
+
+    # Per-month (month_idx, month_label, ramp month key), and one getter that
+    # reads all 24 month columns of a row as a flat tuple of
+    # (forecast, fte_req, fte_avail, capacity) per month
+    col_specs = get_month_column_specs(months_dict)
+    months_list = [
+        (month_idx, month_label, _month_label_to_key(month_label))
+        for month_idx, month_label, *_ in col_specs
+    ]
+    get_month_values = attrgetter(*[col for spec in col_specs for col in spec[3:]])
+
     # Cache month configs by work_type to avoid redundant DB calls
     month_config_cache: Dict[str, Dict] = {}
 
@@ -318,31 +360,10 @@ def calculate_cph_preview(
                 month_data = {}
 
                 # Calculate impact for each month
-                for month_idx, month_label in months_dict.items():
-                    suffix = month_idx.replace('month', '')
-
-                    # Use utility function for column name lookup
-                    forecast = getattr(
-                        forecast_row,
-                        get_forecast_column_name('forecast', suffix),
-                        0
-                    )
-                    old_fte_req = getattr(
-                        forecast_row,
-                        get_forecast_column_name('fte_req', suffix),
-                        0
-                    )
-                    fte_avail = getattr(
-                        forecast_row,
-                        get_forecast_column_name('fte_avail', suffix),
-                        0
-                    )
-                    old_capacity = getattr(
-                        forecast_row,
-                        get_forecast_column_name('capacity', suffix),
-                        0
-                    )
-
+                values = get_month_values(forecast_row)
+                for (month_idx, month_label, ramp_month_key), forecast, old_fte_req, fte_avail, old_capacity in zip(
+                    months_list, values[0::4], values[1::4], values[2::4], values[3::4]
+                ):
                     # Recalculate with new CPH using work_type-specific config
                     new_cph = cph_record['modified_target_cph']
                     config = month_config[month_idx]
@@ -351,11 +372,6 @@ def calculate_cph_preview(
                     new_fte_req = calculate_fte_required(forecast, config, new_cph)
 
                     # Split base FTE from ramp FTE for accurate capacity calculation
-                    # (lazy import to avoid circular dependency with ramp_calculator)
-                    from code.logics.ramp_calculator import (
-                        get_ramp_contribution_for_month, _month_label_to_key
-                    )
-                    ramp_month_key = _month_label_to_key(month_label)
                     ramp_fte, new_ramp_capacity = get_ramp_contribution_for_month(
                         forecast_id=forecast_row.id,
                         month_key=ramp_month_key,
@@ -369,8 +385,9 @@ def calculate_cph_preview(
                     fte_req_change = new_fte_req - old_fte_req
                     capacity_change = new_capacity - old_capacity
 
-                    # Create MonthDataResponse for this month
-                    month_data[month_label] = MonthDataResponse(
+                    # Create MonthDataResponse for this month; every value is
+                    # already coerced with int(), so field validation is skipped
+                    month_data[month_label] = MonthDataResponse.model_construct(
                         forecast=int(forecast),
                         fte_req=int(new_fte_req),
                         fte_req_change=int(fte_req_change),
@@ -385,18 +402,14 @@ def calculate_cph_preview(
                     has_changes = (fte_req_change != 0 or capacity_change != 0)
 
                     if has_changes:
-                        # Add ALL fields for this month (complete snapshot of modified record)
-                        fields_to_add = [
+                        # Add ALL fields for this month (complete snapshot of modified record).
+                        # Each month is visited once per row, so fields are unique by construction.
+                        modified_fields.extend((
                             f"{month_label}.forecast",
                             f"{month_label}.fte_req",
                             f"{month_label}.fte_avail",
                             f"{month_label}.capacity"
-                        ]
-
-                        # Only add if not already in list
-                        for field in fields_to_add:
-                            if field not in modified_fields:
-                                modified_fields.append(field)
+                        ))
 
                 # Only include if there are changes (more than just "target_cph")
                 if len(modified_fields) > 1:
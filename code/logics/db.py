@@ -358,6 +358,17 @@ class ForecastModel(SQLModel, table=True):
         Index('idx_forecast_year_month', 'Year', 'Month'),
         Index('idx_forecast_main_lob', 'Centene_Capacity_Plan_Main_LOB'),
         Index('idx_forecast_case_type', 'Centene_Capacity_Plan_Case_Type'),
+        # Edit view lookups: Month/Year partition, then match on LOB/State/CaseType.
+        # Call_Type_ID is unbounded (VARCHAR(MAX) on MSSQL), so it can only be INCLUDEd.
+        Index(
+            'idx_forecast_lookup',
+            'Month', 'Year',
+            'Centene_Capacity_Plan_Main_LOB',
+            'Centene_Capacity_Plan_State',
+            'Centene_Capacity_Plan_Case_Type',
+            mssql_include=['Centene_Capacity_Plan_Call_Type_ID', 'Centene_Capacity_Plan_Target_CPH'],
+            postgresql_include=['Centene_Capacity_Plan_Call_Type_ID', 'Centene_Capacity_Plan_Target_CPH']
+        ),
     )
 
 class ForecastMonthsModel(SQLModel, table=True):
@@ -463,9 +474,25 @@ class FTEAllocationMappingModel(SQLModel, table=True):
         Index('idx_fte_mapping_query', 'report_month', 'report_year', 'main_lob', 'state', 'case_type'),
         Index('idx_fte_mapping_forecast_month', 'report_month', 'report_year', 'forecast_month_label'),
         Index('idx_fte_mapping_lob_state_case', 'main_lob', 'state', 'case_type'),
+        Index('idx_fte_mapping_clear', 'report_month', 'report_year', 'allocation_type'),
     )
 
 
+# Case-insensitive lookup index for get_fte_mappings(), which matches
+# lower(main_lob/state/case_type) on SQLite and PostgreSQL. Expression indexes
+# are only created there; on MSSQL get_fte_mappings() compares the plain
+# columns instead (the default collation is case-insensitive), so
+# idx_fte_mapping_query serves those lookups.
+Index(
+    'idx_fte_mapping_query_ci',
+    FTEAllocationMappingModel.report_month,
+    FTEAllocationMappingModel.report_year,
+    func.lower(FTEAllocationMappingModel.main_lob),
+    func.lower(FTEAllocationMappingModel.state),
+    func.lower(FTEAllocationMappingModel.case_type),
+).ddl_if(dialect=('sqlite', 'postgresql'))
+
+
 class MonthConfigurationModel(SQLModel, table=True):
     """
     Model for storing month-specific configuration parameters for FTE calculations.
@@ -1558,6 +1585,85 @@ class DBManager:
                 logger.error(f"[DBManager] Error getting distinct values for {column_name}: {e}", exc_info=True)
                 return []
 
+    def get_distinct_values_multi(
+        self,
+        column_names: List[str],
+        month: Optional[str] = None,
+        year: Optional[int] = None
+    ) -> Dict[str, List]:
+        """
+        Get distinct non-null values for several columns in one database round-trip.
+
+        Equivalent to calling get_distinct_values() once per column, but runs a
+        single GROUP BY over all columns (one scan of the month/year partition)
+        and splits the combinations into per-column values in Python.
+        Database-agnostic: works with both SQLite and MSSQL.
+
+        **Internal Caching**: Shares the 5 minute get_distinct_values() cache.
+
+        Args:
+            column_names: Columns to get distinct values from
+            month: Optional month filter (full name like "February")
+            year: Optional year filter
+
+        Returns:
+            Dict of {column_name: sorted list of distinct values (None/empty excluded)}
+
+        Example:
+            >>> db_manager.get_distinct_values_multi(
+                ["Centene_Capacity_Plan_Main_LOB", "Centene_Capacity_Plan_State"],
+                "February",
+                2025
+            )
+            {'Centene_Capacity_Plan_Main_LOB': ['Amisys Medicaid Domestic', ...],
+             'Centene_Capacity_Plan_State': ['CA', 'TX', ...]}
+        """
+        model_name = self.Model.__name__
+        cache_key = (
+            f"distinct:{model_name}:{'+'.join(column_names)}"
+            f":month={month or 'None'}&year={year or 'None'}"
+        )
+
+        # Check cache first
+        cached_result = _distinct_values_cache.get(cache_key)
+        if cached_result is not None:
+            logger.debug(f"[DBManager] Cache hit for get_distinct_values_multi: {cache_key}")
+            return cached_result
+
+        # Cache miss - execute query
+        logger.debug(f"[DBManager] Cache miss for get_distinct_values_multi: {cache_key}")
+
+        with self.SessionLocal() as session:
+            try:
+                columns = [getattr(self.Model, column_name) for column_name in column_names]
+
+                query = session.query(*columns)
+
+                # Apply month/year filter using existing method
+                if month and year:
+                    query = self.filter_by_month_and_year(query, month, year)
+
+                rows = query.group_by(*columns).all()
+
+                # Split distinct combinations into sorted per-column values
+                result = {
+                    column_name: sorted({row[i] for row in rows if row[i]})
+                    for i, column_name in enumerate(column_names)
+                }
+
+                # Cache the result before returning
+                _distinct_values_cache.set(cache_key, result)
+                logger.debug(f"[DBManager] Cached result for: {cache_key} ({len(rows)} combinations)")
+
+                return result
+
+            except AttributeError as e:
+                logger.error(f"[DBManager] Column does not exist on {self.Model.__name__}: {e}")
+                return {column_name: [] for column_name in column_names}
+            except Exception as e:
+                logger.error(f"[DBManager] Error getting distinct values for {column_names}: {e}", exc_info=True)
+                return {column_name: [] for column_name in column_names}
+
     def update_records(self, df:pd.DataFrame, month:str, year:int, keys:List[str]=None, updated_by='system'):
         """
         Updates existing forecast records in DB for the given month/year
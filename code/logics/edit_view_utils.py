@@ -6,7 +6,10 @@ and other common operations to eliminate code duplication across modules.
 """
 
 import logging
-from typing import Dict, List, Optional
+import re
+from calendar import month_name as cal_month_name, month_abbr as cal_month_abbr
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 from code.logics.db import ForecastModel
 from code.logics.core_utils import CoreUtils
 
@@ -36,7 +39,6 @@ def get_months_dict(month: str, year: int, core_utils: CoreUtils) -> Dict[str, s
         ValueError: If month mappings not found in database
     """
     from code.cache import month_mappings_cache, generate_month_mappings_cache_key
-    from calendar import month_name as cal_month_name, month_abbr as cal_month_abbr
     from code.logics.month_code_utils import is_month_year_code, parse_month_year_code
 
     # Check cache first
@@ -133,8 +135,6 @@ def extract_month_suffix_from_index(month_index: str) -> str:
         extract_month_suffix_from_index("month1") -> "1"
         extract_month_suffix_from_index("month6") -> "6"
     """
-    import re
-
     if not month_index or not isinstance(month_index, str):
         raise ValueError(f"Invalid month_index: must be a non-empty string, got {type(month_index)}")
 
@@ -217,6 +217,40 @@ def get_forecast_column_name(api_field: str, month_suffix: str) -> Optional[str]
     return field_patterns.get(api_field)
 
 
+def get_month_column_specs(months_dict: Dict[str, str]) -> List[Tuple[str, str, str, str, str, str, str]]:
+    """
+    Precompute ForecastModel column names for each month in months_dict.
+
+    Intended to be called once per request, outside per-record loops, so that
+    column names are not rebuilt for every record.
+
+    Args:
+        months_dict: Month index mapping ({"month1": "Jun-25", ...})
+
+    Returns:
+        List of (month_idx, month_label, suffix, forecast_col, fte_req_col,
+        fte_avail_col, capacity_col) tuples in months_dict order
+
+    Example:
+        get_month_column_specs({"month1": "Jun-25"}) ->
+        [("month1", "Jun-25", "1", "Client_Forecast_Month1", "FTE_Required_Month1",
+          "FTE_Avail_Month1", "Capacity_Month1")]
+    """
+    specs = []
+    for month_idx, month_label in months_dict.items():
+        suffix = extract_month_suffix_from_index(month_idx)
+        specs.append((
+            month_idx,
+            month_label,
+            suffix,
+            get_forecast_column_name('forecast', suffix),
+            get_forecast_column_name('fte_req', suffix),
+            get_forecast_column_name('fte_avail', suffix),
+            get_forecast_column_name('capacity', suffix)
+        ))
+    return specs
+
+
 def validate_month_label_format(month_label: str) -> None:
     """
     Validate that month label matches expected format: MMM-YY.
@@ -232,9 +266,6 @@ def validate_month_label_format(month_label: str) -> None:
         - Hyphen separator
         - 2-digit year (24, 25, 26, etc.)
     """
-    import re
-    from calendar import month_abbr as cal_month_abbr
-
     if not month_label or not isinstance(month_label, str):
         raise ValueError(f"Invalid month label: must be a non-empty string, got {type(month_label)}")
 
@@ -349,7 +380,6 @@ def validate_months_dict(months_dict: Dict[str, str]) -> bool:
         return False
 
     # Validate format: "Mon-YY"
-    import re
     pattern = r'^[A-Z][a-z]{2}-\d{2}$'
     return all(re.match(pattern, months_dict[key]) for key in required_keys)
 
@@ -373,7 +403,6 @@ def validate_field_path(field_path: str) -> bool:
 
     # If has month label, validate format
     if month_label:
-        import re
         pattern = r'^[A-Z][a-z]{2}-\d{2}$'
         return bool(re.match(pattern, month_label))
 
@@ -435,6 +464,68 @@ def format_record_identifier(main_lob: str, state: str, case_type: str, case_id:
 
 # ============ Change Calculation Utilities ============
 
+# Keys per IN-filter chunk: 300 keys x up to 4 key columns stays well under
+# the MSSQL limit of 2100 bind parameters per statement
+FORECAST_KEY_CHUNK_SIZE = 300
+FORECAST_KEY_YIELD_PER = 500
+
+
+def load_forecast_records_by_keys(
+    session,
+    month: str,
+    year: int,
+    key_columns: List,
+    keys: List[tuple],
+    options: tuple = ()
+) -> List[ForecastModel]:
+    """
+    Load ForecastModel rows for a report month/year matching the given keys.
+
+    Filters with one IN clause per key column (database-agnostic; MSSQL has no
+    row-value IN), in chunks of FORECAST_KEY_CHUNK_SIZE keys. Each chunk's
+    filter is a superset of its keys; rows are streamed and only those whose
+    key is one of the requested keys are kept, so memory stays proportional
+    to the requested keys rather than the superset.
+
+    Args:
+        session: Open SQLAlchemy session
+        month: Report month name (e.g., "April")
+        year: Report year (e.g., 2025)
+        key_columns: ForecastModel columns making up the key, e.g.
+            [ForecastModel.Centene_Capacity_Plan_Main_LOB, ...]
+        keys: Key tuples, values in key_columns order
+        options: Optional query options (e.g., load_only)
+
+    Returns:
+        Rows matching one of the keys exactly, ordered by id ascending, each
+        row at most once
+    """
+    keys = list(dict.fromkeys(keys))
+    get_key = attrgetter(*[column.key for column in key_columns])
+    # attrgetter returns a tuple for several names but the bare value for one
+    wanted = set(keys) if len(key_columns) > 1 else {key[0] for key in keys}
+    rows_by_id = {}
+
+    for start in range(0, len(keys), FORECAST_KEY_CHUNK_SIZE):
+        chunk = keys[start:start + FORECAST_KEY_CHUNK_SIZE]
+        key_filters = [
+            column.in_({key[i] for key in chunk})
+            for i, column in enumerate(key_columns)
+        ]
+        query = session.query(ForecastModel)
+        if options:
+            query = query.options(*options)
+        for row in query.filter(
+            ForecastModel.Month == month,
+            ForecastModel.Year == year,
+            *key_filters
+        ).yield_per(FORECAST_KEY_YIELD_PER):
+            if get_key(row) in wanted:
+                rows_by_id[row.id] = row
+
+    return [rows_by_id[row_id] for row_id in sorted(rows_by_id)]
+
+
 def calculate_delta(new_value: float, old_value: float) -> float:
     """
     Calculate delta between new and old values.
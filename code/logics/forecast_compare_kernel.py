@@ -0,0 +1,99 @@
+"""
+Compiled change-classification kernel for forecast upload history.
+
+Computes per-field deltas and the modified-field mask for before/after
+snapshot blocks in a single native loop when numba is installed; otherwise
+falls back to whole-array NumPy operations. Both paths produce identical
+results.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def _classify_loop(new_arr, old_arr, is_update, fields_per_month, out_delta, out_changed, out_has_change):
+    """
+    Row-wise delta / changed-field classification over 2-D float64 arrays.
+
+    Column 0 is Target_CPH; the remaining columns are groups of
+    fields_per_month per month. Rows are independent, so the loop is split
+    across threads when compiled.
+    """
+    n_cols = new_arr.shape[1]
+    for i in prange(new_arr.shape[0]):
+        row_change = False
+        for j in range(n_cols):
+            delta = new_arr[i, j] - old_arr[i, j]
+            out_delta[i, j] = delta
+            out_changed[i, j] = delta != 0
+            if delta != 0:
+                row_change = True
+        out_has_change[i] = row_change
+
+        if is_update[i]:
+            for start in range(1, n_cols, fields_per_month):
+                month_change = False
+                for j in range(start, start + fields_per_month):
+                    if out_changed[i, j]:
+                        month_change = True
+                for j in range(start, start + fields_per_month):
+                    out_changed[i, j] = month_change
+
+
+if NUMBA_AVAILABLE:
+    _classify_loop = njit(cache=True, parallel=True)(_classify_loop)
+
+
+def classify_snapshot_changes(
+    new_arr: np.ndarray,
+    old_arr: np.ndarray,
+    is_update: np.ndarray,
+    fields_per_month: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute deltas and the modified-field mask for compared snapshot records.
+
+    A field is changed when its delta is non-zero. For update rows (record in
+    both snapshots) every field of a month is flagged when any field of that
+    month changed.
+
+    Args:
+        new_arr: New values, shape (N, 1 + fields_per_month * n_months), NaN-free
+        old_arr: Old values, same shape, NaN-free
+        is_update: Boolean mask of shape (N,) selecting update rows
+        fields_per_month: Number of metric columns per month
+
+    Returns:
+        Tuple of (delta float64 (N, C), changed bool (N, C), has_change bool (N,))
+    """
+    is_update = np.asarray(is_update, dtype=bool)
+
+    if not NUMBA_AVAILABLE:
+        delta = new_arr - old_arr
+        changed = delta != 0
+        has_change = changed.any(axis=1)
+        month_changed = changed[:, 1:].reshape(len(changed), -1, fields_per_month).any(axis=2)
+        changed[is_update, 1:] = np.repeat(month_changed[is_update], fields_per_month, axis=1)
+        return delta, changed, has_change
+
+    out_delta = np.empty(new_arr.shape, dtype=np.float64)
+    out_changed = np.empty(new_arr.shape, dtype=np.bool_)
+    out_has_change = np.empty(new_arr.shape[0], dtype=np.bool_)
+    _classify_loop(
+        np.ascontiguousarray(new_arr, dtype=np.float64),
+        np.ascontiguousarray(old_arr, dtype=np.float64),
+        is_update,
+        fields_per_month,
+        out_delta,
+        out_changed,
+        out_has_change,
+    )
+    return out_delta, out_changed, out_has_change
@@ -6,15 +6,23 @@ Forecast Reallocation feature (Edit View Sections 10-13).
 """
 
 import logging
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
 from fastapi import HTTPException
+from sqlalchemy import Row, select
+from sqlalchemy.orm import load_only
 from code.logics.db import ForecastModel
 from code.logics.core_utils import CoreUtils
 from code.logics.edit_view_utils import (
     get_months_dict,
-    get_forecast_column_name
+    get_month_column_specs,
+    load_forecast_records_by_keys
 )
-from code.logics.capacity_calculations import calculate_fte_required, calculate_capacity
+from code.logics.reallocation_kernel import compute_fte_req_and_capacity
 from code.logics.ramp_calculator import get_ramp_contribution_for_month, _month_label_to_key
 from code.logics.cph_update_transformer import (
     get_month_config_for_forecast,
@@ -29,6 +37,14 @@ from code.logics.bench_allocation_transformer import (
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip when streaming reallocation data
+REALLOCATION_YIELD_PER = 1000
+
+# Previews with at least this many matched records prepare them on a thread pool
+PREVIEW_PARALLEL_MIN_RECORDS = 50
+# Bounded so concurrent ramp lookups stay within the engine's default connection pool
+PREVIEW_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
 
 def get_reallocation_filters(
     month: str,
@@ -60,22 +76,20 @@ def get_reallocation_filters(
         select_columns=None
     )
 
-    # Get distinct values from database
-    main_lobs = db_manager.get_distinct_values(
-        "Centene_Capacity_Plan_Main_LOB",
-        month=month,
-        year=year
-    )
-    states = db_manager.get_distinct_values(
-        "Centene_Capacity_Plan_State",
-        month=month,
-        year=year
-    )
-    case_types = db_manager.get_distinct_values(
-        "Centene_Capacity_Plan_Case_Type",
+    # One grouped query (cached) for all three filter columns instead of a
+    # SELECT DISTINCT round-trip per column
+    distinct_values = db_manager.get_distinct_values_multi(
+        [
+            "Centene_Capacity_Plan_Main_LOB",
+            "Centene_Capacity_Plan_State",
+            "Centene_Capacity_Plan_Case_Type"
+        ],
         month=month,
         year=year
     )
+    main_lobs = distinct_values["Centene_Capacity_Plan_Main_LOB"]
+    states = distinct_values["Centene_Capacity_Plan_State"]
+    case_types = distinct_values["Centene_Capacity_Plan_Case_Type"]
 
     if not main_lobs and not states and not case_types:
         raise ValueError(f"No forecast data found for {month} {year}")
@@ -92,6 +106,88 @@ def get_reallocation_filters(
     }
 
 
+def _reallocation_columns(col_specs: List[Tuple[str, str, str, str, str, str, str]]) -> List:
+    """
+    ForecastModel columns read by the reallocation data/preview paths.
+
+    Covers the business key, Call_Type_ID, Target_CPH and the forecast/fte_req/
+    fte_avail/capacity columns of each month in col_specs.
+    """
+    columns = [
+        ForecastModel.Centene_Capacity_Plan_Main_LOB,
+        ForecastModel.Centene_Capacity_Plan_State,
+        ForecastModel.Centene_Capacity_Plan_Case_Type,
+        ForecastModel.Centene_Capacity_Plan_Call_Type_ID,
+        ForecastModel.Centene_Capacity_Plan_Target_CPH,
+    ]
+    for _, _, _, forecast_col, fte_req_col, fte_avail_col, capacity_col in col_specs:
+        columns.extend(
+            getattr(ForecastModel, col)
+            for col in (forecast_col, fte_req_col, fte_avail_col, capacity_col)
+        )
+    return columns
+
+
+def _reallocation_load_options(col_specs: List[Tuple[str, str, str, str, str, str, str]]):
+    """load_only() option restricting ForecastModel loads to the reallocation columns."""
+    return load_only(*_reallocation_columns(col_specs))
+
+
+def _month_values_reader(
+    col_specs: List[Tuple[str, str, str, str, str, str, str]]
+) -> Tuple[List[str], attrgetter]:
+    """
+    Build a single attrgetter fetching all month columns of a record in one call.
+
+    Returns:
+        (month_labels, getter) where getter(record) returns a flat tuple of
+        (forecast, fte_req, fte_avail, capacity) repeated per month, in
+        col_specs order
+    """
+    month_labels = []
+    columns = []
+    for _, month_label, _, forecast_col, fte_req_col, fte_avail_col, capacity_col in col_specs:
+        month_labels.append(month_label)
+        columns.extend((forecast_col, fte_req_col, fte_avail_col, capacity_col))
+    return month_labels, attrgetter(*columns)
+
+
+def _month_values(
+    record: Union[ForecastModel, Row],
+    month_reader: Tuple[List[str], attrgetter]
+) -> Dict[str, Dict[str, int]]:
+    """Read {month_label: {forecast, fte_req, fte_avail, capacity}} from a ForecastModel instance or Core row."""
+    month_labels, get_values = month_reader
+    values = iter(get_values(record))
+    # zip(values, values, values, values) consumes the flat tuple 4 at a time
+    return {
+        month_label: {
+            "forecast": int(forecast) if forecast is not None else 0,
+            "fte_req": int(fte_req) if fte_req is not None else 0,
+            "fte_avail": int(fte_avail) if fte_avail is not None else 0,
+            "capacity": int(capacity) if capacity is not None else 0
+        }
+        for month_label, (forecast, fte_req, fte_avail, capacity) in zip(
+            month_labels, zip(values, values, values, values)
+        )
+    }
+
+
+def _to_reallocation_record(
+    record: Union[ForecastModel, Row],
+    month_reader: Tuple[List[str], attrgetter]
+) -> Dict:
+    """Transform a ForecastModel instance or Core row to the reallocation API record format."""
+    return {
+        "case_id": record.Centene_Capacity_Plan_Call_Type_ID,
+        "main_lob": record.Centene_Capacity_Plan_Main_LOB,
+        "state": record.Centene_Capacity_Plan_State,
+        "case_type": record.Centene_Capacity_Plan_Case_Type,
+        "target_cph": float(record.Centene_Capacity_Plan_Target_CPH or 0),
+        "months": _month_values(record, month_reader)
+    }
+
+
 def get_reallocation_data(
     month: str,
     year: int,
@@ -127,90 +223,110 @@ def get_reallocation_data(
         select_columns=None
     )
 
+    # Resolve column names once for all records
+    col_specs = get_month_column_specs(months_dict)
+
     with db_manager.SessionLocal() as session:
-        # Build query with optional filters
-        query = session.query(ForecastModel).filter(
+        # Core select of only the columns used below: rows come back as plain
+        # Row tuples (attribute access by column name), with no ORM identity
+        # map or instrumentation per row
+        stmt = select(*_reallocation_columns(col_specs)).where(
             ForecastModel.Month == month,
             ForecastModel.Year == year
         )
 
         # Apply optional filters
         if main_lobs:
-            query = query.filter(ForecastModel.Centene_Capacity_Plan_Main_LOB.in_(main_lobs))
+            stmt = stmt.where(ForecastModel.Centene_Capacity_Plan_Main_LOB.in_(main_lobs))
         if states:
-            query = query.filter(ForecastModel.Centene_Capacity_Plan_State.in_(states))
+            stmt = stmt.where(ForecastModel.Centene_Capacity_Plan_State.in_(states))
         if case_types:
-            query = query.filter(ForecastModel.Centene_Capacity_Plan_Case_Type.in_(case_types))
-
-        records = query.order_by(ForecastModel.id.asc()).all()
+            stmt = stmt.where(ForecastModel.Centene_Capacity_Plan_Case_Type.in_(case_types))
 
+        # Stream rows in batches and transform each as it arrives.
         # Dedupe by business key (Main_LOB, State, Case_Type) in case duplicate
         # rows exist for the same month/year; keep the highest-id (latest) row.
+        # yield_per as an execution option (not only on the Result) also sets
+        # stream_results, so the driver uses a server-side cursor where
+        # supported instead of buffering the whole month client-side
+        rows = session.execute(
+            stmt.order_by(ForecastModel.id.asc())
+            .execution_options(yield_per=REALLOCATION_YIELD_PER)
+        )
+        month_reader = _month_values_reader(col_specs)
         deduped = {}
-        for r in records:
+        for record in rows:
             key = (
-                r.Centene_Capacity_Plan_Main_LOB,
-                r.Centene_Capacity_Plan_State,
-                r.Centene_Capacity_Plan_Case_Type,
+                record.Centene_Capacity_Plan_Main_LOB,
+                record.Centene_Capacity_Plan_State,
+                record.Centene_Capacity_Plan_Case_Type,
             )
-            deduped[key] = r
-        records = list(deduped.values())
+            deduped[key] = _to_reallocation_record(record, month_reader)
+        data_records = list(deduped.values())
 
-        if not records:
+        if not data_records:
             raise ValueError(f"No forecast data found for {month} {year}")
 
-        # Transform to API format
-        data_records = []
-        for record in records:
-            # Build month data
-            month_data = {}
-            for month_idx, month_label in months_dict.items():
-                suffix = month_idx.replace('month', '')
-
-                forecast = getattr(
-                    record,
-                    get_forecast_column_name('forecast', suffix),
-                    0
-                ) or 0
-                fte_req = getattr(
-                    record,
-                    get_forecast_column_name('fte_req', suffix),
-                    0
-                ) or 0
-                fte_avail = getattr(
-                    record,
-                    get_forecast_column_name('fte_avail', suffix),
-                    0
-                ) or 0
-                capacity = getattr(
-                    record,
-                    get_forecast_column_name('capacity', suffix),
-                    0
-                ) or 0
-
-                month_data[month_label] = {
-                    "forecast": int(forecast),
-                    "fte_req": int(fte_req),
-                    "fte_avail": int(fte_avail),
-                    "capacity": int(capacity)
-                }
-
-            data_record = {
-                "case_id": record.Centene_Capacity_Plan_Call_Type_ID,
-                "main_lob": record.Centene_Capacity_Plan_Main_LOB,
-                "state": record.Centene_Capacity_Plan_State,
-                "case_type": record.Centene_Capacity_Plan_Case_Type,
-                "target_cph": float(record.Centene_Capacity_Plan_Target_CPH or 0),
-                "months": month_data
-            }
-            data_records.append(data_record)
-
         total = len(data_records)
         logger.info(f"Retrieved {total} reallocation records for {month} {year}")
 
         return months_dict, data_records, total
 
 
+def _as_dict(value) -> Dict:
+    """Return value as a plain dict (pydantic models and plain objects are converted)."""
+    if isinstance(value, dict):
+        return value
+    if hasattr(value, 'model_dump'):
+        return value.model_dump()
+    return dict(vars(value))
+
+
+def _parse_preview_inputs(modified_records: List, month_labels: List[str]) -> List[Tuple]:
+    """
+    Validate and coerce preview input in one pass, before any DB work.
+
+    Records and month payloads may be dicts or pydantic models. Only edited
+    (non-empty) months in month_labels are kept, so the per-month loop needs
+    no type checks or conversions.
+
+    Returns:
+        List of (key, target_cph, target_cph_change, month_inputs) per record, where
+        key is (main_lob, state, case_type) and month_inputs maps month_label to
+        (fte_avail or None when not sent, fte_avail_change)
+
+    Raises:
+        ValueError: If a record is missing main_lob, state or case_type
+    """
+    parsed = []
+    for rec in modified_records:
+        get_input = _as_dict(rec).get
+        key = (get_input('main_lob'), get_input('state'), get_input('case_type'))
+        if not all(key):
+            raise ValueError(f"Record missing required fields: {key}")
+
+        input_months = get_input('months') or {}
+        month_inputs = {}
+        for month_label in month_labels:
+            input_month = input_months.get(month_label)
+            if not input_month:
+                continue
+            input_month = _as_dict(input_month)
+            fte_avail = input_month.get('fte_avail')
+            month_inputs[month_label] = (
+                int(fte_avail) if 'fte_avail' in input_month else None,
+                int(input_month.get('fte_avail_change', 0)),
+            )
+
+        parsed.append((
+            key,
+            get_input('target_cph'),
+            float(get_input('target_cph_change', 0)),
+            month_inputs,
+        ))
+    return parsed
+
+
 def calculate_reallocation_preview(
     month: str,
     year: int,
@@ -228,12 +344,24 @@ def calculate_reallocation_preview(
     5. If target_cph changed, recalculate fte_required for all 6 months
     6. Calculate capacity for all 6 months
     7. Calculate changes by comparing old_data and new_data
+
+    Steps 1-4 run per record; steps 5-7 run across all records at once
+    (fte_req/capacity via reallocation_kernel, changes as NumPy arrays).
     """
     if not modified_records:
         raise ValueError("No records provided for preview")
 
     months_dict = get_months_dict(month, year, core_utils)
     month_labels = list(months_dict.values())  # ['May-25', 'Jun-25', ...]
+    preview_inputs = _parse_preview_inputs(modified_records, month_labels)
+    # (month_idx, month_label, ramp month key) per month, computed once rather
+    # than re-parsing each label for every record
+    months_list = [
+        (month_idx, month_label, _month_label_to_key(month_label))
+        for month_idx, month_label in months_dict.items()
+    ]
+    col_specs = get_month_column_specs(months_dict)
+    month_reader = _month_values_reader(col_specs)
 
     # Cache month configs by work_type
     config_cache: Dict[str, Dict] = {}
@@ -243,62 +371,67 @@ def calculate_reallocation_preview(
             config_cache[work_type] = get_month_config_for_forecast(month, year, core_utils, work_type)
         return config_cache[work_type]
 
-    # Load all DB records for this month/year
+    # Load only the DB records touched by this request
     db_manager = core_utils.get_db_manager(ForecastModel, limit=10000, skip=0, select_columns=None)
     with db_manager.SessionLocal() as session:
-        db_records = session.query(ForecastModel).filter(
-            ForecastModel.Month == month,
-            ForecastModel.Year == year
-        ).order_by(ForecastModel.id.asc()).all()
+        db_records = load_forecast_records_by_keys(
+            session,
+            month,
+            year,
+            [
+                ForecastModel.Centene_Capacity_Plan_Main_LOB,
+                ForecastModel.Centene_Capacity_Plan_State,
+                ForecastModel.Centene_Capacity_Plan_Case_Type,
+            ],
+            [key for key, _, _, _ in preview_inputs],
+            options=(_reallocation_load_options(col_specs),)
+        )
         db_lookup = {
             (r.Centene_Capacity_Plan_Main_LOB, r.Centene_Capacity_Plan_State, r.Centene_Capacity_Plan_Case_Type): r
             for r in db_records
         }
 
-    result_records = []
-    total_fte_change = 0
-    total_capacity_change = 0
+    # Step 1 runs in the calling thread: match DB rows and resolve month
+    # configs (cached per work type; a miss queries the DB)
+    matched = []
+    # Per-record outcomes, logged once as a summary after the loop
+    missing_keys = []
+    work_type_counts = Counter()
 
-    for input_rec in modified_records:
-        # Step 1: Get DB record
-        key = (input_rec.get('main_lob'), input_rec.get('state'), input_rec.get('case_type'))
-        if not all(key):
-            raise ValueError(f"Record missing required fields: {key}")
+    for key, input_target_cph, input_target_cph_change, month_inputs in preview_inputs:
+        main_lob, state, case_type = key
 
+        # Step 1: Get DB record
         db_rec = db_lookup.get(key)
         if not db_rec:
-            logger.warning(f"DB record not found for {key}, skipping")
+            missing_keys.append(key)
             continue
 
-        work_type = _get_work_type_from_main_lob(key[0], key[2])
-        month_config = get_config(work_type)
+        work_type = _get_work_type_from_main_lob(main_lob, case_type)
+        work_type_counts[work_type] += 1
+        matched.append(
+            (db_rec, key, input_target_cph, input_target_cph_change, month_inputs, get_config(work_type))
+        )
+
+    def prepare_record(item: Tuple) -> Tuple:
+        """Steps 2-4 for one matched record; independent of all other records."""
+        db_rec, key, input_target_cph, input_target_cph_change, month_inputs, month_config = item
 
-        # Step 2: Create old_data and new_data structures
+        # Step 2: Create old_data (from DB) and new_data (initialized with old values)
         old_data = {
             'target_cph': float(db_rec.Centene_Capacity_Plan_Target_CPH or 0),
-            'months': {}
+            'months': _month_values(db_rec, month_reader)
         }
         new_data = {
             'target_cph': old_data['target_cph'],  # Start with DB value
-            'months': {}
+            'months': {label: values.copy() for label, values in old_data['months'].items()}
         }
 
-        # Populate old_data months from DB
-        for month_idx, month_label in months_dict.items():
-            suffix = month_idx.replace('month', '')
-            old_data['months'][month_label] = {
-                'forecast': int(getattr(db_rec, get_forecast_column_name('forecast', suffix), 0) or 0),
-                'fte_req': int(getattr(db_rec, get_forecast_column_name('fte_req', suffix), 0) or 0),
-                'fte_avail': int(getattr(db_rec, get_forecast_column_name('fte_avail', suffix), 0) or 0),
-                'capacity': int(getattr(db_rec, get_forecast_column_name('capacity', suffix), 0) or 0),
-            }
-            # Initialize new_data with old values
-            new_data['months'][month_label] = old_data['months'][month_label].copy()
-
         # Step 3: Update target_cph only if change was reported
-        input_target_cph_change = float(input_rec.get('target_cph_change', 0))
         if input_target_cph_change != 0:
-            new_data['target_cph'] = float(input_rec.get('target_cph', old_data['target_cph']))
+            new_data['target_cph'] = float(
+                input_target_cph if input_target_cph is not None else old_data['target_cph']
+            )
             # Validate: new - old should equal reported change
             calc_change = new_data['target_cph'] - old_data['target_cph']
             if abs(calc_change - input_target_cph_change) > 0.001:
@@ -310,15 +443,11 @@ def calculate_reallocation_preview(
         target_cph_changed = (input_target_cph_change != 0)
 
         # Step 4: Update fte_avail for each month from input
-        input_months = input_rec.get('months', {})
-        for month_label in month_labels:
-            input_month = input_months.get(month_label, {})
-            if isinstance(input_month, dict):
-                new_fte_avail = int(input_month.get('fte_avail', old_data['months'][month_label]['fte_avail']))
-                input_fte_change = int(input_month.get('fte_avail_change', 0))
-            else:
-                new_fte_avail = int(getattr(input_month, 'fte_avail', old_data['months'][month_label]['fte_avail']))
-                input_fte_change = int(getattr(input_month, 'fte_avail_change', 0))
+        old_ramp_contribs = []
+        for month_idx, month_label, month_key in months_list:
+            old_fte_avail = old_data['months'][month_label]['fte_avail']
+            input_fte_avail, input_fte_change = month_inputs.get(month_label, (None, 0))
+            new_fte_avail = old_fte_avail if input_fte_avail is None else input_fte_avail
 
             # Validate fte_avail change
             if input_fte_change != 0:
@@ -330,14 +459,14 @@ def calculate_reallocation_preview(
                     )
 
             # Ramp protection: validate FTE reduction doesn't steal ramp headcount
-            ramp_month_key = _month_label_to_key(month_label)
-            ramp_month_idx = next(k for k, v in months_dict.items() if v == month_label)
-            ramp_fte, _ = get_ramp_contribution_for_month(
+            old_ramp_contrib = get_ramp_contribution_for_month(
                 forecast_id=db_rec.id,
-                month_key=ramp_month_key,
+                month_key=month_key,
                 target_cph=old_data['target_cph'],
-                config=month_config[ramp_month_idx],
+                config=month_config[month_idx],
             )
+            old_ramp_contribs.append(old_ramp_contrib)
+            ramp_fte = old_ramp_contrib[0]
             if ramp_fte > 0:
                 base_fte_before = old_data['months'][month_label]['fte_avail'] - ramp_fte
                 reduction = old_data['months'][month_label]['fte_avail'] - new_fte_avail
@@ -362,111 +491,222 @@ def calculate_reallocation_preview(
 
             new_data['months'][month_label]['fte_avail'] = new_fte_avail
 
-        # Step 5: If target_cph changed, recalculate fte_required for all 6 months
+        # Ramp contribution per month for the capacity split, using the
+        # effective target_cph. When target_cph is unchanged this is exactly
+        # what the ramp protection check above already fetched. When it
+        # changed, months with no ramp contribution at a positive old CPH
+        # (every term is non-negative, so no ramp headcount) stay at zero for
+        # any CPH and are not re-queried.
         if target_cph_changed:
-            for month_idx, month_label in months_dict.items():
-                config = month_config[month_idx]
-                forecast = old_data['months'][month_label]['forecast']
-                new_data['months'][month_label]['fte_req'] = calculate_fte_required(
-                    forecast, config, new_data['target_cph']
+            reuse_zero = old_data['target_cph'] > 0
+            ramp_contribs = [
+                old_contrib
+                if reuse_zero and old_contrib == (0, 0.0)
+                else get_ramp_contribution_for_month(
+                    forecast_id=db_rec.id,
+                    month_key=month_key,
+                    target_cph=new_data['target_cph'],
+                    config=month_config[month_idx],
                 )
+                for (month_idx, _, month_key), old_contrib in zip(months_list, old_ramp_contribs)
+            ]
+        else:
+            ramp_contribs = old_ramp_contribs
+
+        return (db_rec, key, old_data, new_data, target_cph_changed, month_config, ramp_contribs)
+
+    # Steps 2-4 per record; steps 5-6 run vectorized over all pending records.
+    # Each record does up to 12 ramp lookups (one DB round-trip each), so large
+    # previews overlap them on a bounded thread pool. map() keeps input order
+    # and re-raises the first failing record's error, as the serial loop did.
+    if len(matched) >= PREVIEW_PARALLEL_MIN_RECORDS:
+        with ThreadPoolExecutor(max_workers=PREVIEW_MAX_WORKERS) as executor:
+            pending = list(executor.map(prepare_record, matched))
+    else:
+        pending = [prepare_record(item) for item in matched]
+
+    if missing_keys:
+        logger.warning(
+            f"{len(missing_keys)} DB record(s) not found for {month} {year}, skipping: "
+            f"{missing_keys[:10]}{' ...' if len(missing_keys) > 10 else ''}"
+        )
+    logger.info(
+        f"Reallocation preview for {month} {year}: {len(pending)} record(s) by work type "
+        f"{dict(work_type_counts)}"
+    )
 
-        # Step 6: Calculate capacity for all 6 months
-        # Using correct target_cph (DB value if unchanged) ensures consistent results
-        logger.info(f"[Capacity Calc] Record: {key}, target_cph_changed={target_cph_changed}")
-        logger.info(f"[Capacity Calc] old_target_cph={old_data['target_cph']}, new_target_cph={new_data['target_cph']}")
+    if not pending:
+        return _build_preview_response(month, year, months_dict, [], 0, 0)
 
-        for month_idx, month_label in months_dict.items():
-            config = month_config[month_idx]
-            fte_avail = new_data['months'][month_label]['fte_avail']
-            target_cph = new_data['target_cph']
+    # Steps 5-6: recalculate fte_required and capacity for all records at once.
+    # Arrays are (n_records, n_months); cph is (n_records, 1) and broadcasts.
+    month_idxs = list(months_dict.keys())
+    forecast = np.array(
+        [[p[2]['months'][lbl]['forecast'] for lbl in month_labels] for p in pending], dtype=np.float64
+    )
+    fte_avail = np.array(
+        [[p[3]['months'][lbl]['fte_avail'] for lbl in month_labels] for p in pending], dtype=np.float64
+    )
+    ramp_fte = np.array([[c[0] for c in p[6]] for p in pending], dtype=np.float64)
+    ramp_capacity = np.array([[c[1] for c in p[6]] for p in pending], dtype=np.float64)
+
+    # Month configs are shared per work type: build the config table once per
+    # distinct config, then expand it to (n_records, n_months) by indexing
+    distinct_configs = {}
+    for p in pending:
+        distinct_configs.setdefault(id(p[5]), p[5])
+    config_pos = {config_id: pos for pos, config_id in enumerate(distinct_configs)}
+    config_index = np.fromiter(
+        (config_pos[id(p[5])] for p in pending), dtype=np.intp, count=len(pending)
+    )
+    config_table = np.array(
+        [
+            [[config[idx][field] for idx in month_idxs] for config in distinct_configs.values()]
+            for field in ('working_days', 'work_hours', 'shrinkage')
+        ],
+        dtype=np.float64
+    )
+    working_days, work_hours, shrinkage = config_table[:, config_index]
+    target_cph = np.array([[p[3]['target_cph']] for p in pending], dtype=np.float64)
+
+    # Steps 5-6: fte_required only changes for records whose target_cph changed;
+    # capacity splits base FTE from ramp FTE for accurate calculation
+    old_fte_req = np.array(
+        [[p[2]['months'][lbl]['fte_req'] for lbl in month_labels] for p in pending], dtype=np.int64
+    )
+    cph_changed = np.array([p[4] for p in pending], dtype=bool)
+    fte_req, base_capacity = compute_fte_req_and_capacity(
+        forecast,
+        fte_avail - ramp_fte,
+        old_fte_req,
+        cph_changed,
+        working_days,
+        work_hours,
+        shrinkage,
+        target_cph,
+    )
+    capacity = (base_capacity + ramp_capacity).astype(np.int64)
 
-            # Log inputs
-            logger.info(
+    # Step 7: Calculate changes for all records at once
+    old_fte_avail = np.array(
+        [[p[2]['months'][lbl]['fte_avail'] for lbl in month_labels] for p in pending], dtype=np.int64
+    )
+    old_capacity = np.array(
+        [[p[2]['months'][lbl]['capacity'] for lbl in month_labels] for p in pending], dtype=np.int64
+    )
+    new_fte_avail = fte_avail.astype(np.int64)
+    fte_req_change = fte_req - old_fte_req
+    fte_avail_change = new_fte_avail - old_fte_avail
+    capacity_change = capacity - old_capacity
+
+    # Unchanged months contribute 0, so totals are plain sums
+    total_fte_change = int(np.abs(fte_avail_change).sum())
+    total_capacity_change = int(np.abs(capacity_change).sum())
+
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_capacity_calc(pending, months_dict, new_fte_avail, capacity)
+
+    # Only records with a target_cph change or any month change are returned
+    changed_rows = np.flatnonzero(
+        cph_changed
+        | (fte_req_change != 0).any(axis=1)
+        | (fte_avail_change != 0).any(axis=1)
+        | (capacity_change != 0).any(axis=1)
+    ).tolist()
+
+    # (n_changed, n_months, 7) nested lists of Python ints, converted in one pass
+    month_values = np.stack(
+        [
+            forecast.astype(np.int64), fte_req, new_fte_avail, capacity,
+            fte_req_change, fte_avail_change, capacity_change
+        ],
+        axis=-1
+    )[changed_rows].tolist()
+
+    # Field paths for all 6 months: complete row data for the history log
+    all_month_fields = [
+        f"{month_label}.{field}"
+        for month_label in month_labels
+        for field in ("forecast", "fte_req", "fte_avail", "capacity")
+    ]
+
+    # Values are ints computed above, so skip per-field validation
+    result_records = [
+        ModifiedRecordResponse.model_construct(
+            main_lob=db_rec.Centene_Capacity_Plan_Main_LOB,
+            state=db_rec.Centene_Capacity_Plan_State,
+            case_type=db_rec.Centene_Capacity_Plan_Case_Type,
+            case_id=db_rec.Centene_Capacity_Plan_Call_Type_ID,
+            target_cph=int(new_data['target_cph']),
+            target_cph_change=int(new_data['target_cph'] - old_data['target_cph']),
+            modified_fields=(["target_cph"] if target_cph_changed else []) + all_month_fields,
+            months={
+                month_label: MonthDataResponse.model_construct(
+                    forecast=m_forecast,
+                    fte_req=m_fte_req,
+                    fte_avail=m_fte_avail,
+                    capacity=m_capacity,
+                    forecast_change=0,
+                    fte_req_change=m_fte_req_change,
+                    fte_avail_change=m_fte_avail_change,
+                    capacity_change=m_capacity_change
+                )
+                for month_label, (
+                    m_forecast, m_fte_req, m_fte_avail, m_capacity,
+                    m_fte_req_change, m_fte_avail_change, m_capacity_change
+                ) in zip(month_labels, record_values)
+            }
+        )
+        for (db_rec, _, old_data, new_data, target_cph_changed, _, _), record_values in zip(
+            (pending[row] for row in changed_rows), month_values
+        )
+    ]
+
+    return _build_preview_response(
+        month, year, months_dict, result_records, total_fte_change, total_capacity_change
+    )
+
+
+def _log_capacity_calc(
+    pending: List[Tuple],
+    months_dict: Dict[str, str],
+    fte_avail: np.ndarray,
+    capacity: np.ndarray
+) -> None:
+    """DEBUG diagnostics of the per-month capacity inputs and outputs of a preview."""
+    for row, (_, key, old_data, new_data, target_cph_changed, month_config, _) in enumerate(pending):
+        logger.debug(f"[Capacity Calc] Record: {key}, target_cph_changed={target_cph_changed}")
+        logger.debug(
+            f"[Capacity Calc] old_target_cph={old_data['target_cph']}, "
+            f"new_target_cph={new_data['target_cph']}"
+        )
+        for col, (month_idx, month_label) in enumerate(months_dict.items()):
+            config = month_config[month_idx]
+            old_capacity = old_data['months'][month_label]['capacity']
+            new_capacity = int(capacity[row, col])
+            logger.debug(
                 f"[Capacity Calc] {month_label} INPUTS: "
-                f"fte_avail={fte_avail}, target_cph={target_cph}, "
+                f"fte_avail={int(fte_avail[row, col])}, target_cph={new_data['target_cph']}, "
                 f"working_days={config.get('working_days')}, "
                 f"work_hours={config.get('work_hours')}, "
                 f"shrinkage={config.get('shrinkage')}"
             )
-
-            # Split base FTE from ramp FTE for accurate capacity calculation
-            ramp_month_key = _month_label_to_key(month_label)
-            ramp_fte, ramp_capacity = get_ramp_contribution_for_month(
-                forecast_id=db_rec.id,
-                month_key=ramp_month_key,
-                target_cph=target_cph,
-                config=config,
-            )
-            base_fte = (fte_avail or 0) - ramp_fte
-            base_capacity = calculate_capacity(base_fte, config, target_cph)
-            new_capacity = int(base_capacity + ramp_capacity)
-            old_capacity = old_data['months'][month_label]['capacity']
-
-            # Log outputs
-            logger.info(
+            logger.debug(
                 f"[Capacity Calc] {month_label} OUTPUT: "
                 f"old_capacity={old_capacity}, new_capacity={new_capacity}, "
                 f"diff={new_capacity - old_capacity}"
             )
 
-            new_data['months'][month_label]['capacity'] = new_capacity
-
-        # Step 7: Calculate changes and build response
-        # First pass: calculate all changes and check if any change exists
-        month_data = {}
-        has_any_change = target_cph_changed
-
-        for month_label in month_labels:
-            old_m = old_data['months'][month_label]
-            new_m = new_data['months'][month_label]
-
-            fte_req_change = new_m['fte_req'] - old_m['fte_req']
-            fte_avail_change = new_m['fte_avail'] - old_m['fte_avail']
-            capacity_change = new_m['capacity'] - old_m['capacity']
-
-            if fte_req_change != 0 or fte_avail_change != 0 or capacity_change != 0:
-                has_any_change = True
-                total_fte_change += abs(fte_avail_change)
-                total_capacity_change += abs(capacity_change)
-
-            month_data[month_label] = MonthDataResponse(
-                forecast=old_m['forecast'],
-                fte_req=new_m['fte_req'],
-                fte_avail=new_m['fte_avail'],
-                capacity=new_m['capacity'],
-                forecast_change=0,
-                fte_req_change=fte_req_change,
-                fte_avail_change=fte_avail_change,
-                capacity_change=capacity_change
-            )
-
-        # If any change exists, include all fields for all 6 months
-        modified_fields = []
-        if has_any_change:
-            if target_cph_changed:
-                modified_fields.append("target_cph")
-            # Add all 6 months' fields for complete row data in history log
-            for month_label in month_labels:
-                modified_fields.extend([
-                    f"{month_label}.forecast",
-                    f"{month_label}.fte_req",
-                    f"{month_label}.fte_avail",
-                    f"{month_label}.capacity"
-                ])
-
-        if modified_fields:
-            result_records.append(ModifiedRecordResponse(
-                main_lob=db_rec.Centene_Capacity_Plan_Main_LOB,
-                state=db_rec.Centene_Capacity_Plan_State,
-                case_type=db_rec.Centene_Capacity_Plan_Case_Type,
-                case_id=db_rec.Centene_Capacity_Plan_Call_Type_ID,
-                target_cph=int(new_data['target_cph']),
-                target_cph_change=int(new_data['target_cph'] - old_data['target_cph']),
-                modified_fields=list(set(modified_fields)),  # Remove duplicates
-                months=month_data
-            ))
 
+def _build_preview_response(
+    month: str,
+    year: int,
+    months_dict: Dict[str, str],
+    result_records: List[ModifiedRecordResponse],
+    total_fte_change: int,
+    total_capacity_change: int
+) -> PreviewResponse:
+    """Wrap computed reallocation records into a PreviewResponse."""
     return PreviewResponse(
         success=True,
         months=months_dict,
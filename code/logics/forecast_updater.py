@@ -7,18 +7,48 @@ CPH updates, and other edit operations.
 
 import logging
 from typing import Dict, List
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import load_only
 from code.logics.db import ForecastModel
 from code.logics.core_utils import CoreUtils
 from code.logics.edit_view_utils import (
     get_forecast_column_name,
     extract_month_suffix_from_index,
     reverse_months_dict,
-    parse_field_path
+    parse_field_path,
+    load_forecast_records_by_keys
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _plan_field_path(field_path: str, month_label_to_index: Dict[str, str]) -> tuple:
+    """
+    Resolve a modified_fields path to its ForecastModel column.
+
+    Args:
+        field_path: Field path (e.g., "Jun-25.fte_avail" or "target_cph")
+        month_label_to_index: Reversed months dict ({"Jun-25": "month1", ...})
+
+    Returns:
+        Tuple of (month_label or None, field_name, month_known, column_name or None).
+        column_name is only resolved for known months.
+
+    Raises:
+        ValueError: If field_path is invalid (see parse_field_path)
+    """
+    month_label, field_name = parse_field_path(field_path)
+    if not month_label:
+        return month_label, field_name, False, None
+
+    month_index = month_label_to_index.get(month_label)
+    if not month_index:
+        return month_label, field_name, False, None
+
+    month_suffix = extract_month_suffix_from_index(month_index)
+    return month_label, field_name, True, get_forecast_column_name(field_name, month_suffix)
+
+
 def update_forecast_from_modified_records(
     modified_records: List[Dict],
     months_dict: Dict[str, str],
@@ -67,38 +97,57 @@ def update_forecast_from_modified_records(
         # Reverse month mapping for lookup: {"Jun-25": "month1", ...}
         month_label_to_index = reverse_months_dict(months_dict)
 
-        with db_manager.SessionLocal() as session:
-            # Process each modified record
-            for i, record in enumerate(modified_records):
-                # Validate required fields
-                required_fields = ["main_lob", "state", "case_type", "case_id"]
-                missing_fields = [field for field in required_fields if field not in record]
-                if missing_fields:
-                    raise ValueError(
-                        f"Record at index {i} missing required fields: {missing_fields}"
-                    )
+        # Validate required fields up front, before touching the database
+        required_fields = ["main_lob", "state", "case_type", "case_id"]
+        for i, record in enumerate(modified_records):
+            missing_fields = [field for field in required_fields if field not in record]
+            if missing_fields:
+                raise ValueError(
+                    f"Record at index {i} missing required fields: {missing_fields}"
+                )
 
-                # Extract all identifying fields for precise filtering
-                main_lob = record["main_lob"]
-                state = record["state"]
-                case_type = record["case_type"]
-                call_type_id = record["case_id"]
+        # Composite identifying key (Main_LOB, State, Case_Type, Call_Type_ID)
+        # for precise record matching
+        key_columns = [
+            ForecastModel.Centene_Capacity_Plan_Main_LOB,
+            ForecastModel.Centene_Capacity_Plan_State,
+            ForecastModel.Centene_Capacity_Plan_Case_Type,
+            ForecastModel.Centene_Capacity_Plan_Call_Type_ID,
+        ]
+        record_keys = [
+            (record["main_lob"], record["state"], record["case_type"], record["case_id"])
+            for record in modified_records
+        ]
 
-                logger.debug(
-                    f"Searching for forecast record: LOB={main_lob}, State={state}, "
-                    f"CaseType={case_type}, CallTypeID={call_type_id}, "
-                    f"Month={report_month}, Year={report_year}"
+        with db_manager.SessionLocal() as session:
+            # Load ids of all target records in one batch instead of one query per record
+            forecast_by_key = {}
+            for row in load_forecast_records_by_keys(
+                session, report_month, report_year, key_columns, record_keys,
+                options=(load_only(ForecastModel.id, *key_columns),)
+            ):
+                forecast_by_key.setdefault(
+                    (
+                        row.Centene_Capacity_Plan_Main_LOB,
+                        row.Centene_Capacity_Plan_State,
+                        row.Centene_Capacity_Plan_Case_Type,
+                        row.Centene_Capacity_Plan_Call_Type_ID,
+                    ),
+                    row
                 )
 
-                # Find forecast record using ALL identifying fields for robust filtering
-                forecast_record = session.query(ForecastModel).filter(
-                    ForecastModel.Centene_Capacity_Plan_Main_LOB == main_lob,
-                    ForecastModel.Centene_Capacity_Plan_State == state,
-                    ForecastModel.Centene_Capacity_Plan_Case_Type == case_type,
-                    ForecastModel.Centene_Capacity_Plan_Call_Type_ID == call_type_id,
-                    ForecastModel.Month == report_month,
-                    ForecastModel.Year == report_year
-                ).first()
+            # Column updates per row id: {id: {column_name: value, ...}}
+            updates_by_id = {}
+            # Resolved field paths: {field_path: (month_label, field_name, month_known, column_name)}
+            field_plans = {}
+            # Per-column detail is logged at DEBUG only; INFO gets one summary line
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+            # Process each modified record
+            for record, record_key in zip(modified_records, record_keys):
+                main_lob, state, case_type, call_type_id = record_key
+
+                forecast_record = forecast_by_key.get(record_key)
 
                 if not forecast_record:
                     from code.logics.exceptions import ForecastRecordNotFoundException
@@ -118,22 +167,24 @@ def update_forecast_from_modified_records(
                     f"CallTypeID={call_type_id}"
                 )
 
+                row_updates = updates_by_id.setdefault(forecast_record.id, {})
+
                 # Parse modified_fields and update
                 for field_path in record.get("modified_fields", []):
-                    # Parse field path using utility function
-                    month_label, field_name = parse_field_path(field_path)
+                    # Field paths repeat across records; parse and resolve each once
+                    field_plan = field_plans.get(field_path)
+                    if field_plan is None:
+                        field_plan = field_plans[field_path] = _plan_field_path(
+                            field_path, month_label_to_index
+                        )
+                    month_label, field_name, month_known, column_name = field_plan
 
                     if month_label:
                         # Month-specific field: "Jun-25.fte_avail"
-                        month_index = month_label_to_index.get(month_label)
-
-                        if not month_index:
+                        if not month_known:
                             logger.warning(f"Unknown month label: {month_label}")
                             continue
 
-                        # Extract month suffix
-                        month_suffix = extract_month_suffix_from_index(month_index)
-
                         # Get new value from record
                         month_data = record.get(month_label, {})
                         new_value = month_data.get(field_name)
@@ -142,33 +193,50 @@ def update_forecast_from_modified_records(
                             logger.warning(f"No value for {field_path}")
                             continue
 
-                        # Get ForecastModel column name
-                        column_name = get_forecast_column_name(field_name, month_suffix)
+                        # ForecastModel column name resolved in the plan
                         if not column_name:
                             logger.warning(f"Unknown field: {field_name}")
                             continue
 
                         # Update the column
-                        setattr(forecast_record, column_name, new_value)
-                        logger.info(
-                            f"Updated {column_name} = {new_value} for "
-                            f"CallTypeID={call_type_id}, LOB={main_lob}, State={state}"
-                        )
+                        row_updates[column_name] = new_value
 
                     else:
                         # Month-agnostic field: "target_cph"
                         new_value = record.get(field_path)
 
                         if field_path == "target_cph":
-                            forecast_record.Centene_Capacity_Plan_Target_CPH = new_value
-                            logger.info(
-                                f"Updated Target_CPH = {new_value} for "
-                                f"CallTypeID={call_type_id}, LOB={main_lob}, State={state}"
-                            )
+                            row_updates["Centene_Capacity_Plan_Target_CPH"] = new_value
+
+                if debug_enabled:
+                    logger.debug(
+                        f"Updated {len(row_updates)} column(s) for "
+                        f"CallTypeID={call_type_id}, LOB={main_lob}, State={state}: {row_updates}"
+                    )
+
+            # Apply all updates as Core UPDATE ... WHERE id = ? executemany
+            # batches, bypassing ORM change tracking and bulk persistence.
+            # The SET clause comes from the parameter keys, so rows are
+            # batched by the set of columns they update.
+            updates_by_columns = {}
+            for forecast_id, row_updates in updates_by_id.items():
+                if row_updates:
+                    updates_by_columns.setdefault(tuple(row_updates), []).append(
+                        {"forecast_id": forecast_id, **row_updates}
+                    )
+
+            table = ForecastModel.__table__
+            update_by_id = update(table).where(table.c.id == bindparam("forecast_id"))
+            for params in updates_by_columns.values():
+                session.execute(update_by_id, params)
 
             # Commit all updates
             session.commit()
-            logger.info(f"Successfully updated {len(modified_records)} forecast records")
+            logger.info(
+                f"Successfully updated {len(modified_records)} forecast records "
+                f"({sum(len(row_updates) for row_updates in updates_by_id.values())} column values, "
+                f"{sum(map(len, updates_by_columns.values()))} rows, operation={operation_type})"
+            )
             return True
 
     except Exception as e:
@@ -8,12 +8,17 @@ the CHANGE_TYPE_FORECAST_UPDATE change type for two scenarios:
 """
 
 import logging
+from itertools import compress
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import func, select
+
 from code.logics.db import ForecastModel
 from code.logics.core_utils import CoreUtils
-from code.logics.edit_view_utils import get_months_dict
+from code.logics.edit_view_utils import get_months_dict, get_ordered_month_labels
+from code.logics.forecast_compare_kernel import classify_snapshot_changes
 from code.logics.history_logger import create_history_log, add_history_changes
 from code.logics.config.change_types import CHANGE_TYPE_FORECAST_UPDATE
 
@@ -30,6 +35,30 @@ FORECAST_COLUMN_MAPPING = {
     'Centene_Capacity_Plan_Target_CPH': 'Target_CPH',
 }
 
+# Columns identifying a forecast record in a snapshot
+FORECAST_KEY_COLUMNS = ['Main_LOB', 'State', 'Case_Type', 'Case_ID']
+
+# Rows fetched per round-trip when streaming a forecast snapshot
+SNAPSHOT_YIELD_PER = 5000
+
+# Month metrics: column prefix -> field name used in modified_records
+MONTH_METRIC_FIELDS = [
+    ('Client_Forecast', 'forecast'),
+    ('FTE_Required', 'fte_req'),
+    ('FTE_Avail', 'fte_avail'),
+    ('Capacity', 'capacity'),
+]
+
+# History summary total per month metric, in MONTH_METRIC_FIELDS order
+SUMMARY_TOTAL_KEYS = ['total_forecast', 'total_fte_required', 'total_fte_available', 'total_capacity']
+
+# Month metric columns captured per snapshot, Month1-Month6 in column order
+SNAPSHOT_METRIC_COLUMNS = [
+    f'{prefix}_Month{suffix}'
+    for suffix in ['1', '2', '3', '4', '5', '6']
+    for prefix, _ in MONTH_METRIC_FIELDS
+]
+
 
 def _normalize_forecast_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -44,10 +73,11 @@ def _normalize_forecast_columns(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with normalized (short) column names
     """
-    if df is None or df.empty:
+    if df is None:
         return df
 
-    # Only rename columns that exist
+    # Only rename columns that exist (empty frames too, so an empty upload
+    # still has the short key columns)
     rename_map = {k: v for k, v in FORECAST_COLUMN_MAPPING.items() if k in df.columns}
 
     if rename_map:
@@ -57,6 +87,198 @@ def _normalize_forecast_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _compare_columns(months_dict: Dict[str, str]) -> List[str]:
+    """Target_CPH followed by the four metric columns of each month in months_dict."""
+    return ['Target_CPH'] + [
+        f"{prefix}_Month{month_idx.replace('month', '')}"
+        for month_idx in months_dict
+        for prefix, _ in MONTH_METRIC_FIELDS
+    ]
+
+
+def _field_labels(months_dict: Dict[str, str]) -> List[str]:
+    """DOT-notation field name per _compare_columns() column (e.g., "Jun-25.fte_avail")."""
+    return ['target_cph'] + [
+        f"{month_label}.{field}"
+        for month_label in months_dict.values()
+        for _, field in MONTH_METRIC_FIELDS
+    ]
+
+
+def _to_python_values(arr: np.ndarray) -> List:
+    """
+    arr.tolist() with integral values as int.
+
+    Forecast metrics are integer columns; the compare arrays are float64 only
+    so NaNs can be zeroed. Logged values keep their integer form (history
+    stores str(value), so 100 must not become "100.0").
+    """
+    values = arr.astype(object)
+    integral = arr == np.trunc(arr)
+    values[integral] = arr[integral].astype(np.int64)
+    return values.tolist()
+
+
+def _build_modified_records(
+    key_rows: List[List],
+    new_arr: np.ndarray,
+    delta_arr: np.ndarray,
+    changed: np.ndarray,
+    months_dict: Dict[str, str]
+) -> List[Dict]:
+    """
+    Build modified_records from compare arrays laid out as _compare_columns().
+
+    Args:
+        key_rows: [main_lob, state, case_type, case_id] per record
+        new_arr: New values, shape (n_records, 1 + 4 * n_months)
+        delta_arr: Changes (new - old), same shape
+        changed: Boolean mask of fields to list in modified_fields, same shape
+        months_dict: Month index mapping (e.g., {"month1": "Jun-25"})
+
+    Returns:
+        List of records in bench allocation format
+    """
+    # modified_fields picks from one shared label table by each row's mask, so
+    # records hold references to the same strings rather than new ones
+    field_labels = _field_labels(months_dict)
+    # (label, first column) per month, resolved once rather than per record
+    month_slots = [
+        (month_label, 1 + len(MONTH_METRIC_FIELDS) * m)
+        for m, month_label in enumerate(months_dict.values())
+    ]
+
+    modified_records = []
+    for (main_lob, state, case_type, case_id), new_vals, deltas, row_changed in zip(
+        key_rows, _to_python_values(new_arr), _to_python_values(delta_arr), changed.tolist()
+    ):
+        record = {
+            "main_lob": main_lob,
+            "state": state,
+            "case_type": case_type,
+            "case_id": case_id,
+            "modified_fields": list(compress(field_labels, row_changed)),
+            "target_cph": new_vals[0],
+            "target_cph_change": deltas[0]
+        }
+
+        for month_label, base in month_slots:
+            record[month_label] = {
+                "forecast": new_vals[base],
+                "fte_req": new_vals[base + 1],
+                "fte_avail": new_vals[base + 2],
+                "capacity": new_vals[base + 3],
+                "forecast_change": deltas[base],
+                "fte_req_change": deltas[base + 1],
+                "fte_avail_change": deltas[base + 2],
+                "capacity_change": deltas[base + 3]
+            }
+
+        modified_records.append(record)
+
+    return modified_records
+
+
+def _build_history_changes(
+    key_rows: List[List],
+    new_arr: np.ndarray,
+    delta_arr: np.ndarray,
+    changed: np.ndarray,
+    months_dict: Dict[str, str]
+) -> List[Dict]:
+    """
+    Build history change dicts straight from compare arrays.
+
+    Produces the same changes as extract_specific_changes() on the records
+    from _build_modified_records(), without building the nested records.
+
+    Args:
+        key_rows: [main_lob, state, case_type, case_id] per record
+        new_arr: New values, shape (n_records, 1 + 4 * n_months)
+        delta_arr: Changes (new - old), same shape
+        changed: Boolean mask of modified fields, same shape
+        months_dict: Month index mapping (e.g., {"month1": "Jun-25"})
+
+    Returns:
+        List of change dicts ready for add_history_changes()
+    """
+    field_labels = _field_labels(months_dict)
+    month_labels = [None] + [
+        month_label for month_label in months_dict.values() for _ in MONTH_METRIC_FIELDS
+    ]
+
+    # Row-major, so changes come out per record in modified_fields order
+    rows, cols = np.nonzero(changed)
+    new_values = new_arr[rows, cols]
+    deltas = delta_arr[rows, cols]
+
+    changes = []
+    for row, col, new_value, delta, old_value in zip(
+        rows.tolist(), cols.tolist(), _to_python_values(new_values), _to_python_values(deltas),
+        _to_python_values(new_values - deltas)
+    ):
+        main_lob, state, case_type, case_id = key_rows[row]
+        changes.append({
+            "main_lob": main_lob,
+            "state": state,
+            "case_type": case_type,
+            "case_id": case_id,
+            "field_name": field_labels[col],
+            "old_value": old_value,
+            "new_value": new_value,
+            "delta": delta,
+            "month_label": month_labels[col]
+        })
+
+    return changes
+
+
+def _build_summary_data(
+    new_arr: np.ndarray,
+    delta_arr: np.ndarray,
+    months_dict: Dict[str, str],
+    month: str,
+    year: int
+) -> Dict:
+    """
+    Aggregate before/after totals by month with column sums over compare arrays.
+
+    Returns the same structure as calculate_summary_data() on the records from
+    _build_modified_records().
+
+    Args:
+        new_arr: New values, shape (n_records, 1 + 4 * n_months)
+        delta_arr: Changes (new - old), same shape
+        months_dict: Month index mapping (e.g., {"month1": "Jun-25"})
+        month: Report month
+        year: Report year
+
+    Returns:
+        Summary data dict for HistoryLogModel.SummaryData
+    """
+    new_totals = _to_python_values(new_arr.sum(axis=0))
+    old_totals = _to_python_values((new_arr - delta_arr).sum(axis=0))
+    month_bases = {
+        month_label: 1 + len(MONTH_METRIC_FIELDS) * m
+        for m, month_label in enumerate(months_dict.values())
+    }
+
+    ordered_labels = get_ordered_month_labels(months_dict)
+    totals = {}
+    for month_label in ordered_labels:
+        base = month_bases[month_label]
+        totals[month_label] = {
+            total_key: {"old": old_totals[base + i], "new": new_totals[base + i]}
+            for i, total_key in enumerate(SUMMARY_TOTAL_KEYS)
+        }
+
+    return {
+        "report_month": month,
+        "report_year": year,
+        "months": ordered_labels,
+        "totals": totals
+    }
+
 def capture_forecast_snapshot(
     month: str,
     year: int,
@@ -67,6 +289,10 @@ def capture_forecast_snapshot(
 
     Returns None if no existing data (new upload scenario).
 
+    Always reads the database rather than a cached snapshot: forecast rows are
+    also edited outside uploads (bench allocation, CPH and ramp updates), and a
+    stale "before" snapshot would silently corrupt the logged history.
+
     Args:
         month: Report month name (e.g., "April")
         year: Report year (e.g., 2025)
@@ -76,70 +302,56 @@ def capture_forecast_snapshot(
         DataFrame with current forecast data or None if no existing data
     """
     try:
-        db_manager = core_utils.get_db_manager(
-            ForecastModel,
-            limit=100000,
-            skip=0,
-            select_columns=None
-        )
-
+        # Only the session factory is used. get_db_manager reuses the engine
+        # and sessionmaker cached per database URL, so this is a cheap wrapper;
+        # limit/skip do not apply to the query below.
+        db_manager = core_utils.get_db_manager(ForecastModel)
+
+        # Select only the snapshot columns, labelled with the short names, and
+        # build the frame from plain rows (no ORM objects). Missing month values
+        # count as 0, so the database returns them as 0 rather than NULL.
+        stmt = select(
+            *[getattr(ForecastModel, long_name).label(short_name)
+              for long_name, short_name in FORECAST_COLUMN_MAPPING.items()],
+            *[func.coalesce(getattr(ForecastModel, column), 0).label(column)
+              for column in SNAPSHOT_METRIC_COLUMNS]
+        ).where(
+            ForecastModel.Month == month,
+            ForecastModel.Year == year
+        ).execution_options(yield_per=SNAPSHOT_YIELD_PER)
+
+        # Stream SNAPSHOT_YIELD_PER rows at a time into frames, so peak memory
+        # holds one batch of raw rows. The session (and its pooled connection)
+        # is released as soon as the rows are read; the rest is pandas work.
         with db_manager.SessionLocal() as session:
-            records = session.query(ForecastModel).filter(
-                ForecastModel.Month == month,
-                ForecastModel.Year == year
-            ).all()
-
-            if not records:
-                logger.info(f"No existing forecast data for {month} {year} (new upload)")
-                return None
-
-            # Convert to DataFrame with standard column names
-            data = []
-            for record in records:
-                row = {
-                    'Main_LOB': record.Centene_Capacity_Plan_Main_LOB,
-                    'State': record.Centene_Capacity_Plan_State,
-                    'Case_Type': record.Centene_Capacity_Plan_Case_Type,
-                    'Case_ID': record.Centene_Capacity_Plan_Call_Type_ID,
-                    'Target_CPH': record.Centene_Capacity_Plan_Target_CPH,
-                }
-
-                # Add Month1-Month6 fields
-                for suffix in ['1', '2', '3', '4', '5', '6']:
-                    row[f'Client_Forecast_Month{suffix}'] = getattr(record, f'Client_Forecast_Month{suffix}', 0) or 0
-                    row[f'FTE_Required_Month{suffix}'] = getattr(record, f'FTE_Required_Month{suffix}', 0) or 0
-                    row[f'FTE_Avail_Month{suffix}'] = getattr(record, f'FTE_Avail_Month{suffix}', 0) or 0
-                    row[f'Capacity_Month{suffix}'] = getattr(record, f'Capacity_Month{suffix}', 0) or 0
-
-                data.append(row)
-
-            df = pd.DataFrame(data)
-            logger.info(f"Captured forecast snapshot: {len(df)} records for {month} {year}")
-            return df
+            result = session.execute(stmt)
+            columns = list(result.keys())
+            chunks = [pd.DataFrame(batch, columns=columns) for batch in result.partitions()]
+
+        if not chunks:
+            logger.info(f"No existing forecast data for {month} {year} (new upload)")
+            return None
+
+        df = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+        logger.info(f"Captured forecast snapshot: {len(df)} records for {month} {year}")
+        return df
 
     except Exception as e:
         logger.error(f"Failed to capture forecast snapshot: {e}", exc_info=True)
         return None
 
 
-def compare_forecast_snapshots(
+def _compare_snapshot_arrays(
     before_df: Optional[pd.DataFrame],
     after_df: pd.DataFrame,
     months_dict: Dict[str, str]
-) -> Tuple[List[Dict], int]:
+) -> Tuple[List[List], np.ndarray, np.ndarray, np.ndarray]:
     """
-    Compare before/after forecast DataFrames and identify changes.
-
-    Returns modified_records in same format as bench allocation for consistency.
-
-    Handles three cases:
-    1. No before_df (new upload): All records are "new", change = value
-    2. With before_df (update):
-       a. Records in NEW only (additions): old=0, change=new
-       b. Records in OLD only (deletions): new=0, change=-old (negative)
-       c. Records in BOTH (updates): change=new-old
+    Compare before/after forecast DataFrames as arrays laid out by _compare_columns().
 
-    Uses FULL OUTER JOIN to capture all records including deletions.
+    See compare_forecast_snapshots() for how additions, deletions and updates
+    are compared.
 
     Args:
         before_df: Snapshot before upload (None for new uploads)
@@ -147,298 +359,142 @@ def compare_forecast_snapshots(
         months_dict: Month index mapping (e.g., {"month1": "Jun-25"})
 
     Returns:
-        Tuple of (modified_records list, total_modified count)
-        - Additions: old=0, positive change values
-        - Deletions: new=0, negative change values
-        - Updates: calculated deltas (can be positive, negative, or zero)
+        Tuple of (key_rows, new_arr, delta_arr, changed) for the records to report
     """
-    modified_records = []
+    no_previous = before_df is None or before_df.empty
+
+    # Nothing uploaded and nothing before: no records to compare. (An empty
+    # upload over existing data still reports every old record as deleted.)
+    if after_df.empty and no_previous:
+        logger.info("No records before or after upload - nothing to compare")
+        empty = np.zeros((0, len(_compare_columns(months_dict))))
+        return [], empty, empty, empty.astype(bool)
 
     # Normalize after_df columns to match before_df column names
     # after_df comes from preprocess_forecast_df() with long Centene_Capacity_Plan_* names
     # before_df uses short names (Main_LOB, State, etc.)
-    after_df = _normalize_forecast_columns(after_df.copy())
+    # (rename returns a new frame; the caller's after_df is not modified)
+    after_df = _normalize_forecast_columns(after_df)
 
     # Log for debugging
     logger.info(f"after_df columns after normalization: {list(after_df.columns)[:10]}...")
     logger.info(f"after_df has {len(after_df)} records")
 
     # CASE 1: New upload (no previous data)
-    if before_df is None or before_df.empty:
+    if no_previous:
         logger.info("No previous data - treating all records as new")
 
-        for _, row in after_df.iterrows():
-            record = {
-                "main_lob": row.get('Main_LOB', ''),
-                "state": row.get('State', ''),
-                "case_type": row.get('Case_Type', ''),
-                "case_id": row.get('Case_ID', ''),
-                "target_cph": row.get('Target_CPH', 0),
-                "target_cph_change": row.get('Target_CPH', 0),
-                "modified_fields": []
-            }
+        # New upload: change = value, and every non-zero field is modified.
+        # Missing values count as 0 (zeroed in place on our own copy of the
+        # block); a column missing from the upload is all 0.
+        new_arr = after_df.reindex(columns=_compare_columns(months_dict)).to_numpy(
+            dtype=np.float64, copy=True
+        )
+        np.nan_to_num(new_arr, copy=False)
+        key_rows = after_df.reindex(columns=FORECAST_KEY_COLUMNS, fill_value='').to_numpy().tolist()
 
-            # Track target_cph
-            if row.get('Target_CPH', 0) != 0:
-                record["modified_fields"].append("target_cph")
-
-            # Add month data
-            for month_idx, month_label in months_dict.items():
-                suffix = month_idx.replace('month', '')  # "month1" → "1"
-
-                forecast = row.get(f'Client_Forecast_Month{suffix}', 0) or 0
-                fte_req = row.get(f'FTE_Required_Month{suffix}', 0) or 0
-                fte_avail = row.get(f'FTE_Avail_Month{suffix}', 0) or 0
-                capacity = row.get(f'Capacity_Month{suffix}', 0) or 0
-
-                record[month_label] = {
-                    "forecast": forecast,
-                    "fte_req": fte_req,
-                    "fte_avail": fte_avail,
-                    "capacity": capacity,
-                    "forecast_change": forecast,      # New upload: change = value
-                    "fte_req_change": fte_req,
-                    "fte_avail_change": fte_avail,
-                    "capacity_change": capacity
-                }
-
-                # Track non-zero fields
-                if forecast != 0:
-                    record["modified_fields"].append(f"{month_label}.forecast")
-                if fte_req != 0:
-                    record["modified_fields"].append(f"{month_label}.fte_req")
-                if fte_avail != 0:
-                    record["modified_fields"].append(f"{month_label}.fte_avail")
-                if capacity != 0:
-                    record["modified_fields"].append(f"{month_label}.capacity")
-
-            # Include all records for new upload
-            modified_records.append(record)
-
-        return modified_records, len(modified_records)
+        # Include all records for new upload
+        return key_rows, new_arr, new_arr, new_arr != 0
 
     # CASE 2: Update (compare old vs new)
-    # FULL OUTER JOIN to capture additions, deletions, and updates
-    merged = after_df.merge(
-        before_df,
-        on=['Main_LOB', 'State', 'Case_Type', 'Case_ID'],
-        how='outer',      # FULL OUTER JOIN captures all records
-        suffixes=('_new', '_old'),
-        indicator=True    # Adds '_merge' column: 'left_only', 'right_only', 'both'
+    # Align old values to the uploaded records by key instead of a wide outer
+    # merge: uploaded records (additions and updates) come first, then records
+    # only in the old snapshot (deletions).
+    missing_keys = [col for col in FORECAST_KEY_COLUMNS if col not in after_df.columns]
+    if missing_keys:
+        raise ValueError(f"Uploaded forecast data is missing key columns: {missing_keys}")
+
+    compare_cols = _compare_columns(months_dict)
+
+    before_indexed = before_df.set_index(FORECAST_KEY_COLUMNS)[compare_cols]
+    if not before_indexed.index.is_unique:
+        logger.warning("Duplicate forecast keys in previous snapshot; comparing against the first of each")
+        before_indexed = before_indexed[~before_indexed.index.duplicated()]
+
+    after_keys = pd.MultiIndex.from_frame(after_df[FORECAST_KEY_COLUMNS])
+    is_existing = after_keys.isin(before_indexed.index)
+    deleted = before_indexed[~before_indexed.index.isin(after_keys)]
+
+    n_uploaded = len(after_df)
+    n_deleted = len(deleted)
+    logger.info(f"Compare result: {n_uploaded + n_deleted} total records")
+    logger.info(f"  - New only (additions): {n_uploaded - is_existing.sum()}")
+    logger.info(f"  - Old only (deletions): {n_deleted}")
+    logger.info(f"  - Both (potential updates): {is_existing.sum()}")
+
+    # One (n_records, 1 + 4 * n_months) block per side, Target_CPH first, then
+    # the four metrics per month. Missing values (the absent side of an
+    # addition/deletion) count as 0.
+    # Kept float64: these values are logged as-is (history old/new values and
+    # summary column sums), and float32 is only exact for integers up to 2**24.
+    new_arr = np.vstack([
+        after_df.reindex(columns=compare_cols).to_numpy(dtype=np.float64),
+        np.zeros((n_deleted, len(compare_cols)))
+    ])
+    old_arr = np.vstack([
+        before_indexed.reindex(after_keys).to_numpy(dtype=np.float64),
+        deleted.to_numpy(dtype=np.float64)
+    ])
+    # Zero the NaNs of both freshly stacked blocks in place, in one pass each
+    np.nan_to_num(new_arr, copy=False)
+    np.nan_to_num(old_arr, copy=False)
+
+    is_deletion = np.concatenate([np.zeros(n_uploaded, dtype=bool), np.ones(n_deleted, dtype=bool)])
+    is_update = np.concatenate([is_existing, np.zeros(n_deleted, dtype=bool)])
+
+    # Additions and deletions flag each non-zero field (old or new is 0, so
+    # that is delta != 0). Updates flag every field of a month with any change.
+    delta_arr, changed, has_change = classify_snapshot_changes(
+        new_arr, old_arr, is_update, len(MONTH_METRIC_FIELDS)
     )
 
-    logger.info(f"Merge result: {len(merged)} total records")
-    logger.info(f"  - New only (additions): {(merged['_merge'] == 'left_only').sum()}")
-    logger.info(f"  - Old only (deletions): {(merged['_merge'] == 'right_only').sum()}")
-    logger.info(f"  - Both (potential updates): {(merged['_merge'] == 'both').sum()}")
+    # Include record if there are changes OR it's a deletion
+    # (deletions always have changes since old values become 0)
+    include_rows = np.flatnonzero(has_change | is_deletion)
 
-    for _, row in merged.iterrows():
-        merge_type = row['_merge']
+    # Only materialize keys for the surviving rows; unchanged uploaded rows
+    # (typically most of a re-upload) never become Python lists.
+    n_included_uploaded = np.searchsorted(include_rows, n_uploaded)
+    key_rows = (
+        after_df[FORECAST_KEY_COLUMNS].to_numpy()[include_rows[:n_included_uploaded]].tolist()
+        + deleted.index[include_rows[n_included_uploaded:] - n_uploaded].tolist()
+    )
+    return key_rows, new_arr[include_rows], delta_arr[include_rows], changed[include_rows]
 
-        # Extract common fields (use non-NaN values)
-        main_lob = row.get('Main_LOB', '')
-        state = row.get('State', '')
-        case_type = row.get('Case_Type', '')
-        case_id = row.get('Case_ID', '')
 
-        record = {
-            "main_lob": main_lob,
-            "state": state,
-            "case_type": case_type,
-            "case_id": case_id,
-            "modified_fields": []
-        }
+def compare_forecast_snapshots(
+    before_df: Optional[pd.DataFrame],
+    after_df: pd.DataFrame,
+    months_dict: Dict[str, str]
+) -> Tuple[List[Dict], int]:
+    """
+    Compare before/after forecast DataFrames and identify changes.
+
+    Returns modified_records in same format as bench allocation for consistency.
+
+    Handles three cases:
+    1. No before_df (new upload): All records are "new", change = value
+    2. With before_df (update):
+       a. Records in NEW only (additions): old=0, change=new
+       b. Records in OLD only (deletions): new=0, change=-old (negative)
+       c. Records in BOTH (updates): change=new-old
+
+    Old values are aligned to the uploaded records by key; records only in
+    before_df are appended as deletions.
 
-        # Handle based on merge type
-        if merge_type == 'left_only':
-            # SCENARIO: Record in NEW only (addition)
-            # old = 0, change = new
-            logger.debug(f"Addition: {case_id}")
-
-            new_cph = row.get('Target_CPH_new', 0) if pd.notna(row.get('Target_CPH_new')) else 0
-            record["target_cph"] = new_cph
-            record["target_cph_change"] = new_cph  # old=0, so change=new
-
-            if new_cph != 0:
-                record["modified_fields"].append("target_cph")
-
-            # Process month data
-            for month_idx, month_label in months_dict.items():
-                suffix = month_idx.replace('month', '')
-
-                forecast_new = row.get(f'Client_Forecast_Month{suffix}_new', 0)
-                forecast_new = forecast_new if pd.notna(forecast_new) else 0
-
-                fte_req_new = row.get(f'FTE_Required_Month{suffix}_new', 0)
-                fte_req_new = fte_req_new if pd.notna(fte_req_new) else 0
-
-                fte_avail_new = row.get(f'FTE_Avail_Month{suffix}_new', 0)
-                fte_avail_new = fte_avail_new if pd.notna(fte_avail_new) else 0
-
-                capacity_new = row.get(f'Capacity_Month{suffix}_new', 0)
-                capacity_new = capacity_new if pd.notna(capacity_new) else 0
-
-                record[month_label] = {
-                    "forecast": forecast_new,
-                    "fte_req": fte_req_new,
-                    "fte_avail": fte_avail_new,
-                    "capacity": capacity_new,
-                    "forecast_change": forecast_new,      # old=0
-                    "fte_req_change": fte_req_new,
-                    "fte_avail_change": fte_avail_new,
-                    "capacity_change": capacity_new
-                }
-
-                # Track non-zero fields
-                if forecast_new != 0:
-                    record["modified_fields"].append(f"{month_label}.forecast")
-                if fte_req_new != 0:
-                    record["modified_fields"].append(f"{month_label}.fte_req")
-                if fte_avail_new != 0:
-                    record["modified_fields"].append(f"{month_label}.fte_avail")
-                if capacity_new != 0:
-                    record["modified_fields"].append(f"{month_label}.capacity")
-
-        elif merge_type == 'right_only':
-            # SCENARIO: Record in OLD only (deletion)
-            # new = 0, change = -old (negative to show removal)
-            logger.debug(f"Deletion: {case_id}")
-
-            old_cph = row.get('Target_CPH_old', 0) if pd.notna(row.get('Target_CPH_old')) else 0
-            record["target_cph"] = 0  # Deleted, so new=0
-            record["target_cph_change"] = -old_cph  # Negative change
-
-            if old_cph != 0:
-                record["modified_fields"].append("target_cph")
-
-            # Process month data
-            for month_idx, month_label in months_dict.items():
-                suffix = month_idx.replace('month', '')
-
-                forecast_old = row.get(f'Client_Forecast_Month{suffix}_old', 0)
-                forecast_old = forecast_old if pd.notna(forecast_old) else 0
-
-                fte_req_old = row.get(f'FTE_Required_Month{suffix}_old', 0)
-                fte_req_old = fte_req_old if pd.notna(fte_req_old) else 0
-
-                fte_avail_old = row.get(f'FTE_Avail_Month{suffix}_old', 0)
-                fte_avail_old = fte_avail_old if pd.notna(fte_avail_old) else 0
-
-                capacity_old = row.get(f'Capacity_Month{suffix}_old', 0)
-                capacity_old = capacity_old if pd.notna(capacity_old) else 0
-
-                record[month_label] = {
-                    "forecast": 0,              # Deleted, new=0
-                    "fte_req": 0,
-                    "fte_avail": 0,
-                    "capacity": 0,
-                    "forecast_change": -forecast_old,    # Negative change
-                    "fte_req_change": -fte_req_old,
-                    "fte_avail_change": -fte_avail_old,
-                    "capacity_change": -capacity_old
-                }
-
-                # Track deleted fields (had old values)
-                if forecast_old != 0:
-                    record["modified_fields"].append(f"{month_label}.forecast")
-                if fte_req_old != 0:
-                    record["modified_fields"].append(f"{month_label}.fte_req")
-                if fte_avail_old != 0:
-                    record["modified_fields"].append(f"{month_label}.fte_avail")
-                if capacity_old != 0:
-                    record["modified_fields"].append(f"{month_label}.capacity")
-
-        else:  # merge_type == 'both'
-            # SCENARIO: Record in BOTH (update or no change)
-            # Calculate deltas: change = new - old
-            logger.debug(f"Update: {case_id}")
-
-            # Check target_cph change
-            old_cph = row.get('Target_CPH_old', 0) if pd.notna(row.get('Target_CPH_old')) else 0
-            new_cph = row.get('Target_CPH_new', 0) if pd.notna(row.get('Target_CPH_new')) else 0
-            cph_change = new_cph - old_cph
-
-            record["target_cph"] = new_cph
-            record["target_cph_change"] = cph_change
-
-            if cph_change != 0:
-                record["modified_fields"].append("target_cph")
-
-            # Check month data changes
-            for month_idx, month_label in months_dict.items():
-                suffix = month_idx.replace('month', '')
-
-                # Get new values
-                forecast_new = row.get(f'Client_Forecast_Month{suffix}_new', 0)
-                forecast_new = forecast_new if pd.notna(forecast_new) else 0
-
-                fte_req_new = row.get(f'FTE_Required_Month{suffix}_new', 0)
-                fte_req_new = fte_req_new if pd.notna(fte_req_new) else 0
-
-                fte_avail_new = row.get(f'FTE_Avail_Month{suffix}_new', 0)
-                fte_avail_new = fte_avail_new if pd.notna(fte_avail_new) else 0
-
-                capacity_new = row.get(f'Capacity_Month{suffix}_new', 0)
-                capacity_new = capacity_new if pd.notna(capacity_new) else 0
-
-                # Get old values
-                forecast_old = row.get(f'Client_Forecast_Month{suffix}_old', 0)
-                forecast_old = forecast_old if pd.notna(forecast_old) else 0
-
-                fte_req_old = row.get(f'FTE_Required_Month{suffix}_old', 0)
-                fte_req_old = fte_req_old if pd.notna(fte_req_old) else 0
-
-                fte_avail_old = row.get(f'FTE_Avail_Month{suffix}_old', 0)
-                fte_avail_old = fte_avail_old if pd.notna(fte_avail_old) else 0
-
-                capacity_old = row.get(f'Capacity_Month{suffix}_old', 0)
-                capacity_old = capacity_old if pd.notna(capacity_old) else 0
-
-                # Calculate changes
-                forecast_change = forecast_new - forecast_old
-                fte_req_change = fte_req_new - fte_req_old
-                fte_avail_change = fte_avail_new - fte_avail_old
-                capacity_change = capacity_new - capacity_old
-
-                record[month_label] = {
-                    "forecast": forecast_new,
-                    "fte_req": fte_req_new,
-                    "fte_avail": fte_avail_new,
-                    "capacity": capacity_new,
-                    "forecast_change": forecast_change,
-                    "fte_req_change": fte_req_change,
-                    "fte_avail_change": fte_avail_change,
-                    "capacity_change": capacity_change
-                }
-
-                # Track modified fields
-                # OPTION 1: If ANY field changed for this month, track ALL fields
-                has_changes = (
-                    forecast_change != 0 or
-                    fte_req_change != 0 or
-                    fte_avail_change != 0 or
-                    capacity_change != 0
-                )
-
-                if has_changes:
-                    # Add ALL fields for this month (complete snapshot)
-                    fields_to_add = [
-                        f"{month_label}.forecast",
-                        f"{month_label}.fte_req",
-                        f"{month_label}.fte_avail",
-                        f"{month_label}.capacity"
-                    ]
-
-                    # Add to modified_fields if not already present
-                    for field in fields_to_add:
-                        if field not in record["modified_fields"]:
-                            record["modified_fields"].append(field)
-
-        # Include record if there are changes OR it's a deletion
-        # (deletions always have changes since old values become 0)
-        if record["modified_fields"] or merge_type == 'right_only':
-            modified_records.append(record)
+    Args:
+        before_df: Snapshot before upload (None for new uploads)
+        after_df: Snapshot after upload
+        months_dict: Month index mapping (e.g., {"month1": "Jun-25"})
 
+    Returns:
+        Tuple of (modified_records list, total_modified count)
+        - Additions: old=0, positive change values
+        - Deletions: new=0, negative change values
+        - Updates: calculated deltas (can be positive, negative, or zero)
+    """
+    key_rows, new_arr, delta_arr, changed = _compare_snapshot_arrays(before_df, after_df, months_dict)
+    modified_records = _build_modified_records(key_rows, new_arr, delta_arr, changed, months_dict)
     return modified_records, len(modified_records)
 
 
@@ -457,8 +513,8 @@ def create_forecast_upload_history_log(
     This is the main entry point - orchestrates the full process:
     1. Get month mappings
     2. Compare before/after snapshots
-    3. Extract specific changes (REUSE bench allocation function)
-    4. Calculate summary data (REUSE bench allocation function)
+    3. Build field-level changes (same format as extract_specific_changes)
+    4. Calculate summary data (same format as calculate_summary_data)
     5. Create history log
     6. Add history changes
 
@@ -475,17 +531,21 @@ def create_forecast_upload_history_log(
         Dict with success, history_log_id, records_modified, error
     """
     try:
-        # Get month mappings
+        # Get month mappings. Served from month_mappings_cache after the first
+        # lookup for this month/year; uploads clear that cache, so a re-upload
+        # with different forecast months never sees stale labels.
         months_dict = get_months_dict(month, year, core_utils)
 
-        # Compare snapshots
-        modified_records, total_modified = compare_forecast_snapshots(
+        # Compare snapshots. Changes and summary are built straight from the
+        # compare arrays; the nested modified_records are not needed here.
+        key_rows, new_arr, delta_arr, changed = _compare_snapshot_arrays(
             before_df,
             after_df,
             months_dict
         )
+        total_modified = len(key_rows)
 
-        logger.info(f"compare_forecast_snapshots returned {total_modified} modified records")
+        logger.info(f"Snapshot compare found {total_modified} modified records")
 
         if total_modified == 0:
             logger.info(f"No changes detected for {month} {year}")
@@ -496,16 +556,10 @@ def create_forecast_upload_history_log(
                 'message': 'No changes to log'
             }
 
-        # REUSE bench allocation functions (DRY principle)
-        from code.logics.bench_allocation_transformer import (
-            extract_specific_changes,
-            calculate_summary_data
-        )
-
-        changes = extract_specific_changes(modified_records, months_dict)
-        logger.info(f"extract_specific_changes generated {len(changes)} changes")
+        changes = _build_history_changes(key_rows, new_arr, delta_arr, changed, months_dict)
+        logger.info(f"Built {len(changes)} history changes")
 
-        summary_data = calculate_summary_data(modified_records, months_dict, month, year)
+        summary_data = _build_summary_data(new_arr, delta_arr, months_dict, month, year)
 
         # Create history log
         history_log_id = create_history_log(
@@ -9,11 +9,13 @@ Data is cleared and replaced when allocation runs - no historical preservation.
 
 import logging
 import calendar
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime, timezone
 
 import pandas as pd
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, insert
 from sqlalchemy.exc import SQLAlchemyError
 
 from code.logics.db import FTEAllocationMappingModel
@@ -23,6 +25,41 @@ from code.logics.month_code_utils import parse_month_year_code, is_month_year_co
 
 logger = get_logger(__name__)
 
+# Rows sent per INSERT executemany; bounds memory to one batch of row dicts
+FTE_MAPPING_INSERT_CHUNK_SIZE = 5000
+
+MONTH_ABBR_MAP = {
+    "January": "Jan",
+    "February": "Feb",
+    "March": "Mar",
+    "April": "Apr",
+    "May": "May",
+    "June": "Jun",
+    "July": "Jul",
+    "August": "Aug",
+    "September": "Sep",
+    "October": "Oct",
+    "November": "Nov",
+    "December": "Dec"
+}
+
+MONTH_TO_NUM = {month: idx for idx, month in enumerate(calendar.month_name) if month}
+
+# Rows fetched per round-trip when reading FTE mappings
+FTE_MAPPING_YIELD_PER = 1000
+
+# FTE mapping columns returned per FTE by get_fte_mappings(), in response order
+FTE_DETAIL_FIELDS = [
+    'cn', 'first_name', 'last_name', 'opid', 'primary_platform', 'primary_market',
+    'location', 'original_state', 'worktype', 'new_work_type', 'skills', 'allocation_type'
+]
+
+# Roster columns copied onto primary FTE mappings, in unpacking order
+VENDOR_DETAIL_COLUMNS = [
+    'FirstName', 'LastName', 'OPID', 'PrimaryPlatform',
+    'PrimaryMarket', 'Location', 'State', 'NewWorkType'
+]
+
 
 def _get_month_label(month_name: str, year: int) -> str:
     """
@@ -35,50 +72,12 @@ def _get_month_label(month_name: str, year: int) -> str:
     Returns:
         Month label (e.g., "Apr-25")
     """
-    month_abbr_map = {
-        "January": "Jan",
-        "February": "Feb",
-        "March": "Mar",
-        "April": "Apr",
-        "May": "May",
-        "June": "Jun",
-        "July": "Jul",
-        "August": "Aug",
-        "September": "Sep",
-        "October": "Oct",
-        "November": "Nov",
-        "December": "Dec"
-    }
-
-    abbr = month_abbr_map.get(month_name, month_name[:3])
+    abbr = MONTH_ABBR_MAP.get(month_name, month_name[:3])
     year_short = str(year)[2:]  # Last 2 digits
 
     return f"{abbr}-{year_short}"
 
 
-def _get_year_for_month(report_month: str, report_year: int, forecast_month: str) -> int:
-    """
-    Calculate the correct year for a forecast month in a consecutive 6-month sequence.
-
-    When the 6 forecast months wrap from December into January, this function
-    determines the correct year to use.
-
-    Args:
-        report_month: The report month (e.g., "March")
-        report_year: The year of the report month (e.g., 2025)
-        forecast_month: The forecast month we need to determine the year for (e.g., "January")
-
-    Returns:
-        The correct year for the forecast_month
-    """
-    month_to_num = {month: idx for idx, month in enumerate(calendar.month_name) if month}
-
-    report_month_num = month_to_num.get(report_month, 1)
-    forecast_month_num = month_to_num.get(forecast_month, 1)
-
-    return report_year + 1 if forecast_month_num < report_month_num else report_year
-
-
 def _get_month_index(month_headers: List[str], month_name: str) -> int:
     """
     Get the month index (1-6) for a given month name within the month_headers list.
@@ -96,11 +95,69 @@ def _get_month_index(month_headers: List[str], month_name: str) -> int:
         return 0
 
 
+@lru_cache(maxsize=1)
+def _fte_session_factory(core_utils: Any):
+    """
+    Session factory for FTE mapping reads and writes.
+
+    core_utils is a process-wide singleton, so its FTE mapping DB manager is
+    built once and every call here reuses the same (engine-bound) SessionLocal.
+    """
+    db_manager = core_utils.get_db_manager(
+        FTEAllocationMappingModel,
+        limit=None,
+        skip=0,
+        select_columns=None
+    )
+    return db_manager.SessionLocal
+
+
+def _insert_fte_mappings(session, records: Iterable[Dict[str, Any]]) -> int:
+    """
+    Insert FTE mapping rows (column name -> value dicts) in batches.
+
+    Consumes records FTE_MAPPING_INSERT_CHUNK_SIZE at a time, so only one batch
+    is held in memory, and runs each batch as one Core INSERT executemany in
+    the caller's transaction (no ORM instances or unit-of-work state per row).
+    created_datetime is filled by its server default.
+
+    Returns:
+        Number of rows inserted
+    """
+    insert_mappings = insert(FTEAllocationMappingModel.__table__)
+    records = iter(records)
+    inserted = 0
+    while batch := list(islice(records, FTE_MAPPING_INSERT_CHUNK_SIZE)):
+        session.execute(insert_mappings, batch)
+        inserted += len(batch)
+    return inserted
+
+
+def _delete_fte_mappings(session, month: str, year: int, allocation_type: str) -> int:
+    """Delete FTE mappings for (month, year, allocation_type) in the session's transaction."""
+    deleted_count = session.execute(
+        delete(FTEAllocationMappingModel).where(
+            and_(
+                FTEAllocationMappingModel.report_month == month,
+                FTEAllocationMappingModel.report_year == year,
+                FTEAllocationMappingModel.allocation_type == allocation_type
+            )
+        )
+    ).rowcount
+
+    logger.info(
+        f"Cleared {deleted_count} existing FTE mappings for "
+        f"{month} {year} ({allocation_type})"
+    )
+    return deleted_count
+
+
 def clear_fte_mappings(
     month: str,
     year: int,
     allocation_type: str,
-    core_utils: Any
+    core_utils: Any,
+    session: Any = None
 ) -> int:
     """
     Clear existing FTE mappings for a given report month/year and allocation type.
@@ -110,33 +167,22 @@ def clear_fte_mappings(
         year: Report year (e.g., 2025)
         allocation_type: 'primary' or 'bench'
         core_utils: CoreUtils instance
+        session: Optional open session. The delete then joins its transaction
+                 and is committed (or rolled back) by the caller, and database
+                 errors propagate.
 
     Returns:
         Number of records deleted
     """
-    db_manager = core_utils.get_db_manager(
-        FTEAllocationMappingModel,
-        limit=None,
-        skip=0,
-        select_columns=None
-    )
+    if session is not None:
+        return _delete_fte_mappings(session, month, year, allocation_type)
 
-    try:
-        with db_manager.SessionLocal() as session:
-            deleted_count = session.query(FTEAllocationMappingModel).filter(
-                and_(
-                    FTEAllocationMappingModel.report_month == month,
-                    FTEAllocationMappingModel.report_year == year,
-                    FTEAllocationMappingModel.allocation_type == allocation_type
-                )
-            ).delete(synchronize_session=False)
+    SessionLocal = _fte_session_factory(core_utils)
 
+    try:
+        with SessionLocal() as session:
+            deleted_count = _delete_fte_mappings(session, month, year, allocation_type)
             session.commit()
-
-            logger.info(
-                f"Cleared {deleted_count} existing FTE mappings for "
-                f"{month} {year} ({allocation_type})"
-            )
             return deleted_count
 
     except SQLAlchemyError as e:
@@ -144,78 +190,101 @@ def clear_fte_mappings(
         return 0
 
 
-def populate_fte_mapping_from_primary(
-    execution_id: str,
-    month: str,
-    year: int,
-    vendor_allocations: Dict[str, Dict[str, Dict[str, str]]],
-    vendor_df: pd.DataFrame,
+def _forecast_month_meta(
+    report_month_num: Optional[int],
+    report_year: int,
     month_headers: List[str],
-    worktype_vocab: List[str],
-    core_utils: Any
-) -> int:
+    forecast_month: str
+) -> Tuple[int, str, int]:
     """
-    Populate FTE mappings from primary allocation results.
+    Resolve a primary allocation forecast month key to its year, label and index.
 
-    Clears existing primary mappings for (month, year) before inserting new ones.
+    Plain month names belong to the 6-month window starting after the report
+    month, so a month numbered before the report month wraps into the next
+    year (unknown months count as January).
 
     Args:
-        execution_id: Allocation execution ID
-        month: Report month (e.g., "March")
-        year: Report year (e.g., 2025)
-        vendor_allocations: Dict mapping CN# -> {month: allocation_details}
-                           allocation_details has: platform (main_lob), state, worktype
-        vendor_df: Original vendor DataFrame with vendor details
+        report_month_num: The report month number (e.g., 3 for March), None if unknown
+        report_year: The year of the report month (e.g., 2025)
         month_headers: List of month names (e.g., ["April", "May", ...])
-        worktype_vocab: List of valid worktypes for skill parsing (sorted longest-first)
-        core_utils: CoreUtils instance
+        forecast_month: Month name (e.g., "April") or month-year code
 
     Returns:
-        Number of records inserted
+        Tuple of (forecast_year, forecast_month_label, month_index)
     """
-    logger.info(f"Populating FTE mappings from primary allocation for {month} {year}...")
+    if is_month_year_code(forecast_month):
+        plain_month, forecast_year = parse_month_year_code(forecast_month)
+    else:
+        plain_month = forecast_month
+        forecast_month_num = MONTH_TO_NUM.get(forecast_month)
+        forecast_year = report_year + ((forecast_month_num or 1) < (report_month_num or 1))
+    forecast_month_label = _get_month_label(plain_month, forecast_year)
+    month_index = _get_month_index(month_headers, forecast_month)
 
-    # Clear existing primary mappings
-    clear_fte_mappings(month, year, 'primary', core_utils)
+    return forecast_year, forecast_month_label, month_index
 
-    if not vendor_allocations:
-        logger.info("No vendor allocations to populate")
-        return 0
 
-    db_manager = core_utils.get_db_manager(
-        FTEAllocationMappingModel,
-        limit=None,
-        skip=0,
-        select_columns=None
-    )
+def _skills_string(new_work_type: str, worktype_vocab: List[str], skills_cache: Dict[str, str]) -> str:
+    """
+    Comma-separated, sorted skills parsed from a NewWorkType value.
 
-    records_to_insert = []
+    Many vendors share the same NewWorkType, so results are memoized in
+    skills_cache (one per populate call, where the vocabulary is fixed).
+    """
+    skills_str = skills_cache.get(new_work_type)
+    if skills_str is None:
+        parsed_skills = parse_vendor_skills(new_work_type, worktype_vocab)
+        skills_str = ', '.join(sorted(parsed_skills)) if parsed_skills else ''
+        skills_cache[new_work_type] = skills_str
+    return skills_str
+
+
+def _primary_mapping_rows(
+    execution_id: str,
+    month: str,
+    year: int,
+    vendor_allocations: Dict[str, Dict[str, Dict[str, str]]],
+    vendor_df: pd.DataFrame,
+    month_headers: List[str],
+    worktype_vocab: List[str]
+) -> Iterator[Dict[str, Any]]:
+    """Yield one FTE mapping row per (CN, forecast month) of the primary allocation."""
+    # Get vendor details from DataFrame using CN# as key
+    # CN# is a stable identifier (DataFrame indices become unreliable after filtering).
+    # Index the first row of each CN once, so each vendor is a dict lookup
+    # rather than a scan of vendor_df. Detail columns are converted to strings
+    # column by column up front (a missing column reads as ''), and each CN
+    # maps to a tuple of its details in VENDOR_DETAIL_COLUMNS order.
+    vendor_cns = vendor_df['CN'].astype(str)
+    first_of_cn = ~vendor_cns.duplicated().to_numpy()
+    first_rows = vendor_df[first_of_cn]
+    detail_columns = [
+        [str(value) for value in first_rows[column].tolist()]
+        if column in first_rows.columns else [''] * len(first_rows)
+        for column in VENDOR_DETAIL_COLUMNS
+    ]
+    vendor_details_by_cn = dict(zip(vendor_cns[first_of_cn], zip(*detail_columns)))
+
+    # Vendors share the same few forecast months and NewWorkTypes; resolve each once
+    report_month_num = MONTH_TO_NUM.get(month)
+    forecast_meta = {}
+    skills_cache = {}
 
     for cn, month_allocations in vendor_allocations.items():
-        # Get vendor details from DataFrame using CN# as key
-        # CN# is a stable identifier (DataFrame indices become unreliable after filtering)
-        vendor_matches = vendor_df[vendor_df['CN'].astype(str) == str(cn)]
-        if vendor_matches.empty:
+        vendor_details = vendor_details_by_cn.get(str(cn))
+        if vendor_details is None:
             logger.warning(f"Vendor CN {cn} not found in vendor_df")
             continue
-        vendor_row = vendor_matches.iloc[0]
 
         # CN is already known from the loop
         if not cn:
             continue
 
-        first_name = str(vendor_row.get('FirstName', ''))
-        last_name = str(vendor_row.get('LastName', ''))
-        opid = str(vendor_row.get('OPID', ''))
-        primary_platform = str(vendor_row.get('PrimaryPlatform', ''))
-        primary_market = str(vendor_row.get('PrimaryMarket', ''))
-        location = str(vendor_row.get('Location', ''))
-        original_state = str(vendor_row.get('State', ''))
-        worktype_from_roster = str(vendor_row.get('NewWorkType', ''))
+        (first_name, last_name, opid, primary_platform, primary_market,
+         location, original_state, worktype_from_roster) = vendor_details
 
         # Parse skills from NewWorkType using vocabulary
-        parsed_skills = parse_vendor_skills(worktype_from_roster, worktype_vocab)
-        skills_str = ', '.join(sorted(parsed_skills)) if parsed_skills else ''
+        skills_str = _skills_string(worktype_from_roster, worktype_vocab, skills_cache)
 
         # Process each month allocation
         for forecast_month, allocation_details in month_allocations.items():
@@ -223,101 +292,116 @@ def populate_fte_mapping_from_primary(
             state = allocation_details.get('state', '')
             case_type = allocation_details.get('worktype', '')
 
-            # Calculate forecast year and month label
-            if is_month_year_code(forecast_month):
-                _plain_month, forecast_year = parse_month_year_code(forecast_month)
-                forecast_month_label = _get_month_label(_plain_month, forecast_year)
-            else:
-                forecast_year = _get_year_for_month(month, year, forecast_month)
-                forecast_month_label = _get_month_label(forecast_month, forecast_year)
-            month_index = _get_month_index(month_headers, forecast_month)
-
-            record = FTEAllocationMappingModel(
-                allocation_execution_id=execution_id,
-                report_month=month,
-                report_year=year,
-                main_lob=main_lob,
-                state=state,
-                case_type=case_type,
-                call_type_id='',  # Not available in primary allocation data
-                forecast_month=forecast_month,
-                forecast_year=forecast_year,
-                forecast_month_label=forecast_month_label,
-                forecast_month_index=month_index,
-                cn=cn,
-                first_name=first_name,
-                last_name=last_name,
-                opid=opid,
-                primary_platform=primary_platform,
-                primary_market=primary_market,
-                location=location,
-                original_state=original_state,
-                worktype=worktype_from_roster,
-                new_work_type=worktype_from_roster,
-                skills=skills_str,
-                allocation_type='primary'
-            )
-            records_to_insert.append(record)
-
-    if not records_to_insert:
-        logger.info("No FTE mapping records to insert")
-        return 0
-
-    try:
-        with db_manager.SessionLocal() as session:
-            session.add_all(records_to_insert)
-            session.commit()
-
-            logger.info(f"Inserted {len(records_to_insert)} FTE mapping records (primary)")
-            return len(records_to_insert)
+            # Calculate forecast year, month label and index
+            meta = forecast_meta.get(forecast_month)
+            if meta is None:
+                meta = forecast_meta[forecast_month] = _forecast_month_meta(
+                    report_month_num, year, month_headers, forecast_month
+                )
+            forecast_year, forecast_month_label, month_index = meta
 
-    except SQLAlchemyError as e:
-        logger.error(f"Failed to insert FTE mappings: {e}", exc_info=True)
-        return 0
+            record = {
+                'allocation_execution_id': execution_id,
+                'report_month': month,
+                'report_year': year,
+                'main_lob': main_lob,
+                'state': state,
+                'case_type': case_type,
+                'call_type_id': '',  # Not available in primary allocation data
+                'forecast_month': forecast_month,
+                'forecast_year': forecast_year,
+                'forecast_month_label': forecast_month_label,
+                'forecast_month_index': month_index,
+                'cn': cn,
+                'first_name': first_name,
+                'last_name': last_name,
+                'opid': opid,
+                'primary_platform': primary_platform,
+                'primary_market': primary_market,
+                'location': location,
+                'original_state': original_state,
+                'worktype': worktype_from_roster,
+                'new_work_type': worktype_from_roster,
+                'skills': skills_str,
+                'allocation_type': 'primary'
+            }
+            yield record
 
 
-def populate_fte_mapping_from_bench(
+def populate_fte_mapping_from_primary(
     execution_id: str,
     month: str,
     year: int,
-    consolidated_changes: Dict,
+    vendor_allocations: Dict[str, Dict[str, Dict[str, str]]],
+    vendor_df: pd.DataFrame,
+    month_headers: List[str],
     worktype_vocab: List[str],
     core_utils: Any
 ) -> int:
     """
-    Populate FTE mappings from bench allocation results.
+    Populate FTE mappings from primary allocation results.
 
-    Clears existing bench mappings for (month, year) before inserting new ones.
+    Clears existing primary mappings for (month, year) and inserts the new ones
+    in a single transaction, so readers never see the period without mappings
+    and a failed insert leaves the previous mappings in place.
 
     Args:
         execution_id: Allocation execution ID
         month: Report month (e.g., "March")
         year: Report year (e.g., 2025)
-        consolidated_changes: Dict mapping (forecast_id, month_index) -> change_data
-                             change_data has: forecast_row (ForecastRowData), vendors ([VendorAllocation])
+        vendor_allocations: Dict mapping CN# -> {month: allocation_details}
+                           allocation_details has: platform (main_lob), state, worktype
+        vendor_df: Original vendor DataFrame with vendor details
+        month_headers: List of month names (e.g., ["April", "May", ...])
         worktype_vocab: List of valid worktypes for skill parsing (sorted longest-first)
         core_utils: CoreUtils instance
 
     Returns:
         Number of records inserted
     """
-    logger.info(f"Populating FTE mappings from bench allocation for {month} {year}...")
+    logger.info(f"Populating FTE mappings from primary allocation for {month} {year}...")
 
-    # Clear existing bench mappings
-    clear_fte_mappings(month, year, 'bench', core_utils)
+    SessionLocal = _fte_session_factory(core_utils)
 
-    if not consolidated_changes:
-        logger.info("No consolidated changes to populate")
+    try:
+        with SessionLocal() as session:
+            # Clear existing primary mappings (committed together with the inserts)
+            clear_fte_mappings(month, year, 'primary', core_utils, session=session)
+
+            if not vendor_allocations:
+                session.commit()
+                logger.info("No vendor allocations to populate")
+                return 0
+
+            inserted = _insert_fte_mappings(
+                session,
+                _primary_mapping_rows(
+                    execution_id, month, year, vendor_allocations, vendor_df, month_headers, worktype_vocab
+                )
+            )
+            session.commit()
+
+            if not inserted:
+                logger.info("No FTE mapping records to insert")
+                return 0
+
+            logger.info(f"Inserted {inserted} FTE mapping records (primary)")
+            return inserted
+
+    except SQLAlchemyError as e:
+        logger.error(f"Failed to insert FTE mappings: {e}", exc_info=True)
         return 0
 
-    db_manager = core_utils.get_db_manager(
-        FTEAllocationMappingModel,
-        limit=None,
-        skip=0,
-        select_columns=None
-    )
 
-    records_to_insert = []
+def _bench_mapping_rows(
+    execution_id: str,
+    month: str,
+    year: int,
+    consolidated_changes: Dict,
+    worktype_vocab: List[str]
+) -> Iterator[Dict[str, Any]]:
+    """Yield one FTE mapping row per vendor allocated by the bench allocation."""
+    skills_cache = {}
 
     for (forecast_id, month_index), change_data in consolidated_changes.items():
         forecast_row = change_data.get('forecast_row')
@@ -344,53 +428,107 @@ def populate_fte_mapping_from_bench(
             if vendor.skillset:
                 skills_str = ', '.join(sorted(vendor.skillset))
             else:
-                parsed_skills = parse_vendor_skills(new_work_type_raw, worktype_vocab)
-                skills_str = ', '.join(sorted(parsed_skills)) if parsed_skills else ''
-
-            record = FTEAllocationMappingModel(
-                allocation_execution_id=execution_id,
-                report_month=month,
-                report_year=year,
-                main_lob=main_lob,
-                state=state,
-                case_type=case_type,
-                call_type_id=call_type_id or '',
-                forecast_month=forecast_month,
-                forecast_year=forecast_year,
-                forecast_month_label=forecast_month_label,
-                forecast_month_index=month_index,
-                cn=vendor.cn,
-                first_name=vendor.first_name or '',
-                last_name=vendor.last_name or '',
-                opid='',  # Not available in VendorAllocation
-                primary_platform=vendor.platform or '',
-                primary_market='',  # Not available in VendorAllocation
-                location=vendor.location or '',
-                original_state=vendor.original_state or '',
-                worktype=new_work_type_raw,
-                new_work_type=new_work_type_raw,
-                skills=skills_str,
-                allocation_type='bench'
-            )
-            records_to_insert.append(record)
+                skills_str = _skills_string(new_work_type_raw, worktype_vocab, skills_cache)
 
-    if not records_to_insert:
-        logger.info("No FTE mapping records to insert")
-        return 0
+            record = {
+                'allocation_execution_id': execution_id,
+                'report_month': month,
+                'report_year': year,
+                'main_lob': main_lob,
+                'state': state,
+                'case_type': case_type,
+                'call_type_id': call_type_id or '',
+                'forecast_month': forecast_month,
+                'forecast_year': forecast_year,
+                'forecast_month_label': forecast_month_label,
+                'forecast_month_index': month_index,
+                'cn': vendor.cn,
+                'first_name': vendor.first_name or '',
+                'last_name': vendor.last_name or '',
+                'opid': '',  # Not available in VendorAllocation
+                'primary_platform': vendor.platform or '',
+                'primary_market': '',  # Not available in VendorAllocation
+                'location': vendor.location or '',
+                'original_state': vendor.original_state or '',
+                'worktype': new_work_type_raw,
+                'new_work_type': new_work_type_raw,
+                'skills': skills_str,
+                'allocation_type': 'bench'
+            }
+            yield record
+
+
+def populate_fte_mapping_from_bench(
+    execution_id: str,
+    month: str,
+    year: int,
+    consolidated_changes: Dict,
+    worktype_vocab: List[str],
+    core_utils: Any
+) -> int:
+    """
+    Populate FTE mappings from bench allocation results.
+
+    Clears existing bench mappings for (month, year) and inserts the new ones
+    in a single transaction (see populate_fte_mapping_from_primary).
+
+    Args:
+        execution_id: Allocation execution ID
+        month: Report month (e.g., "March")
+        year: Report year (e.g., 2025)
+        consolidated_changes: Dict mapping (forecast_id, month_index) -> change_data
+                             change_data has: forecast_row (ForecastRowData), vendors ([VendorAllocation])
+        worktype_vocab: List of valid worktypes for skill parsing (sorted longest-first)
+        core_utils: CoreUtils instance
+
+    Returns:
+        Number of records inserted
+    """
+    logger.info(f"Populating FTE mappings from bench allocation for {month} {year}...")
+
+    SessionLocal = _fte_session_factory(core_utils)
 
     try:
-        with db_manager.SessionLocal() as session:
-            session.add_all(records_to_insert)
+        with SessionLocal() as session:
+            # Clear existing bench mappings (committed together with the inserts)
+            clear_fte_mappings(month, year, 'bench', core_utils, session=session)
+
+            if not consolidated_changes:
+                session.commit()
+                logger.info("No consolidated changes to populate")
+                return 0
+
+            inserted = _insert_fte_mappings(
+                session,
+                _bench_mapping_rows(execution_id, month, year, consolidated_changes, worktype_vocab)
+            )
             session.commit()
 
-            logger.info(f"Inserted {len(records_to_insert)} FTE mapping records (bench)")
-            return len(records_to_insert)
+            if not inserted:
+                logger.info("No FTE mapping records to insert")
+                return 0
+
+            logger.info(f"Inserted {inserted} FTE mapping records (bench)")
+            return inserted
 
     except SQLAlchemyError as e:
         logger.error(f"Failed to insert FTE mappings: {e}", exc_info=True)
         return 0
 
 
+def _case_insensitive_equals(column: Any, value: str, dialect_name: str) -> Any:
+    """
+    Case-insensitive exact match of column against value (no LIKE wildcards).
+
+    MSSQL's default collation already compares case-insensitively, so plain
+    equality is used there and idx_fte_mapping_query can seek. Elsewhere
+    lower(column) is compared, which idx_fte_mapping_query_ci serves.
+    """
+    if dialect_name == 'mssql':
+        return column == value
+    return func.lower(column) == value.lower()
+
+
 def get_fte_mappings(
     report_month: str,
     report_year: int,
@@ -403,6 +541,9 @@ def get_fte_mappings(
     """
     Query FTE mappings for a specific forecast record.
 
+    The FTE rows are read in one query and the per-month and per-type counts
+    are taken from those rows, so they always agree with the listed FTEs.
+
     Args:
         report_month: Report month (e.g., "March")
         report_year: Report year (e.g., 2025)
@@ -418,94 +559,75 @@ def get_fte_mappings(
     if core_utils is None:
         core_utils = get_core_utils()
 
-    db_manager = core_utils.get_db_manager(
-        FTEAllocationMappingModel,
-        limit=None,
-        skip=0,
-        select_columns=None
-    )
+    SessionLocal = _fte_session_factory(core_utils)
 
     try:
-        with db_manager.SessionLocal() as session:
-            # Build query with case-insensitive matching
-            query = session.query(FTEAllocationMappingModel).filter(
-                and_(
-                    FTEAllocationMappingModel.report_month == report_month,
-                    FTEAllocationMappingModel.report_year == report_year,
-                    FTEAllocationMappingModel.main_lob.ilike(main_lob),
-                    FTEAllocationMappingModel.state.ilike(state),
-                    FTEAllocationMappingModel.case_type.ilike(case_type)
-                )
-            )
+        with SessionLocal() as session:
+            # Filter with case-insensitive matching on LOB, state and case type
+            dialect_name = session.get_bind().dialect.name
+            conditions = [
+                FTEAllocationMappingModel.report_month == report_month,
+                FTEAllocationMappingModel.report_year == report_year,
+                _case_insensitive_equals(FTEAllocationMappingModel.main_lob, main_lob, dialect_name),
+                _case_insensitive_equals(FTEAllocationMappingModel.state, state, dialect_name),
+                _case_insensitive_equals(FTEAllocationMappingModel.case_type, case_type, dialect_name)
+            ]
 
             # Apply optional forecast month filter
             if forecast_month_label:
-                query = query.filter(
+                conditions.append(
                     FTEAllocationMappingModel.forecast_month_label == forecast_month_label
                 )
 
-            # Order by month label and CN
-            query = query.order_by(
+            # Order by month index and CN
+            row_order = (
                 FTEAllocationMappingModel.forecast_month_index,
                 FTEAllocationMappingModel.cn
             )
 
-            results = query.all()
+            # Only the columns used below are selected, as plain rows (no ORM
+            # instances): the FTE details first, then the month label and
+            # execution ID. Streamed FTE_MAPPING_YIELD_PER rows at a time,
+            # counting as they go. Rows come in month index order, so
+            # first-seen order is month order: Apr-25, May-25, Jun-25...
+            rows = session.query(
+                *[getattr(FTEAllocationMappingModel, field) for field in FTE_DETAIL_FIELDS],
+                FTEAllocationMappingModel.forecast_month_label,
+                FTEAllocationMappingModel.allocation_execution_id
+            ).filter(and_(*conditions)).order_by(*row_order)
 
-            if not results:
-                return {
-                    'success': False,
-                    'error': 'No FTE mappings found for the specified criteria',
-                    'total_fte_count': 0,
-                    'fte_by_month': {},
-                    'forecast_months': []
-                }
-
-            # Group results by forecast month
             fte_by_month: Dict[str, Dict[str, Any]] = {}
             allocation_type_counts = {'primary': 0, 'bench': 0}
             execution_id = None
 
-            for record in results:
+            for record in rows.yield_per(FTE_MAPPING_YIELD_PER):
                 if execution_id is None:
                     execution_id = record.allocation_execution_id
 
-                month_label = record.forecast_month_label
-                if month_label not in fte_by_month:
-                    fte_by_month[month_label] = {
-                        'fte_count': 0,
-                        'ftes': []
-                    }
-
-                fte_by_month[month_label]['fte_count'] += 1
-                fte_by_month[month_label]['ftes'].append({
-                    'cn': record.cn,
-                    'first_name': record.first_name,
-                    'last_name': record.last_name,
-                    'opid': record.opid,
-                    'primary_platform': record.primary_platform,
-                    'primary_market': record.primary_market,
-                    'location': record.location,
-                    'original_state': record.original_state,
-                    'worktype': record.worktype,
-                    'new_work_type': record.new_work_type,
-                    'skills': record.skills,
-                    'allocation_type': record.allocation_type
-                })
-
+                month_entry = fte_by_month.setdefault(
+                    record.forecast_month_label, {'fte_count': 0, 'ftes': []}
+                )
+                month_entry['fte_count'] += 1
+                month_entry['ftes'].append(dict(zip(FTE_DETAIL_FIELDS, record)))
                 allocation_type_counts[record.allocation_type] = \
                     allocation_type_counts.get(record.allocation_type, 0) + 1
 
+            if not fte_by_month:
+                return {
+                    'success': False,
+                    'error': 'No FTE mappings found for the specified criteria',
+                    'total_fte_count': 0,
+                    'fte_by_month': {},
+                    'forecast_months': []
+                }
+
             return {
                 'success': True,
                 'allocation_execution_id': execution_id,
-                'total_fte_count': len(results),
+                'total_fte_count': sum(allocation_type_counts.values()),
                 'allocation_type_summary': allocation_type_counts,
                 'fte_by_month': fte_by_month,
-                'forecast_months': sorted(fte_by_month.keys(), key=lambda x: (
-                    # Sort by month index: Apr-25, May-25, Jun-25...
-                    list(fte_by_month.keys()).index(x) if x in fte_by_month else 99
-                ))
+                'forecast_months': list(fte_by_month)
             }
 
     except SQLAlchemyError as e:
@@ -6,65 +6,141 @@ showing before/after values for forecast changes.
 """
 
 import logging
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from io import BytesIO
 from typing import Dict, List, Optional, Union, Any, Tuple
 from dataclasses import dataclass
-from openpyxl import load_workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-from openpyxl.utils import get_column_letter
-from openpyxl.cell.cell import MergedCell
 
 logger = logging.getLogger(__name__)
 
 # Core field names (always in this order under each month)
 CORE_FIELDS = ["Client Forecast", "FTE Required", "FTE Available", "Capacity"]
 
+# Month abbreviation -> month number (English, independent of the process locale)
+_MONTH_TO_NUM = {
+    abbr: num for num, abbr in enumerate(
+        ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], start=1
+    )
+}
+
+# Also keyed by the upper/lower-case spellings, so common labels skip capitalize()
+_MONTH_TRIGRAM_TO_NUM = {
+    spelling: num
+    for abbr, num in _MONTH_TO_NUM.items()
+    for spelling in (abbr, abbr.upper(), abbr.lower())
+}
+
+# Sort key for month labels in an unknown format; above any year * 100 + month key
+_UNKNOWN_MONTH_KEY = 999999
+
+# Cell formats of the history export, registered once per workbook by
+# _add_history_formats() and shared by every cell written with them
+_HEADER_FORMAT = {
+    'bold': True, 'font_size': 11, 'font_color': '#FFFFFF',
+    'align': 'center', 'valign': 'vcenter', 'text_wrap': True, 'border': 1
+}
+_HISTORY_FORMATS = {
+    'month_header': {**_HEADER_FORMAT, 'bg_color': '#366092'},
+    'field_header': {**_HEADER_FORMAT, 'bg_color': '#5B9BD5'},
+    'data': {'border': 1, 'align': 'left', 'valign': 'top'},
+    'label': {'bold': True},
+}
+
+# API metric name -> display name (other metrics are title-cased)
+_METRIC_MAP = {
+    'forecast': 'Client Forecast',
+    'fte_req': 'FTE Required',
+    'fte_avail': 'FTE Available',
+    'capacity': 'Capacity',
+    'target_cph': 'Target CPH'
+}
+
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-def _parse_month_label(month_label: str) -> tuple:
+# lru_cache's C wrapper beats a Python-level dict cache here; str hashes are
+# cached on the object, so interning labels would not speed up the lookup
+@lru_cache(maxsize=256)
+def _parse_month_label(month_label: str) -> int:
     """
     Parse month label for chronological sorting.
 
+    Memoized: sorts see the same few month labels over and over. For
+    ordering many labels at once use _month_label_sort_keys, which computes
+    the same keys in one vectorized pass.
+
     Args:
         month_label: Month label like "Jun-25" or "Jun-2025"
 
     Returns:
-        Tuple of (year, month_num) for sorting
+        Sort key year * 100 + month_num (_UNKNOWN_MONTH_KEY for unknown formats)
 
     Example:
         >>> _parse_month_label("Jun-25")
-        (2025, 6)
+        202506
         >>> _parse_month_label("Dec-24")
-        (2024, 12)
+        202412
+    """
+    # Fixed "MMM-YY" / "MMM-YYYY" layout: slice out month and year
+    year_str = month_label[4:]
+    if month_label[3:4] != '-' or not 2 <= len(year_str) <= 4 or not year_str.isdecimal():
+        return _UNKNOWN_MONTH_KEY  # Sort unknown formats to end
+
+    # Parse month name to number (case-insensitive, like strptime's %b)
+    month_str = month_label[:3]
+    month_num = _MONTH_TRIGRAM_TO_NUM.get(month_str)
+    if month_num is None:
+        month_num = _MONTH_TO_NUM.get(month_str.capitalize())
+        if month_num is None:
+            return _UNKNOWN_MONTH_KEY
+
+    # Parse year (handle 2-digit or 4-digit)
+    year = int(year_str)
+    if year < 100:
+        year += 2000
+
+    return year * 100 + month_num
+
+
+def _month_label_sort_keys(labels) -> np.ndarray:
     """
-    import re
-    from datetime import datetime
+    Vectorized sort keys for many month labels.
 
-    # Try to extract month and year
-    match = re.match(r'([A-Za-z]{3})-(\d{2,4})', month_label)
-    if match:
-        month_str, year_str = match.groups()
+    Applies the same rules as _parse_month_label in one pass over the labels
+    and returns the same year * 100 + month_num keys (unknown formats get
+    _UNKNOWN_MONTH_KEY and sort last).
 
-        # Parse month name to number
-        try:
-            month_num = datetime.strptime(month_str, '%b').month
-        except ValueError:
-            # If parsing fails, return as-is
-            return (9999, 99)
+    Args:
+        labels: Array-like of month label strings (e.g., ["Jun-25", "Dec-24"])
 
-        # Parse year (handle 2-digit or 4-digit)
-        year = int(year_str)
-        if year < 100:
-            year += 2000
+    Returns:
+        int64 array of sort keys, one per label
+
+    Example:
+        >>> _month_label_sort_keys(["Jun-25", "Dec-24", "bad"])
+        array([202506, 202412, 999999])
+    """
+    labels = pd.Series(labels, dtype=object)
+    year_str = labels.str.slice(4)
+    month_num = labels.str.slice(0, 3).str.capitalize().map(_MONTH_TO_NUM)
 
-        return (year, month_num)
+    valid = (
+        (labels.str.slice(3, 4) == '-')
+        & year_str.str.len().between(2, 4)
+        & year_str.str.isdecimal()
+        & month_num.notna()
+    ).to_numpy(dtype=bool)
 
-    # Fallback: return as-is for alphabetical sort
-    return (9999, 99)  # Sort unknown formats to end
+    keys = np.full(len(labels), _UNKNOWN_MONTH_KEY, dtype=np.int64)
+    if valid.any():
+        year = year_str[valid].astype(np.int64).to_numpy()
+        year = np.where(year < 100, year + 2000, year)
+        keys[valid] = year * 100 + month_num[valid].to_numpy(dtype=np.int64)
+    return keys
 
 
 # ============================================================================
@@ -403,7 +479,7 @@ def generate_history_excel(
     # Step 1: Transform changes to pivot table structure WITH metadata
     pivot_data, month_labels, static_columns = _prepare_pivot_data(typed_changes)
 
-    # Step 2: Create Excel workbook with openpyxl
+    # Step 2: Create Excel workbook with xlsxwriter
     excel_buffer = BytesIO()
 
     # Step 3: Build correct column order to match header structure
@@ -430,33 +506,31 @@ def generate_history_excel(
         if extra_columns:
             logger.warning(f"Extra columns in pivot_data (will be ignored): {extra_columns}")
 
-    # Step 4: Create main data sheet with explicit column order
-    with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-        # Write pivot data with explicit column order
-        df_pivot = pd.DataFrame(pivot_data, columns=column_order)
+    # Step 4: Build main data with explicit column order
+    df_pivot = pd.DataFrame(pivot_data, columns=column_order)
 
-        # Fill missing field values (Forecast, FTE Required, FTE Available, Capacity) with 0
-        # Only fill month-specific columns, not static columns
-        month_columns = [col for col in column_order if col not in static_columns]
-        df_pivot[month_columns] = df_pivot[month_columns].fillna(0)
+    # Fill missing field values (Forecast, FTE Required, FTE Available, Capacity) with 0
+    # Only fill month-specific columns, not static columns
+    month_columns = [col for col in column_order if col not in static_columns]
+    df_pivot[month_columns] = df_pivot[month_columns].fillna(0)
 
-        # Write WITHOUT headers - we'll create custom multi-level headers manually
-        # Start data at row 3 (rows 1-2 for headers)
-        df_pivot.to_excel(writer, sheet_name='Changes', index=False, header=False, startrow=2)
+    summary_data = _prepare_summary_sheet(history_log_data)
 
-        # Write summary sheet
-        summary_data = _prepare_summary_sheet(history_log_data)
-        df_summary = pd.DataFrame(summary_data)
-        df_summary.to_excel(writer, sheet_name='Summary', index=False, header=False)
-
-    # Step 5: Apply multi-level headers and formatting
-    excel_buffer.seek(0)
-    _apply_multilevel_headers_and_formatting(
+    # Write-only export: stream cells and shared formats with xlsxwriter.
+    # Cell text is user data (LOB, case names), so it is always written as
+    # text, never turned into formulas or hyperlinks.
+    with pd.ExcelWriter(
         excel_buffer,
-        history_log_data,
-        month_labels,
-        static_columns
-    )
+        engine='xlsxwriter',
+        engine_kwargs={'options': {'strings_to_formulas': False, 'strings_to_urls': False}}
+    ) as writer:
+        _write_history_workbook_xlsxwriter(
+            writer.book,
+            df_pivot,
+            summary_data,
+            month_labels,
+            static_columns
+        )
 
     excel_buffer.seek(0)
     logger.info(f"Generated Excel for history log {history_log_data.id}")
@@ -482,85 +556,83 @@ def _prepare_pivot_data(changes: List[HistoryChangeRecord]) -> Tuple[List[Dict[s
     Raises:
         ValueError: If changes contain invalid field names
     """
-    # Group changes by forecast record
-    grouped_changes: Dict[tuple, Dict[str, Any]] = {}
-
-    # Track month labels encountered
-    month_labels_set = set()
-
-    for change in changes:
-        # Create composite key for grouping
-        key = (
-            change.main_lob,
-            change.state,
-            change.case_type,
-            change.case_id
-        )
-
-        if key not in grouped_changes:
-            grouped_changes[key] = {
-                'main_lob': change.main_lob,
-                'state': change.state,
-                'case_type': change.case_type,
-                'case_id': change.case_id,
-                'fields': {}
-            }
-
-        # Parse field path
-        field_name = change.field_name
-
-        # Validate field_name
-        if not field_name:
-            logger.warning(f"Empty field_name for change: {change.case_id}")
-            continue
-
-        # Determine display name
-        if '.' in field_name:
-            # Month-specific field: "Jun-25.fte_avail"
-            parts = field_name.split('.', 1)
-            if len(parts) != 2:
-                logger.warning(f"Invalid field_name format: {field_name}")
-                continue
-
-            month_label, metric = parts
-            month_labels_set.add(month_label)  # Track month label
-            metric_display = _get_metric_display_name(metric)
-            column_name = f"{month_label} {metric_display}"
-        else:
-            # Month-agnostic field: "target_cph"
-            column_name = _get_metric_display_name(field_name)
-
-        # Format value (show old in brackets if changed)
-        old_val = change.old_value
-        new_val = change.new_value
-
-        if old_val is not None and new_val is not None and str(old_val) != str(new_val):
-            display_value = f"{new_val} ({old_val})"
-        else:
-            display_value = new_val if new_val is not None else old_val
+    key_columns = ['main_lob', 'state', 'case_type', 'case_id']
+
+    # One row per change; object dtype keeps values exactly as logged (no int -> float)
+    df = pd.DataFrame(
+        [
+            (change.main_lob, change.state, change.case_type, change.case_id,
+             change.field_name, change.old_value, change.new_value)
+            for change in changes
+        ],
+        columns=[*key_columns, 'field_name', 'old_value', 'new_value'],
+        dtype=object
+    )
 
-        grouped_changes[key]['fields'][column_name] = display_value
+    # Forecast records in first-seen order (including ones with only invalid changes)
+    # (key values are read back from this frame: the MultiIndex turns None into NaN)
+    record_frame = df[key_columns].drop_duplicates()
+    record_keys = pd.MultiIndex.from_frame(record_frame)
+
+    # Validate field_name
+    empty_field = ~df['field_name'].astype(bool)
+    for case_id in df.loc[empty_field, 'case_id']:
+        logger.warning(f"Empty field_name for change: {case_id}")
+    df = df[~empty_field]
+
+    # Determine display name
+    # Month-specific field: "Jun-25.fte_avail"; month-agnostic field: "target_cph"
+    # partition('.') -> (month label, '.', metric), or (field name, '', '') without a dot
+    parts = df['field_name'].str.partition('.').reindex(columns=[0, 1, 2], fill_value='')
+    is_month_field = parts[1] == '.'
+    metric = parts[2].where(is_month_field, parts[0])
+    metric_display = metric.map(_METRIC_MAP).fillna(metric.str.replace('_', ' ', regex=False).str.title())
+    column_name = metric_display.where(~is_month_field, parts[0] + ' ' + metric_display)
+
+    # Format value (show old in brackets if changed)
+    old_val = df['old_value']
+    new_val = df['new_value']
+    changed = old_val.notna() & new_val.notna() & (old_val.astype(str) != new_val.astype(str))
+
+    display_value = new_val.where(new_val.notna(), old_val)
+    display_value[changed] = new_val[changed].astype(str) + ' (' + old_val[changed].astype(str) + ')'
+
+    # Pivot to one row per forecast record and one column per field (later changes win)
+    cells = df[key_columns].assign(column=column_name, value=display_value)
+    # unstack only materializes the (record, column) pairs that occur, unlike
+    # pivot_table(dropna=False), which builds every combination of key levels
+    cells = cells.drop_duplicates(subset=[*key_columns, 'column'], keep='last')
+    pivot = (
+        cells.set_index([*key_columns, 'column'])['value']
+        .unstack('column')
+        .reindex(index=record_keys, columns=cells['column'].unique())
+    )
 
-    # Convert to list of row dicts
+    # Convert to list of row dicts (fields a record never changed are left out)
+    field_columns = pivot.columns.tolist()
+    present = pivot.notna().to_numpy()
     pivot_rows = []
-    for (main_lob, state, case_type, case_id), record in grouped_changes.items():
+    for (main_lob, state, case_type, case_id), values, mask in zip(
+        record_frame.itertuples(index=False, name=None), pivot.to_numpy(dtype=object).tolist(), present
+    ):
         row = {
             'Main LOB': main_lob,
             'State': state,
             'Case Type': case_type,
             'Case ID': case_id
         }
-        row.update(record['fields'])
+        row.update((col, value) for col, value, has_value in zip(field_columns, values, mask) if has_value)
         pivot_rows.append(row)
 
-    # Sort month labels chronologically
-    month_labels = sorted(month_labels_set, key=_parse_month_label)
+    # Sort month labels chronologically (unknown formats last, in first-seen order)
+    unique_labels = parts.loc[is_month_field, 0].unique()
+    month_labels = unique_labels[np.argsort(_month_label_sort_keys(unique_labels), kind='stable')].tolist()
 
     # Determine static columns
     static_columns = ["Main LOB", "State", "Case Type", "Case ID"]
 
     # Check if Target CPH exists in any record
-    has_target_cph = any("Target CPH" in row for row in pivot_rows)
+    has_target_cph = "Target CPH" in field_columns
     if has_target_cph:
         static_columns.append("Target CPH")
 
@@ -589,85 +661,7 @@ def _get_metric_display_name(metric: str) -> str:
         >>> _get_metric_display_name("custom_field")
         "Custom Field"
     """
-    metric_map = {
-        'forecast': 'Client Forecast',
-        'fte_req': 'FTE Required',
-        'fte_avail': 'FTE Available',
-        'capacity': 'Capacity',
-        'target_cph': 'Target CPH'
-    }
-    return metric_map.get(metric, metric.replace('_', ' ').title())
-
-
-def _create_multilevel_headers(
-    ws,
-    month_labels: List[str],
-    static_columns: List[str],
-    core_fields: List[str]
-) -> None:
-    """
-    Create two-level headers with merged cells.
-
-    Structure:
-    Row 1: [Static cols (merged)] [Month1 (merged 4 cols)] [Month2 (merged 4 cols)] ...
-    Row 2: [Static cols (merged)] [Field1] [Field2] [Field3] [Field4] [Field1] ...
-
-    NOTE: This function assumes rows 1-2 are empty (pandas data starts at row 3).
-    It directly populates rows 1-2 without inserting any rows.
-
-    KNOWN BEHAVIOR: Excel for Mac may show a repair dialog when opening the file.
-    This is due to openpyxl's merged cell handling removing non-anchor cells from XML,
-    which Excel for Mac's strict validation flags as invalid. The file is functionally
-    correct and will open successfully after clicking "Yes" on the repair dialog.
-    All data and formatting will be preserved correctly.
-
-    Args:
-        ws: openpyxl Worksheet (with empty rows 1-2, data starting at row 3)
-        month_labels: List of month labels (e.g., ["Jun-25", "Jul-25"])
-        static_columns: List of static column names
-        core_fields: List of field names under each month
-            (e.g., ["Client Forecast", "FTE Required", "FTE Available", "Capacity"])
-    """
-    # NOTE: Rows 1-2 are empty, data starts at row 3
-    # We populate rows 1-2 directly without inserting
-
-    # Current column index
-    col_idx = 1
-    total_merges = 0
-
-    # 1. Create static column headers (merged vertically)
-    for col_name in static_columns:
-        # Write value ONLY to row 1 (anchor cell)
-        ws.cell(row=1, column=col_idx, value=col_name)
-
-        # DON'T write to row 2 - leave empty for clean merge
-
-        # Merge
-        end_col_letter = get_column_letter(col_idx)
-        ws.merge_cells(f'{end_col_letter}1:{end_col_letter}2')
-        total_merges += 1
-        col_idx += 1
-
-    # 2. Create month headers with field subheaders
-    for month_label in month_labels:
-        start_col = col_idx
-        end_col = col_idx + len(core_fields) - 1
-
-        # Write month value ONLY to anchor cell in row 1
-        ws.cell(row=1, column=start_col, value=month_label)
-
-        # Merge across columns in row 1
-        start_letter = get_column_letter(start_col)
-        end_letter = get_column_letter(end_col)
-        ws.merge_cells(f'{start_letter}1:{end_letter}1')
-        total_merges += 1
-
-        # Write field names to row 2 (no merge)
-        for field_name in core_fields:
-            ws.cell(row=2, column=col_idx, value=field_name)
-            col_idx += 1
-
-    logger.debug(f"Created multi-level headers for {len(month_labels)} months with {total_merges} merged ranges")
+    return _METRIC_MAP.get(metric, metric.replace('_', ' ').title())
 
 
 def _prepare_summary_sheet(history_log_data: HistoryLogData) -> List[Dict[str, str]]:
@@ -759,114 +753,147 @@ def _prepare_summary_sheet(history_log_data: HistoryLogData) -> List[Dict[str, s
     return summary_rows
 
 
-def _apply_multilevel_headers_and_formatting(
-    excel_buffer: BytesIO,
-    history_log_data: HistoryLogData,
+def _max_text_lengths(df: pd.DataFrame) -> List[int]:
+    """
+    Longest str() length of the values in each column (NaN/None are blank).
+
+    Computed column by column on the DataFrame before writing, so sizing
+    never walks the written cells.
+
+    Args:
+        df: DataFrame written to a sheet
+
+    Returns:
+        One length per column (0 if the column is all blank)
+    """
+    return [
+        int(values.str.len().max()) if len(values) else 0
+        for values in (column.dropna().astype(str) for _, column in df.items())
+    ]
+
+
+def _changes_column_widths(
+    df_pivot: pd.DataFrame,
     month_labels: List[str],
     static_columns: List[str]
-) -> None:
+) -> List[int]:
     """
-    Apply multi-level headers and formatting to Excel workbook.
+    Column widths for the Changes sheet: longest header or value + 2, capped at 50.
+
+    Applied with set_column by _write_history_workbook_xlsxwriter.
 
     Args:
-        excel_buffer: BytesIO with Excel data
-        history_log_data: HistoryLogData instance for metadata
+        df_pivot: Pivot data in header column order
         month_labels: List of month labels for multi-level headers
         static_columns: List of static column names
 
-    Raises:
-        Exception: If workbook loading or formatting fails
+    Returns:
+        One width per Changes column
     """
-    try:
-        wb = load_workbook(excel_buffer)
-    except Exception as e:
-        logger.error(f"Failed to load workbook for formatting: {e}", exc_info=True)
-        raise
+    header_lengths = [len(col_name) for col_name in static_columns]
+    for month_label in month_labels:
+        # Month label sits above the first field of its group
+        header_lengths.append(max(len(month_label), len(CORE_FIELDS[0])))
+        header_lengths.extend(len(field_name) for field_name in CORE_FIELDS[1:])
 
-    # Format Changes sheet
-    if 'Changes' in wb.sheetnames:
-        ws_changes = wb['Changes']
+    return [
+        min(max(header_len, value_len) + 2, 50)
+        for header_len, value_len in zip(header_lengths, _max_text_lengths(df_pivot))
+    ]
 
-        # STEP 1: Create multi-level headers (inserts row 1, shifts data down)
-        _create_multilevel_headers(
-            ws_changes,
-            month_labels,
-            static_columns,
-            CORE_FIELDS
-        )
 
-        # STEP 2: Define styles
-        header_font = Font(bold=True, size=11, color="FFFFFF")
-        month_header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        field_header_fill = PatternFill(start_color="5B9BD5", end_color="5B9BD5", fill_type="solid")
-        header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+def _summary_column_widths(summary_rows: List[Dict[str, str]]) -> List[int]:
+    """
+    Label and value column widths for the Summary sheet: longest text + 2.
+
+    Applied with set_column by _write_history_workbook_xlsxwriter.
+
+    Args:
+        summary_rows: Rows from _prepare_summary_sheet
+
+    Returns:
+        [label width, value width]
+    """
+    return [
+        max((len(row[key]) for row in summary_rows if row[key]), default=0) + 2
+        for key in ('label', 'value')
+    ]
+
+
+def _add_history_formats(workbook) -> Dict[str, Any]:
+    """
+    Register the _HISTORY_FORMATS cell formats on an xlsxwriter workbook.
+
+    Each format is added once; cells then share it (one style record in the
+    file) instead of carrying their own font/fill/border settings.
+
+    Args:
+        workbook: xlsxwriter Workbook
 
-        # STEP 3: Style row 1 (month headers + static columns)
-        for cell in ws_changes[1]:
-            if not isinstance(cell, MergedCell):
-                cell.font = header_font
-                cell.alignment = header_alignment
-                cell.border = border
-                cell.fill = month_header_fill  # Dark blue for all row 1 headers
-
-        # STEP 4: Style row 2 (field headers, including merged static cells)
-        for cell in ws_changes[2]:
-            # Skip if part of merged cell from row 1
-            if not isinstance(cell, MergedCell):
-                cell.font = header_font
-                cell.fill = field_header_fill  # Lighter blue for fields
-                cell.alignment = header_alignment
-                cell.border = border
-
-        # STEP 5: Apply borders and alignment to data rows (starts at row 3 now)
-        for row in ws_changes.iter_rows(min_row=3, max_row=ws_changes.max_row, max_col=ws_changes.max_column):
-            for cell in row:
-                cell.border = border
-                cell.alignment = Alignment(horizontal='left', vertical='top')
-
-        # STEP 6: Auto-size columns
-        for column in ws_changes.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-
-            for cell in column:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50
-            ws_changes.column_dimensions[column_letter].width = adjusted_width
-
-    # Format Summary sheet
-    if 'Summary' in wb.sheetnames:
-        ws_summary = wb['Summary']
-
-        # Bold first column (labels)
-        for row in ws_summary.iter_rows(min_row=1, max_row=ws_summary.max_row):
-            row[0].font = Font(bold=True)
-
-        # Auto-size
-        for column in ws_summary.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-
-            for cell in column:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-
-            ws_summary.column_dimensions[column_letter].width = max_length + 2
-
-    # Save changes
-    wb.save(excel_buffer)
-    logger.info("Applied multi-level headers and formatting successfully")
+    Returns:
+        Dict of format name -> xlsxwriter Format
+    """
+    return {name: workbook.add_format(properties) for name, properties in _HISTORY_FORMATS.items()}
+
+
+def _write_history_workbook_xlsxwriter(
+    workbook,
+    df_pivot: pd.DataFrame,
+    summary_rows: List[Dict[str, str]],
+    month_labels: List[str],
+    static_columns: List[str]
+) -> None:
+    """
+    Write the Changes and Summary sheets with xlsxwriter.
+
+    Changes has two header rows: static columns merged vertically, each month
+    merged across its CORE_FIELDS, with the field names below. Cells are
+    written once with shared formats. Merged ranges are written natively, so
+    Excel for Mac opens the file without a repair dialog.
+
+    Args:
+        workbook: xlsxwriter Workbook (pd.ExcelWriter(engine='xlsxwriter').book)
+        df_pivot: Pivot data in header column order
+        summary_rows: Rows from _prepare_summary_sheet
+        month_labels: List of month labels for multi-level headers
+        static_columns: List of static column names
+    """
+    formats = _add_history_formats(workbook)
+    month_header_format = formats['month_header']
+    field_header_format = formats['field_header']
+    data_format = formats['data']
+    label_format = formats['label']
+
+    # Changes sheet: two header rows, data from row 3
+    ws_changes = workbook.add_worksheet('Changes')
+
+    col_idx = 0
+    for col_name in static_columns:
+        ws_changes.merge_range(0, col_idx, 1, col_idx, col_name, month_header_format)
+        col_idx += 1
+
+    for month_label in month_labels:
+        end_col = col_idx + len(CORE_FIELDS) - 1
+        ws_changes.merge_range(0, col_idx, 0, end_col, month_label, month_header_format)
+        ws_changes.write_row(1, col_idx, CORE_FIELDS, field_header_format)
+        col_idx = end_col + 1
+
+    # NaN -> None so missing values are written as bordered blanks
+    data = df_pivot.astype(object).where(df_pivot.notna(), None)
+    for row_idx, row in enumerate(data.itertuples(index=False, name=None), start=2):
+        ws_changes.write_row(row_idx, 0, row, data_format)
+
+    for col_idx, width in enumerate(_changes_column_widths(df_pivot, month_labels, static_columns)):
+        ws_changes.set_column(col_idx, col_idx, width)
+
+    # Summary sheet: bold labels, values alongside
+    ws_summary = workbook.add_worksheet('Summary')
+    labels = [row['label'] for row in summary_rows]
+    values = [row['value'] for row in summary_rows]
+    ws_summary.write_column(0, 0, labels, label_format)
+    ws_summary.write_column(0, 1, values)
+
+    for col_idx, width in enumerate(_summary_column_widths(summary_rows)):
+        ws_summary.set_column(col_idx, col_idx, width)
+
+    logger.debug(f"Wrote {len(df_pivot)} change rows and {len(summary_rows)} summary rows with xlsxwriter")
@@ -10,6 +10,7 @@ import uuid
 import json
 from datetime import datetime
 from typing import Optional, Dict, List, Tuple
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 import pandas as pd
 
@@ -22,6 +23,9 @@ logger = get_logger(__name__)
 # Get CoreUtils singleton instance (dependency injection pattern)
 core_utils = get_core_utils()
 
+# Change rows sent per INSERT executemany batch
+HISTORY_CHANGE_INSERT_CHUNK_SIZE = 10000
+
 
 def _validate_change_record(change: Dict, index: int) -> None:
     """
@@ -171,10 +175,10 @@ def add_history_changes(
             select_columns=None
         )
 
-        # Convert changes to DataFrame format
-        change_records = []
-        for change in changes:
-            change_records.append({
+        # Convert changes to HistoryChangeModel rows
+        created_at = datetime.now()
+        change_records = [
+            {
                 'history_log_id': history_log_id,
                 'MainLOB': change['main_lob'],
                 'State': change['state'],
@@ -183,15 +187,27 @@ def add_history_changes(
                 'FieldName': change['field_name'],
                 'OldValue': str(change['old_value']) if change.get('old_value') is not None else None,
                 'NewValue': str(change['new_value']) if change.get('new_value') is not None else None,
-                'Delta': change.get('delta'),
+                'Delta': float(change['delta']) if change.get('delta') is not None else None,
                 'MonthLabel': change.get('month_label'),
-                'CreatedDateTime': datetime.now()
-            })
+                'CreatedDateTime': created_at
+            }
+            for change in changes
+        ]
 
-        # Bulk insert
+        # Bulk insert: Core INSERT executemany batches in one transaction,
+        # without building a DataFrame or ORM instances per change
         logger.info(f"Inserting {len(change_records)} HistoryChangeModel records for history_log_id {history_log_id}")
-        df = pd.DataFrame(change_records)
-        db_manager.save_to_db(df, replace=False)
+        insert_changes = insert(HistoryChangeModel.__table__)
+        with db_manager.SessionLocal() as session:
+            try:
+                for start in range(0, len(change_records), HISTORY_CHANGE_INSERT_CHUNK_SIZE):
+                    session.execute(
+                        insert_changes, change_records[start:start + HISTORY_CHANGE_INSERT_CHUNK_SIZE]
+                    )
+                session.commit()
+            except SQLAlchemyError:
+                session.rollback()
+                raise
 
         logger.info(f"Added {len(changes)} changes to history log {history_log_id}")
 
@@ -208,7 +224,8 @@ def create_complete_history_log(
     user_notes: Optional[str],
     modified_records: List[Dict],
     months_dict: Dict[str, str],
-    summary_data: Dict
+    summary_data: Dict,
+    changes: Optional[List[Dict]] = None
 ) -> str:
     """
     Create complete history log with changes in one operation.
@@ -225,6 +242,9 @@ def create_complete_history_log(
         modified_records: List of modified record dicts
         months_dict: Month index mapping (e.g., {"month1": "Jun-25"})
         summary_data: Pre-calculated summary data dict
+        changes: Pre-extracted field-level changes (e.g. from
+                 extract_changes_and_summary()); extracted from
+                 modified_records when omitted
 
     Returns:
         history_log_id: UUID of created history log
@@ -249,7 +269,8 @@ def create_complete_history_log(
 
     try:
         # Extract changes from modified records
-        changes = extract_specific_changes(modified_records, months_dict)
+        if changes is None:
+            changes = extract_specific_changes(modified_records, months_dict)
 
         # Create history log
         history_log_id = create_history_log(
@@ -0,0 +1,120 @@
+"""
+Compiled FTE Required / Capacity kernel for bulk reallocation previews.
+
+Fuses the fte_req and capacity formulas into a single native loop when numba
+is installed; otherwise falls back to the NumPy array functions in
+capacity_calculations. Both paths produce identical results to the scalar
+calculate_fte_required / calculate_capacity functions.
+"""
+
+import math
+import logging
+from typing import Tuple
+
+import numpy as np
+
+from code.logics.capacity_calculations import (
+    calculate_fte_required_array,
+    calculate_capacity_array,
+    validate_config_arrays
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def _fte_capacity_loop(forecast, base_fte, cph, wd, wh, shr, recalc_fte_req, out_fte_req, out_capacity):
+    """
+    Element-wise fte_req/capacity over flat float64 arrays.
+
+    Operation order mirrors the scalar formulas exactly (no fastmath), so
+    floor/ceil boundaries land on the same side. Elements are independent,
+    so the loop is split across threads when compiled.
+    """
+    for i in prange(forecast.size):
+        if recalc_fte_req[i]:
+            if forecast[i] == 0 or cph[i] == 0:
+                out_fte_req[i] = 0
+            else:
+                out_fte_req[i] = math.ceil(forecast[i] / (wd[i] * wh[i] * (1 - shr[i]) * cph[i]))
+        out_capacity[i] = math.floor(base_fte[i] * wd[i] * wh[i] * (1 - shr[i]) * cph[i])
+
+
+if NUMBA_AVAILABLE:
+    _fte_capacity_loop = njit(cache=True, parallel=True)(_fte_capacity_loop)
+
+
+def compute_fte_req_and_capacity(
+    forecast: np.ndarray,
+    base_fte: np.ndarray,
+    fte_req: np.ndarray,
+    recalc_rows: np.ndarray,
+    working_days: np.ndarray,
+    work_hours: np.ndarray,
+    shrinkage: np.ndarray,
+    target_cph: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Recalculate FTE Required and base Capacity for (n_records, n_months) arrays.
+
+    Args:
+        forecast: Forecast values, shape (N, M)
+        base_fte: FTE Available excluding ramp FTE, shape (N, M)
+        fte_req: Current FTE Required, shape (N, M); kept for rows not recalculated
+        recalc_rows: Boolean mask of shape (N,) selecting rows whose fte_req is recalculated
+        working_days: Working days, shape (N, M)
+        work_hours: Work hours, shape (N, M)
+        shrinkage: Shrinkage, shape (N, M)
+        target_cph: Target CPH, shape (N, 1)
+
+    Returns:
+        Tuple of (fte_req int64 array, base capacity float64 array), both shape (N, M)
+
+    Raises:
+        ValueError: If any input is invalid
+    """
+    recalc_rows = np.asarray(recalc_rows, dtype=bool)
+
+    if not NUMBA_AVAILABLE:
+        fte_req = fte_req.astype(np.int64, copy=True)
+        if recalc_rows.any():
+            fte_req[recalc_rows] = calculate_fte_required_array(
+                forecast[recalc_rows],
+                working_days[recalc_rows],
+                work_hours[recalc_rows],
+                shrinkage[recalc_rows],
+                target_cph[recalc_rows],
+            )
+        capacity = calculate_capacity_array(base_fte, working_days, work_hours, shrinkage, target_cph)
+        return fte_req, capacity
+
+    # Same validation as the NumPy path, done once up front
+    if np.any(base_fte < 0):
+        raise ValueError(f"fte_avail cannot be negative: {base_fte[base_fte < 0][0]}")
+    if np.any(target_cph < 0):
+        raise ValueError(f"target_cph cannot be negative: {target_cph[target_cph < 0][0]}")
+    if np.any(forecast[recalc_rows] < 0):
+        raise ValueError(f"forecast cannot be negative: {forecast[recalc_rows][forecast[recalc_rows] < 0][0]}")
+    validate_config_arrays(working_days, work_hours, shrinkage)
+
+    shape = forecast.shape
+    out_fte_req = np.ascontiguousarray(fte_req, dtype=np.int64).ravel().copy()
+    out_capacity = np.empty(forecast.size, dtype=np.float64)
+    _fte_capacity_loop(
+        np.ascontiguousarray(forecast, dtype=np.float64).ravel(),
+        np.ascontiguousarray(base_fte, dtype=np.float64).ravel(),
+        np.ascontiguousarray(np.broadcast_to(target_cph, shape), dtype=np.float64).ravel(),
+        np.ascontiguousarray(working_days, dtype=np.float64).ravel(),
+        np.ascontiguousarray(work_hours, dtype=np.float64).ravel(),
+        np.ascontiguousarray(shrinkage, dtype=np.float64).ravel(),
+        np.repeat(recalc_rows, shape[1]),
+        out_fte_req,
+        out_capacity,
+    )
+    return out_fte_req.reshape(shape), out_capacity.reshape(shape)
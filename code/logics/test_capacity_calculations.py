@@ -7,9 +7,12 @@ correctness, validation, and edge case handling.
 
 import pytest
 import math
+import numpy as np
 from code.logics.capacity_calculations import (
     calculate_fte_required,
     calculate_capacity,
+    calculate_fte_required_array,
+    calculate_capacity_array,
     validate_month_config
 )
 
@@ -406,3 +409,56 @@ class TestIntegration:
 
         # Should need exactly the same (or very close due to ceiling)
         assert fte_needed == fte_available or fte_needed == fte_available + 1
+
+
+class TestVectorizedCalculations:
+    """Test suite for the array variants of the FTE and capacity formulas."""
+
+    CONFIGS = [
+        {'working_days': 21, 'work_hours': 9, 'shrinkage': 0.10},
+        {'working_days': 20, 'work_hours': 8, 'shrinkage': 0.15},
+        {'working_days': 22, 'work_hours': 7.5, 'shrinkage': 0.0},
+    ]
+
+    def _config_arrays(self):
+        wd = np.array([c['working_days'] for c in self.CONFIGS], dtype=float)
+        wh = np.array([c['work_hours'] for c in self.CONFIGS], dtype=float)
+        shr = np.array([c['shrinkage'] for c in self.CONFIGS], dtype=float)
+        return wd, wh, shr
+
+    def test_fte_required_matches_scalar(self):
+        """Array results equal the scalar function element for element."""
+        wd, wh, shr = self._config_arrays()
+        forecast = np.array([[1000, 0, 50000], [12345, 999, 1]], dtype=float)
+        cph = np.array([[50.0], [0.0]])
+
+        result = calculate_fte_required_array(forecast, wd, wh, shr, cph)
+
+        for i in range(forecast.shape[0]):
+            for j, config in enumerate(self.CONFIGS):
+                assert result[i, j] == calculate_fte_required(forecast[i, j], config, cph[i, 0])
+
+    def test_capacity_matches_scalar(self):
+        """Array results equal the scalar function element for element."""
+        wd, wh, shr = self._config_arrays()
+        fte_avail = np.array([[10, 0, 7], [3, 25, 1]], dtype=float)
+        cph = np.array([[50.0], [12.5]])
+
+        result = calculate_capacity_array(fte_avail, wd, wh, shr, cph)
+
+        for i in range(fte_avail.shape[0]):
+            for j, config in enumerate(self.CONFIGS):
+                assert result[i, j] == calculate_capacity(fte_avail[i, j], config, cph[i, 0])
+
+    def test_negative_fte_avail_raises_error(self):
+        """Negative FTE in any element should raise ValueError."""
+        wd, wh, shr = self._config_arrays()
+        with pytest.raises(ValueError, match="fte_avail cannot be negative"):
+            calculate_capacity_array(np.array([1.0, -1.0, 2.0]), wd, wh, shr, np.array([10.0]))
+
+    def test_invalid_shrinkage_raises_error(self):
+        """Shrinkage outside [0, 1) in any element should raise ValueError."""
+        wd, wh, _ = self._config_arrays()
+        shr = np.array([0.1, 1.0, 0.2])
+        with pytest.raises(ValueError, match="shrinkage must be between"):
+            calculate_fte_required_array(np.array([1.0, 1.0, 1.0]), wd, wh, shr, np.array([10.0]))
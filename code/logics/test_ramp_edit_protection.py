@@ -46,11 +46,16 @@ SIX_MONTH_CONFIG = {f"month{i}": STD_CONFIG.copy() for i in range(1, 7)}
 
 
 def make_session_mock(query_result):
-    """Context-manager-compatible session that returns query_result from .all()."""
+    """Context-manager-compatible session that returns query_result from .all() / .yield_per()."""
     session = MagicMock()
     session.__enter__ = MagicMock(return_value=session)
     session.__exit__ = MagicMock(return_value=False)
-    session.query.return_value.filter.return_value.all.return_value = query_result
+    # Chainable query builder: filter/options/order_by all return the same query
+    query = session.query.return_value
+    for method in ("filter", "options", "order_by"):
+        getattr(query, method).return_value = query
+    query.all.return_value = query_result
+    query.yield_per.return_value = query_result
     return session
 
 
@@ -513,6 +518,70 @@ class TestFTECapacitySplit:
         # Ramp-split result must be less than naive (base has fewer FTEs, ramp adds less)
         assert cap_with_ramp < cap_naive
 
+    @staticmethod
+    def _run_cph_change_preview(mock_months, mock_work_type, mock_config):
+        mock_months.return_value = MONTHS_DICT
+        mock_work_type.return_value = "Domestic"
+        mock_config.return_value = SIX_MONTH_CONFIG
+
+        db_rec = make_forecast_row(fte_avail=27, target_cph=10.0)
+        cu = make_core_utils_mock(make_session_mock([db_rec]))
+
+        rec = make_realloc_input()
+        rec["target_cph"] = 12
+        rec["target_cph_change"] = 2
+        from code.logics.forecast_reallocation_transformer import calculate_reallocation_preview
+        result = calculate_reallocation_preview("January", 2026, [rec], cu)
+        return result.modified_records[0].months["Jan-26"].capacity
+
+    @patch("code.logics.forecast_reallocation_transformer.get_ramp_contribution_for_month")
+    @patch("code.logics.forecast_reallocation_transformer.get_month_config_for_forecast")
+    @patch("code.logics.forecast_reallocation_transformer._get_work_type_from_main_lob")
+    @patch("code.logics.forecast_reallocation_transformer.get_months_dict")
+    def test_cph_change_without_ramp_skips_ramp_requery(
+        self, mock_months, mock_work_type, mock_config, mock_ramp
+    ):
+        """
+        With no ramp contribution at the old CPH, the new-CPH contribution is
+        also (0, 0.0), so only the 6 ramp-protection lookups run.
+        """
+        mock_ramp.return_value = (0, 0.0)
+        cap = self._run_cph_change_preview(mock_months, mock_work_type, mock_config)
+
+        assert mock_ramp.call_count == 6
+        assert cap == expected_capacity(27, cph=12.0)
+
+    @patch("code.logics.forecast_reallocation_transformer.get_ramp_contribution_for_month")
+    @patch("code.logics.forecast_reallocation_transformer.get_month_config_for_forecast")
+    @patch("code.logics.forecast_reallocation_transformer._get_work_type_from_main_lob")
+    @patch("code.logics.forecast_reallocation_transformer.get_months_dict")
+    def test_cph_change_with_ramp_requeries_at_new_cph(
+        self, mock_months, mock_work_type, mock_config, mock_ramp
+    ):
+        """Active ramps are re-fetched with the new CPH for the capacity split."""
+        mock_ramp.side_effect = lambda forecast_id, month_key, target_cph, config: (9, 100.0 * target_cph)
+        cap = self._run_cph_change_preview(mock_months, mock_work_type, mock_config)
+
+        assert mock_ramp.call_count == 12
+        assert {c.kwargs["target_cph"] for c in mock_ramp.call_args_list} == {10.0, 12.0}
+        assert cap == int(expected_capacity(18, cph=12.0) + 1200.0)
+
+    @patch("code.logics.forecast_reallocation_transformer.PREVIEW_PARALLEL_MIN_RECORDS", 1)
+    @patch("code.logics.forecast_reallocation_transformer.get_ramp_contribution_for_month")
+    @patch("code.logics.forecast_reallocation_transformer.get_month_config_for_forecast")
+    @patch("code.logics.forecast_reallocation_transformer._get_work_type_from_main_lob")
+    @patch("code.logics.forecast_reallocation_transformer.get_months_dict")
+    def test_thread_pool_path_matches_serial_split(
+        self, mock_months, mock_work_type, mock_config, mock_ramp
+    ):
+        """Records prepared on the thread pool get the same ramp-split capacity."""
+        ramp_cap = 9 * 1.0 * 10.0 * 9.0 * 0.90 * 5  # 3645.0
+        mock_ramp.return_value = (9, ramp_cap)
+        cap = self._run_preview_and_get_month1_capacity(
+            mock_months, mock_work_type, mock_config, mock_ramp
+        )
+        assert cap == int(expected_capacity(18) + ramp_cap)
+
 
 # ============================================================================
 # 5. CPH preview — ramp-aware capacity split
@@ -0,0 +1,54 @@
+"""
+Shared fixtures for the code.logics tests.
+
+  - sqlite_session_factory: sessionmaker over a fresh in-memory SQLite database
+  - history_changes_db: HistoryChangeModel table wired into history_logger.core_utils
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlmodel import SQLModel, create_engine
+from sqlalchemy.orm import sessionmaker
+
+from code.logics import history_logger
+from code.logics.db import HistoryChangeModel
+
+
+SQLITE_URL = "sqlite://"  # in-memory, discarded after each test
+
+
+@pytest.fixture
+def sqlite_session_factory():
+    """
+    Return a callable that creates the given models' tables in a new in-memory
+    SQLite database and returns a sessionmaker bound to it.
+
+    Tables are dropped and engines disposed when the test finishes.
+    """
+    created = []
+
+    def make(*models):
+        tables = [model.__table__ for model in models]
+        engine = create_engine(SQLITE_URL, connect_args={"check_same_thread": False})
+        SQLModel.metadata.create_all(bind=engine, tables=tables)
+        created.append((engine, tables))
+        return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    yield make
+
+    for engine, tables in created:
+        SQLModel.metadata.drop_all(bind=engine, tables=tables)
+        engine.dispose()
+
+
+@pytest.fixture
+def history_changes_db(sqlite_session_factory):
+    SessionLocal = sqlite_session_factory(HistoryChangeModel)
+
+    db_manager = MagicMock()
+    db_manager.SessionLocal = SessionLocal
+    utils = MagicMock()
+    utils.get_db_manager.return_value = db_manager
+    with patch.object(history_logger, "core_utils", utils):
+        yield SessionLocal
@@ -0,0 +1,61 @@
+"""
+Tests for add_history_changes (code.logics.history_logger).
+
+Covers:
+  - Changes are inserted with stringified old/new values and float deltas
+  - Changes split across HISTORY_CHANGE_INSERT_CHUNK_SIZE batches are all inserted
+  - Invalid changes raise before anything is written
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from code.logics import history_logger
+from code.logics.db import HistoryChangeModel
+from code.logics.history_logger import add_history_changes
+
+
+def _change(i, **fields):
+    return {
+        "main_lob": "Amisys Medicaid DOMESTIC",
+        "state": "CA",
+        "case_type": "Claims",
+        "case_id": f"CASE-{i}",
+        "field_name": "Jun-25.fte_avail",
+        "old_value": 5,
+        "new_value": 7,
+        "delta": np.int64(2),
+        "month_label": "Jun-25",
+        **fields,
+    }
+
+
+def _rows(history_changes_db):
+    with history_changes_db() as session:
+        return session.query(HistoryChangeModel).order_by(HistoryChangeModel.id).all()
+
+
+def test_inserts_changes(history_changes_db):
+    add_history_changes("log-1", [_change(0), _change(1, field_name="target_cph", old_value=None, month_label=None)])
+
+    rows = _rows(history_changes_db)
+    assert [r.CaseID for r in rows] == ["CASE-0", "CASE-1"]
+    assert (rows[0].OldValue, rows[0].NewValue, rows[0].Delta) == ("5", "7", 2.0)
+    assert rows[1].OldValue is None and rows[1].MonthLabel is None
+    assert {r.history_log_id for r in rows} == {"log-1"}
+
+
+def test_all_batches_are_inserted(history_changes_db):
+    with patch.object(history_logger, "HISTORY_CHANGE_INSERT_CHUNK_SIZE", 2):
+        add_history_changes("log-1", [_change(i) for i in range(5)])
+
+    assert [r.CaseID for r in _rows(history_changes_db)] == [f"CASE-{i}" for i in range(5)]
+
+
+def test_invalid_change_writes_nothing(history_changes_db):
+    with pytest.raises(ValueError, match="index 1 missing required keys"):
+        add_history_changes("log-1", [_change(0), {"main_lob": "x"}])
+
+    assert _rows(history_changes_db) == []
@@ -0,0 +1,71 @@
+"""
+Tests for DBManager.get_distinct_values_multi (code.logics.db).
+
+Covers:
+  - Per-column values match what get_distinct_values returns for each column
+  - Results are cached, so a repeat call does not hit the database
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from code.logics import db as db_module
+from code.logics.db import DBManager, ForecastModel
+
+
+COLUMNS = [
+    "Centene_Capacity_Plan_Main_LOB",
+    "Centene_Capacity_Plan_State",
+    "Centene_Capacity_Plan_Case_Type",
+]
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    url = f"sqlite:///{tmp_path / 'distinct.db'}"
+    keys_before = set(db_module._engine_cache.keys())
+    db_module._distinct_values_cache.clear()
+
+    manager = DBManager(url, ForecastModel, 0, 0, None)
+    with manager.SessionLocal() as session:
+        for main_lob, state, case_type, month in [
+            ("Amisys Medicaid DOMESTIC", "CA", "Claims", "April"),
+            ("Amisys Medicaid DOMESTIC", "TX", "Claims", "April"),
+            ("Facets Medicare GLOBAL", "", "Appeals", "April"),
+            ("Other LOB", "NY", "Claims", "May"),
+        ]:
+            session.add(ForecastModel(
+                Centene_Capacity_Plan_Main_LOB=main_lob,
+                Centene_Capacity_Plan_State=state,
+                Centene_Capacity_Plan_Case_Type=case_type,
+                Month=month,
+                Year=2025,
+                UploadedFile="forecast.xlsx",
+                CreatedBy="tester",
+                UpdatedBy="tester",
+            ))
+        session.commit()
+
+    yield manager
+
+    db_module._distinct_values_cache.clear()
+    for key in set(db_module._engine_cache.keys()) - keys_before:
+        db_module._engine_cache.pop(key, None)
+
+
+def test_matches_per_column_distinct_values(db_manager):
+    result = db_manager.get_distinct_values_multi(COLUMNS, month="April", year=2025)
+
+    assert result == {
+        column: db_manager.get_distinct_values(column, month="April", year=2025)
+        for column in COLUMNS
+    }
+    assert result["Centene_Capacity_Plan_State"] == ["CA", "TX"]
+
+
+def test_repeat_call_is_cached(db_manager):
+    first = db_manager.get_distinct_values_multi(COLUMNS, month="April", year=2025)
+
+    with patch.object(db_manager, "SessionLocal", side_effect=AssertionError("queried again")):
+        assert db_manager.get_distinct_values_multi(COLUMNS, month="April", year=2025) == first
@@ -0,0 +1,67 @@
+"""
+Tests for extract_changes_and_summary (code.logics.bench_allocation_transformer).
+
+Covers:
+  - Changes and summary equal extract_specific_changes / calculate_summary_data
+  - Invalid records raise ValueError like the separate functions
+"""
+
+import pytest
+
+from code.logics.bench_allocation_transformer import (
+    calculate_summary_data,
+    extract_changes_and_summary,
+    extract_specific_changes,
+)
+
+
+MONTHS_DICT = {f"month{i}": label for i, label in enumerate(
+    ["Jun-25", "Jul-25", "Aug-25", "Sep-25", "Oct-25", "Nov-25"], start=1
+)}
+
+
+def _record(case_id, **fields):
+    return {
+        "main_lob": "Amisys Medicaid DOMESTIC",
+        "state": "CA",
+        "case_type": "Claims",
+        "case_id": case_id,
+        **fields,
+    }
+
+
+def test_matches_separate_extract_and_summary():
+    records = [
+        _record(
+            "A",
+            target_cph=12,
+            target_cph_change=2,
+            modified_fields=["target_cph", "Jun-25.fte_avail", "Jun-25.capacity"],
+            **{
+                "Jun-25": {"forecast": 100, "fte_avail": 7, "fte_avail_change": 2,
+                           "capacity": 400, "capacity_change": 50},
+                "Aug-25": {"fte_req": 3},
+            },
+        ),
+        _record("B", modified_fields=["Nov-25.forecast"], **{"Nov-25": {"forecast": 40, "forecast_change": -10}}),
+        _record("C", modified_fields=[]),
+    ]
+
+    changes, summary = extract_changes_and_summary(records, MONTHS_DICT, "April", 2025)
+
+    assert changes == extract_specific_changes(records, MONTHS_DICT)
+    assert summary == calculate_summary_data(records, MONTHS_DICT, "April", 2025)
+    assert len(changes) == 4
+
+
+def test_invalid_records_raise_value_error():
+    with pytest.raises(ValueError, match="missing required keys"):
+        extract_changes_and_summary([{"main_lob": "X"}], MONTHS_DICT, "April", 2025)
+
+    with pytest.raises(ValueError, match="not found or not a dict"):
+        extract_changes_and_summary(
+            [_record("A", modified_fields=["Jun-25.fte_avail"])], MONTHS_DICT, "April", 2025
+        )
+
+    with pytest.raises(ValueError, match="Invalid year parameter"):
+        extract_changes_and_summary([], MONTHS_DICT, "April", "2025")
@@ -0,0 +1,58 @@
+"""
+Tests for the snapshot change-classification kernel (code.logics.forecast_compare_kernel).
+
+Covers:
+  - The loop body (run as plain Python here) matches the NumPy path
+  - Update rows flag every field of a changed month; other rows flag only non-zero deltas
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from code.logics import forecast_compare_kernel as kernel
+
+
+def _inputs():
+    # Target_CPH + 2 months x 2 fields
+    new_arr = np.array([
+        [10, 5, 0, 0, 0],   # update: month 1 field 1 changed, cph unchanged
+        [12, 0, 0, 3, 3],   # update: cph changed, month 2 unchanged
+        [0, 0, 7, 0, 0],    # addition
+        [0, 0, 0, 0, 0],    # deletion
+    ], dtype=float)
+    old_arr = np.array([
+        [10, 4, 0, 0, 0],
+        [10, 0, 0, 3, 3],
+        [0, 0, 0, 0, 0],
+        [8, 0, 0, 2, 0],
+    ], dtype=float)
+    is_update = np.array([True, True, False, False])
+    return new_arr, old_arr, is_update
+
+
+@pytest.mark.parametrize("numba_available", [True, False])
+def test_classifies_changes(numba_available):
+    new_arr, old_arr, is_update = _inputs()
+
+    # With NUMBA_AVAILABLE forced on and numba absent, the loop runs as plain Python
+    with patch.object(kernel, "NUMBA_AVAILABLE", numba_available):
+        delta, changed, has_change = kernel.classify_snapshot_changes(new_arr, old_arr, is_update, 2)
+
+    np.testing.assert_array_equal(delta, new_arr - old_arr)
+    np.testing.assert_array_equal(changed, [
+        [False, True, True, False, False],
+        [True, False, False, False, False],
+        [False, False, True, False, False],
+        [True, False, False, True, False],
+    ])
+    np.testing.assert_array_equal(has_change, [True, True, True, True])
+
+
+def test_unchanged_rows_have_no_change():
+    new_arr = np.array([[10, 5, 0]], dtype=float)
+
+    _, changed, has_change = kernel.classify_snapshot_changes(new_arr, new_arr.copy(), [True], 2)
+
+    assert not changed.any() and not has_change.any()
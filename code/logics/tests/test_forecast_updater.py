@@ -0,0 +1,106 @@
+"""
+Tests for update_forecast_from_modified_records (code.logics.forecast_updater).
+
+Covers:
+  - Month fields and target_cph are written to the matching row only
+  - Records updating different column sets are applied in one call
+  - Unknown month labels are skipped; missing rows and required fields raise
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from code.logics.db import ForecastModel
+from code.logics.exceptions import ForecastRecordNotFoundException
+from code.logics.forecast_updater import update_forecast_from_modified_records
+
+
+MONTHS_DICT = {"month1": "Jun-25", "month2": "Jul-25"}
+
+
+@pytest.fixture
+def session_factory(sqlite_session_factory):
+    SessionLocal = sqlite_session_factory(ForecastModel)
+
+    with SessionLocal() as session:
+        for i in range(3):
+            session.add(ForecastModel(
+                Centene_Capacity_Plan_Main_LOB="Amisys Medicaid DOMESTIC",
+                Centene_Capacity_Plan_State=f"S{i}",
+                Centene_Capacity_Plan_Case_Type="Claims",
+                Centene_Capacity_Plan_Call_Type_ID=f"CASE-{i}",
+                Centene_Capacity_Plan_Target_CPH=10,
+                Month="April",
+                Year=2025,
+                UploadedFile="forecast.xlsx",
+                CreatedBy="tester",
+                UpdatedBy="tester",
+            ))
+        session.commit()
+
+    return SessionLocal
+
+
+@pytest.fixture
+def core_utils(session_factory):
+    db_manager = MagicMock()
+    db_manager.SessionLocal = session_factory
+    utils = MagicMock()
+    utils.get_db_manager.return_value = db_manager
+    return utils
+
+
+def _record(i, **fields):
+    return {
+        "main_lob": "Amisys Medicaid DOMESTIC",
+        "state": f"S{i}",
+        "case_type": "Claims",
+        "case_id": f"CASE-{i}",
+        **fields,
+    }
+
+
+def _rows(session_factory):
+    with session_factory() as session:
+        return {row.Centene_Capacity_Plan_Call_Type_ID: row for row in session.query(ForecastModel)}
+
+
+def test_updates_month_fields_and_target_cph(session_factory, core_utils):
+    records = [
+        _record(
+            0,
+            target_cph=12,
+            modified_fields=["target_cph", "Jun-25.fte_avail", "Jul-25.capacity", "Aug-25.fte_avail"],
+            **{"Jun-25": {"fte_avail": 7}, "Jul-25": {"capacity": 400}},
+        ),
+        _record(2, modified_fields=["Jul-25.fte_req"], **{"Jul-25": {"fte_req": 3}}),
+    ]
+
+    assert update_forecast_from_modified_records(records, MONTHS_DICT, "April", 2025, core_utils)
+
+    rows = _rows(session_factory)
+    assert rows["CASE-0"].Centene_Capacity_Plan_Target_CPH == 12
+    assert rows["CASE-0"].FTE_Avail_Month1 == 7
+    assert rows["CASE-0"].Capacity_Month2 == 400
+    assert rows["CASE-2"].FTE_Required_Month2 == 3
+    assert rows["CASE-1"].Centene_Capacity_Plan_Target_CPH == 10
+    assert rows["CASE-1"].FTE_Required_Month2 is None
+
+
+def test_missing_row_raises_and_writes_nothing(session_factory, core_utils):
+    records = [
+        _record(0, target_cph=12, modified_fields=["target_cph"]),
+        _record(9, target_cph=12, modified_fields=["target_cph"]),
+    ]
+
+    with pytest.raises(ForecastRecordNotFoundException):
+        update_forecast_from_modified_records(records, MONTHS_DICT, "April", 2025, core_utils)
+
+    assert _rows(session_factory)["CASE-0"].Centene_Capacity_Plan_Target_CPH == 10
+
+
+def test_missing_required_fields_raises(core_utils):
+    with pytest.raises(ValueError, match="index 0 missing required fields"):
+        update_forecast_from_modified_records(
+            [{"main_lob": "Amisys Medicaid DOMESTIC"}], MONTHS_DICT, "April", 2025, core_utils
+        )
@@ -0,0 +1,249 @@
+"""
+Tests for forecast upload history (code.logics.forecast_upload_history).
+
+Covers:
+  - capture_forecast_snapshot returns short column names, NULL months as 0
+  - capture_forecast_snapshot returns None when the period has no rows
+  - capture_forecast_snapshot joins rows streamed in several batches
+  - compare_forecast_snapshots reports additions, deletions and updated months,
+    and leaves unchanged records out
+  - compare_forecast_snapshots compares against the first of duplicate old keys
+  - compare_forecast_snapshots treats every record of a new upload as added,
+    with missing values as 0
+  - compare_forecast_snapshots handles empty uploads (an empty upload with long
+    column names reports every old record as deleted) and rejects missing key
+    columns
+  - create_forecast_upload_history_log logs the same changes and summary as the
+    bench allocation extract_specific_changes / calculate_summary_data, with
+    the same value types (integer metrics stay int)
+  - Stored history OldValue/NewValue strings keep integers as "100", not "100.0"
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from code.logics import forecast_upload_history
+from code.logics.db import ForecastModel, HistoryChangeModel
+from code.logics.bench_allocation_transformer import calculate_summary_data, extract_specific_changes
+from code.logics.forecast_upload_history import (
+    FORECAST_COLUMN_MAPPING,
+    SNAPSHOT_METRIC_COLUMNS,
+    capture_forecast_snapshot,
+    compare_forecast_snapshots,
+    create_forecast_upload_history_log,
+)
+
+
+MONTHS_DICT = {"month1": "Jun-25", "month2": "Jul-25"}
+SIX_MONTHS_DICT = {f"month{i}": label for i, label in enumerate(
+    ["Jun-25", "Jul-25", "Aug-25", "Sep-25", "Oct-25", "Nov-25"], start=1
+)}
+
+
+@pytest.fixture
+def core_utils(sqlite_session_factory):
+    SessionLocal = sqlite_session_factory(ForecastModel)
+
+    with SessionLocal() as session:
+        for i, month in enumerate(["April", "April", "May"]):
+            session.add(ForecastModel(
+                Centene_Capacity_Plan_Main_LOB="Amisys Medicaid DOMESTIC",
+                Centene_Capacity_Plan_State=f"S{i}",
+                Centene_Capacity_Plan_Case_Type="Claims",
+                Centene_Capacity_Plan_Call_Type_ID=f"CASE-{i}",
+                Centene_Capacity_Plan_Target_CPH=10,
+                Client_Forecast_Month1=100 + i,
+                FTE_Avail_Month6=i,
+                Month=month,
+                Year=2025,
+                UploadedFile="forecast.xlsx",
+                CreatedBy="tester",
+                UpdatedBy="tester",
+            ))
+        session.commit()
+
+    db_manager = MagicMock()
+    db_manager.SessionLocal = SessionLocal
+    utils = MagicMock()
+    utils.get_db_manager.return_value = db_manager
+    return utils
+
+
+def test_snapshot_uses_short_names_and_zero_fills_months(core_utils):
+    df = capture_forecast_snapshot("April", 2025, core_utils)
+
+    assert list(df.columns) == [
+        "Main_LOB", "State", "Case_Type", "Case_ID", "Target_CPH", *SNAPSHOT_METRIC_COLUMNS
+    ]
+    assert df["Case_ID"].tolist() == ["CASE-0", "CASE-1"]
+    assert df["Client_Forecast_Month1"].tolist() == [100, 101]
+    assert df["FTE_Avail_Month6"].tolist() == [0, 1]
+    assert df["Capacity_Month3"].tolist() == [0, 0]
+
+
+def test_snapshot_is_none_for_empty_period(core_utils):
+    assert capture_forecast_snapshot("June", 2025, core_utils) is None
+
+
+def test_snapshot_joins_streamed_batches(core_utils):
+    with patch.object(forecast_upload_history, "SNAPSHOT_YIELD_PER", 1):
+        df = capture_forecast_snapshot("April", 2025, core_utils)
+
+    assert df.index.tolist() == [0, 1]
+    assert df["Client_Forecast_Month1"].tolist() == [100, 101]
+
+
+def _snapshot(rows):
+    """Short-name snapshot frame; unspecified metrics are 0."""
+    return pd.DataFrame([
+        {
+            "Main_LOB": "Amisys Medicaid DOMESTIC", "State": "CA", "Case_Type": "Claims",
+            "Case_ID": case_id, "Target_CPH": 10,
+            **dict.fromkeys(SNAPSHOT_METRIC_COLUMNS, 0), **metrics,
+        }
+        for case_id, metrics in rows
+    ])
+
+
+def test_compare_reports_additions_deletions_and_updates():
+    before = _snapshot([
+        ("KEEP", {"FTE_Avail_Month1": 5}),
+        ("UPDATE", {"FTE_Avail_Month1": 5, "Capacity_Month1": 100}),
+        ("DELETE", {"Client_Forecast_Month2": 40}),
+    ])
+    after = _snapshot([
+        ("KEEP", {"FTE_Avail_Month1": 5}),
+        ("UPDATE", {"FTE_Avail_Month1": 7, "Capacity_Month1": 100}),
+        ("ADD", {"FTE_Required_Month2": 3}),
+    ]).rename(columns={"Main_LOB": "Centene_Capacity_Plan_Main_LOB"})
+
+    records, total = compare_forecast_snapshots(before, after, MONTHS_DICT)
+    by_id = {r["case_id"]: r for r in records}
+
+    assert total == 3 and set(by_id) == {"UPDATE", "DELETE", "ADD"}
+
+    update = by_id["UPDATE"]
+    assert update["modified_fields"] == [
+        "Jun-25.forecast", "Jun-25.fte_req", "Jun-25.fte_avail", "Jun-25.capacity"
+    ]
+    assert update["Jun-25"]["fte_avail"] == 7 and update["Jun-25"]["fte_avail_change"] == 2
+    assert update["Jun-25"]["capacity_change"] == 0
+
+    delete = by_id["DELETE"]
+    assert delete["modified_fields"] == ["target_cph", "Jul-25.forecast"]
+    assert delete["target_cph"] == 0 and delete["target_cph_change"] == -10
+    assert delete["Jul-25"]["forecast"] == 0 and delete["Jul-25"]["forecast_change"] == -40
+
+    add = by_id["ADD"]
+    assert add["modified_fields"] == ["target_cph", "Jul-25.fte_req"]
+    assert add["Jul-25"]["fte_req"] == 3 and add["Jul-25"]["fte_req_change"] == 3
+
+
+def test_compare_new_upload_includes_every_record():
+    after = _snapshot([("A", {"FTE_Avail_Month1": 5, "Capacity_Month2": float("nan")}), ("B", {})])
+    after["Target_CPH"] = [10, 0]
+
+    records, total = compare_forecast_snapshots(None, after, MONTHS_DICT)
+
+    assert total == 2
+    assert records[0]["modified_fields"] == ["target_cph", "Jun-25.fte_avail"]
+    assert records[0]["Jun-25"]["fte_avail_change"] == 5
+    assert records[0]["Jul-25"]["capacity"] == 0
+    assert records[1]["modified_fields"] == []
+
+
+def test_compare_uses_first_of_duplicate_previous_keys():
+    before = _snapshot([("A", {"FTE_Avail_Month1": 5}), ("A", {"FTE_Avail_Month1": 9})])
+    after = _snapshot([("A", {"FTE_Avail_Month1": 5})])
+
+    assert compare_forecast_snapshots(before, after, MONTHS_DICT) == ([], 0)
+
+
+def test_history_log_matches_bench_changes_and_summary():
+    before = _snapshot([
+        ("UPDATE", {"FTE_Avail_Month1": 5, "Capacity_Month4": 100}),
+        ("DELETE", {"Client_Forecast_Month6": 40}),
+    ])
+    after = _snapshot([
+        ("UPDATE", {"FTE_Avail_Month1": 7, "Capacity_Month4": 90}),
+        ("ADD", {"FTE_Required_Month2": 3}),
+    ])
+    records, _ = compare_forecast_snapshots(before, after, SIX_MONTHS_DICT)
+
+    with patch.object(forecast_upload_history, "get_months_dict", return_value=SIX_MONTHS_DICT), \
+         patch.object(forecast_upload_history, "create_history_log", return_value="log-1") as create_log, \
+         patch.object(forecast_upload_history, "add_history_changes") as add_changes:
+        result = create_forecast_upload_history_log("April", 2025, "tester", None, before, after, MagicMock())
+
+    assert result == {"success": True, "history_log_id": "log-1", "records_modified": 3}
+    # Compared by repr too: 10 == 10.0, but history stores str(value)
+    summary = create_log.call_args.kwargs["summary_data"]
+    expected_summary = calculate_summary_data(records, SIX_MONTHS_DICT, "April", 2025)
+    assert summary == expected_summary and repr(summary) == repr(expected_summary)
+    changes = add_changes.call_args.args[1]
+    expected_changes = extract_specific_changes(records, SIX_MONTHS_DICT)
+    assert changes == expected_changes and repr(changes) == repr(expected_changes)
+    add_changes.assert_called_once_with("log-1", expected_changes)
+
+    update = next(r for r in records if r["case_id"] == "UPDATE")
+    assert type(update["target_cph"]) is int
+    assert type(update["Jun-25"]["fte_avail"]) is int and type(update["Jun-25"]["fte_avail_change"]) is int
+    assert type(summary["totals"]["Sep-25"]["total_capacity"]["old"]) is int
+
+
+def _stored_values(history_changes_db, before, after):
+    with patch.object(forecast_upload_history, "get_months_dict", return_value=SIX_MONTHS_DICT), \
+         patch.object(forecast_upload_history, "create_history_log", return_value="log-1"):
+        result = create_forecast_upload_history_log("April", 2025, "tester", None, before, after, MagicMock())
+    assert result["success"]
+
+    with history_changes_db() as session:
+        rows = session.query(HistoryChangeModel).order_by(HistoryChangeModel.id).all()
+        return [(r.FieldName, r.OldValue, r.NewValue) for r in rows]
+
+
+def test_stored_history_values_keep_integers(history_changes_db):
+    before = _snapshot([("A", {"Client_Forecast_Month1": 90, "FTE_Avail_Month1": 5})])
+    after = _snapshot([("A", {"Client_Forecast_Month1": 100, "FTE_Avail_Month1": 5})])
+    after["Target_CPH"] = [12]
+
+    assert _stored_values(history_changes_db, before, after) == [
+        ("target_cph", "10", "12"),
+        ("Jun-25.forecast", "90", "100"),
+        ("Jun-25.fte_req", "0", "0"),
+        ("Jun-25.fte_avail", "5", "5"),
+        ("Jun-25.capacity", "0", "0"),
+    ]
+
+
+def test_stored_history_values_keep_integers_for_new_upload(history_changes_db):
+    after = _snapshot([("A", {"Client_Forecast_Month1": 100, "FTE_Avail_Month2": 2.5})])
+
+    assert _stored_values(history_changes_db, None, after) == [
+        ("target_cph", "0", "10"),
+        ("Jun-25.forecast", "0", "100"),
+        ("Jul-25.fte_avail", "0", "2.5"),
+    ]
+
+
+def test_compare_empty_upload():
+    before = _snapshot([("A", {"FTE_Avail_Month1": 5})])
+    empty = before.iloc[0:0]
+
+    assert compare_forecast_snapshots(None, empty, MONTHS_DICT) == ([], 0)
+
+    records, total = compare_forecast_snapshots(before, empty, MONTHS_DICT)
+    assert total == 1 and records[0]["Jun-25"]["fte_avail_change"] == -5
+
+    # Uploads arrive with the long Centene_Capacity_Plan_* names
+    long_empty = empty.rename(columns={short: long for long, short in FORECAST_COLUMN_MAPPING.items()})
+    assert compare_forecast_snapshots(before, long_empty, MONTHS_DICT) == (records, total)
+
+
+def test_compare_missing_key_columns_raises():
+    before = _snapshot([("A", {})])
+
+    with pytest.raises(ValueError, match="missing key columns: \\['Case_ID'\\]"):
+        compare_forecast_snapshots(before, before.drop(columns=["Case_ID"]), MONTHS_DICT)
@@ -0,0 +1,202 @@
+"""
+Tests for FTE allocation mapping population (code.logics.fte_allocation_mapping).
+
+Covers:
+  - populate_fte_mapping_from_primary writes one row per (CN, forecast month)
+    with vendor details and parsed skills, replacing earlier primary rows in
+    the same transaction (a failed insert keeps the earlier rows)
+  - Forecast months before the report month fall in the next year
+  - Vendors missing from vendor_df are skipped; duplicate CNs use the first row
+  - Roster columns missing from vendor_df are written as ''
+  - Rows are inserted in batches of FTE_MAPPING_INSERT_CHUNK_SIZE
+  - populate_fte_mapping_from_bench writes one row per allocated vendor, parsing
+    each distinct NewWorkType once
+  - get_fte_mappings groups FTEs by forecast month with per-type counts, and
+    reports when nothing matches
+  - get_fte_mappings counts the FTE rows it lists, in a single query
+  - Lookups compare plain columns on MSSQL and lower(column) elsewhere
+  - The FTE mapping session factory is built once per core_utils
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects import mssql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+
+from code.logics import fte_allocation_mapping
+from code.logics.bench_allocation import ForecastRowData, VendorAllocation
+from code.logics.db import FTEAllocationMappingModel
+from code.logics.fte_allocation_mapping import (
+    _case_insensitive_equals,
+    get_fte_mappings,
+    populate_fte_mapping_from_bench,
+    populate_fte_mapping_from_primary,
+)
+
+
+WORKTYPE_VOCAB = ["claims processing", "adj", "ftc"]
+MONTH_HEADERS = ["April", "May", "June", "July", "August", "September"]
+
+
+@pytest.fixture
+def session_factory(sqlite_session_factory):
+    return sqlite_session_factory(FTEAllocationMappingModel)
+
+
+@pytest.fixture
+def core_utils(session_factory):
+    db_manager = MagicMock()
+    db_manager.SessionLocal = session_factory
+    utils = MagicMock()
+    utils.get_db_manager.return_value = db_manager
+    return utils
+
+
+def _rows(session_factory, allocation_type):
+    with session_factory() as session:
+        return sorted(
+            session.query(FTEAllocationMappingModel)
+            .filter(FTEAllocationMappingModel.allocation_type == allocation_type),
+            key=lambda row: (row.cn, row.forecast_month_index)
+        )
+
+
+def _vendor_df():
+    return pd.DataFrame([
+        {"CN": 101, "FirstName": "Ann", "LastName": "Lee", "OPID": "OP1",
+         "PrimaryPlatform": "Amisys", "PrimaryMarket": "Medicaid", "Location": "Domestic",
+         "State": "CA", "NewWorkType": "FTC ADJ"},
+        {"CN": 102, "FirstName": "Bo", "LastName": "Kim", "OPID": "OP2",
+         "PrimaryPlatform": "Facets", "PrimaryMarket": "Medicare", "Location": "Global",
+         "State": "TX", "NewWorkType": "Claims Processing"},
+        {"CN": "101", "FirstName": "Duplicate", "LastName": "Row", "OPID": "OP3",
+         "PrimaryPlatform": "Amisys", "PrimaryMarket": "Medicaid", "Location": "Domestic",
+         "State": "NY", "NewWorkType": "ADJ"},
+    ])
+
+
+def test_primary_rows_per_vendor_month(session_factory, core_utils):
+    allocations = {
+        "101": {
+            "April": {"platform": "Amisys Medicaid DOMESTIC", "state": "CA", "worktype": "FTC"},
+            "May": {"platform": "Amisys Medicaid DOMESTIC", "state": "CA", "worktype": "ADJ"},
+        },
+        "102": {"January": {"platform": "Facets Medicare GLOBAL", "state": "TX", "worktype": "Claims"}},
+        "999": {"April": {"platform": "Unknown", "state": "NY", "worktype": "FTC"}},
+    }
+
+    vendor_df = _vendor_df().drop(columns=["PrimaryMarket"])
+    args = ("exec-1", "March", 2025, allocations, vendor_df, MONTH_HEADERS, WORKTYPE_VOCAB, core_utils)
+    assert populate_fte_mapping_from_primary(*args) == 3
+    # Re-running replaces rather than appends, whatever the batch size
+    with patch.object(fte_allocation_mapping, "FTE_MAPPING_INSERT_CHUNK_SIZE", 2):
+        assert populate_fte_mapping_from_primary(*args) == 3
+
+    # A failed insert rolls back the clear too, keeping the previous mappings
+    with patch.object(
+        fte_allocation_mapping, "_insert_fte_mappings", side_effect=SQLAlchemyError("insert failed")
+    ):
+        assert populate_fte_mapping_from_primary(*args) == 0
+
+    rows = _rows(session_factory, "primary")
+    assert [(r.cn, r.forecast_month_label, r.forecast_month_index) for r in rows] == [
+        ("101", "Apr-25", 1), ("101", "May-25", 2), ("102", "Jan-26", 0)
+    ]
+    assert [r.forecast_year for r in rows] == [2025, 2025, 2026]
+    first = rows[0]
+    assert (first.first_name, first.opid, first.original_state) == ("Ann", "OP1", "CA")
+    assert first.primary_market == ""
+    assert first.skills == "adj, ftc"
+    assert first.created_datetime is not None
+
+
+def test_bench_rows_per_vendor(session_factory, core_utils):
+    forecast_row = ForecastRowData(
+        forecast_id=1, call_type_id="CT-1", main_lob="Amisys Medicaid DOMESTIC", state="CA",
+        case_type="FTC", target_cph=10, month_name="May", month_year=2025, month_index=2,
+        forecast=100.0, fte_required=5, fte_avail=3, fte_avail_original=2,
+        capacity=300, capacity_original=200,
+    )
+    vendors = [
+        VendorAllocation(
+            first_name="Ann", last_name=None, cn=cn, platform="Amisys", location="Domestic",
+            skills="FTC ADJ", state_list=["CA"], original_state="CA", allocated=True,
+            skillset=skillset,
+        )
+        for cn, skillset in [("201", frozenset({"ftc"})), ("202", None), ("203", None)]
+    ]
+    changes = {(1, 2): {"forecast_row": forecast_row, "vendors": vendors}}
+
+    with patch.object(
+        fte_allocation_mapping, "parse_vendor_skills", wraps=fte_allocation_mapping.parse_vendor_skills
+    ) as parse:
+        assert populate_fte_mapping_from_bench("exec-1", "March", 2025, changes, WORKTYPE_VOCAB, core_utils) == 3
+
+    parse.assert_called_once_with("FTC ADJ", WORKTYPE_VOCAB)
+    rows = _rows(session_factory, "bench")
+    assert [(r.cn, r.call_type_id, r.forecast_month_label, r.skills) for r in rows] == [
+        ("201", "CT-1", "May-25", "ftc"), ("202", "CT-1", "May-25", "adj, ftc"),
+        ("203", "CT-1", "May-25", "adj, ftc"),
+    ]
+    assert rows[0].last_name == ""
+
+
+def _record_statements(session_factory):
+    statements = []
+    event.listen(
+        session_factory.kw["bind"], "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement)
+    )
+    return statements
+
+
+def test_get_fte_mappings_groups_by_month(session_factory, core_utils):
+    allocations = {
+        "101": {
+            "April": {"platform": "Amisys Medicaid DOMESTIC", "state": "CA", "worktype": "FTC"},
+            "May": {"platform": "Amisys Medicaid DOMESTIC", "state": "CA", "worktype": "FTC"},
+        },
+        "102": {"April": {"platform": "Amisys Medicaid DOMESTIC", "state": "CA", "worktype": "FTC"}},
+    }
+    populate_fte_mapping_from_primary(
+        "exec-1", "March", 2025, allocations, _vendor_df(), MONTH_HEADERS, WORKTYPE_VOCAB, core_utils
+    )
+
+    statements = _record_statements(session_factory)
+    result = get_fte_mappings("March", 2025, "amisys medicaid domestic", "ca", "ftc", core_utils=core_utils)
+
+    # Rows and counts come from the same (single) query, so they always agree
+    assert len(statements) == 1
+    assert result["success"] and result["allocation_execution_id"] == "exec-1"
+    assert result["total_fte_count"] == 3
+    assert result["allocation_type_summary"] == {"primary": 3, "bench": 0}
+    assert result["forecast_months"] == ["Apr-25", "May-25"]
+    april = result["fte_by_month"]["Apr-25"]
+    assert april["fte_count"] == 2 and [fte["cn"] for fte in april["ftes"]] == ["101", "102"]
+    assert result["fte_by_month"]["May-25"]["fte_count"] == 1
+    assert april["ftes"][0] == {
+        "cn": "101", "first_name": "Ann", "last_name": "Lee", "opid": "OP1",
+        "primary_platform": "Amisys", "primary_market": "Medicaid", "location": "Domestic",
+        "original_state": "CA", "worktype": "FTC ADJ", "new_work_type": "FTC ADJ",
+        "skills": "adj, ftc", "allocation_type": "primary",
+    }
+
+    missing = get_fte_mappings("March", 2025, "Other LOB", "CA", "FTC", core_utils=core_utils)
+    assert not missing["success"] and missing["total_fte_count"] == 0
+
+    # The DB manager is built once per core_utils and its session factory reused
+    core_utils.get_db_manager.assert_called_once()
+
+
+def test_case_insensitive_match_keeps_mssql_columns_seekable():
+    column = FTEAllocationMappingModel.main_lob
+
+    def compiled(dialect_name, dialect):
+        clause = _case_insensitive_equals(column, "Amisys Medicaid DOMESTIC", dialect_name)
+        return str(clause.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+    assert compiled("mssql", mssql.dialect()) == "fte_allocation_mapping.main_lob = 'Amisys Medicaid DOMESTIC'"
+    assert compiled("sqlite", sqlite.dialect()) == "lower(fte_allocation_mapping.main_lob) = 'amisys medicaid domestic'"
@@ -0,0 +1,185 @@
+"""
+Tests for history Excel export (code.logics.history_excel_generator).
+
+Covers:
+  - _prepare_pivot_data pivots changes to one row per forecast record in
+    first-seen order, formats "new (old)" values, and lets later changes win,
+    including for thousands of distinct records
+  - _month_label_sort_keys returns the same year * 100 + month keys as
+    _parse_month_label, with unknown formats last
+  - Malformed years sort last instead of raising
+  - Changes column widths come from the DataFrame, capped at 50
+  - generate_history_excel writes merged two-row headers, the data rows,
+    column widths and the Summary sheet
+  - Cell text starting with "=" or looking like a URL is written as plain text
+"""
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from code.logics.history_excel_generator import (
+    HistoryChangeRecord,
+    HistoryLogData,
+    _changes_column_widths,
+    _month_label_sort_keys,
+    _parse_month_label,
+    _prepare_pivot_data,
+    generate_history_excel,
+)
+
+
+def _history_log():
+    return HistoryLogData.from_dict({
+        "id": "log-1", "change_type": "Bench Allocation", "month": "March", "year": 2025,
+        "timestamp": "2025-03-01T00:00:00", "user": "tester", "description": None,
+        "records_modified": 2,
+        "summary_data": {
+            "report_month": "March", "report_year": 2025, "months": ["Jun-25"],
+            "totals": {"Jun-25": {"total_fte_available": {"old": 20, "new": 25}}},
+        },
+    })
+
+
+def _changes():
+    rows = [
+        ("CL-001", "Jun-25.fte_avail", 20, 25),
+        ("CL-001", "Dec-24.forecast", None, 1000),
+        ("CL-001", "target_cph", 10, 12),
+        ("CL-002", "Jun-25.capacity", 1125.5, 1125.5),
+    ]
+    return [
+        HistoryChangeRecord.from_dict({
+            "main_lob": "Amisys Medicaid DOMESTIC", "state": "TX", "case_type": "Claims Processing",
+            "case_id": case_id, "field_name": field_name, "old_value": old, "new_value": new,
+            "delta": None, "month_label": None,
+        })
+        for case_id, field_name, old, new in rows
+    ]
+
+
+def test_prepare_pivot_data_groups_by_record():
+    changes = _changes() + [
+        HistoryChangeRecord(
+            main_lob="Amisys Medicaid DOMESTIC", state="TX", case_type="Claims Processing",
+            case_id="CL-001", field_name=field_name, old_value=20, new_value=30, delta=None, month_label=None,
+        )
+        for field_name in ("Jun-25.fte_avail", "")
+    ] + [
+        HistoryChangeRecord(
+            main_lob="Amisys Medicaid DOMESTIC", state=None, case_type="Claims Processing",
+            case_id="CL-003", field_name="Jun-25.capacity", old_value=None, new_value=5, delta=None, month_label=None,
+        )
+    ]
+
+    pivot_rows, month_labels, static_columns = _prepare_pivot_data(changes)
+
+    assert month_labels == ["Dec-24", "Jun-25"]
+    assert static_columns == ["Main LOB", "State", "Case Type", "Case ID", "Target CPH"]
+    assert [row["Case ID"] for row in pivot_rows] == ["CL-001", "CL-002", "CL-003"]
+    assert pivot_rows[0]["Jun-25 FTE Available"] == "30 (20)"
+    assert pivot_rows[0]["Dec-24 Client Forecast"] == 1000
+    assert pivot_rows[0]["Target CPH"] == "12 (10)"
+    assert pivot_rows[1] == {
+        "Main LOB": "Amisys Medicaid DOMESTIC", "State": "TX", "Case Type": "Claims Processing",
+        "Case ID": "CL-002", "Jun-25 Capacity": 1125.5,
+    }
+    assert pivot_rows[2]["State"] is None
+
+
+def test_prepare_pivot_data_with_many_distinct_records():
+    # Keys spread over every level, so a cross product of the levels would be huge
+    changes = [
+        HistoryChangeRecord(
+            main_lob=f"LOB-{i % 50}", state=f"S{i % 37}", case_type=f"CT-{i % 11}", case_id=f"CL-{i}",
+            field_name=field_name, old_value=i, new_value=i + 1, delta=None, month_label=None,
+        )
+        for i in range(3000)
+        for field_name in ("Jun-25.fte_avail", "target_cph")
+    ]
+
+    pivot_rows, month_labels, _ = _prepare_pivot_data(changes)
+
+    assert month_labels == ["Jun-25"]
+    assert len(pivot_rows) == 3000
+    assert pivot_rows[2999] == {
+        "Main LOB": "LOB-49", "State": "S2", "Case Type": "CT-7", "Case ID": "CL-2999",
+        "Jun-25 FTE Available": "3000 (2999)", "Target CPH": "3000 (2999)",
+    }
+
+
+def test_month_label_sort_keys_match_scalar_parser():
+    labels = ["Jun-25", "dec-2024", "Sept-25", "Jan-5", "JAN-25", "Feb25", ""]
+
+    keys = _month_label_sort_keys(labels)
+
+    assert keys.tolist() == [202506, 202412, 999999, 999999, 202501, 999999, 999999]
+    assert keys.tolist() == [_parse_month_label(label) for label in labels]
+
+
+def test_malformed_month_labels_sort_last_without_raising():
+    # "²" passes str.isdigit() but int() rejects it
+    labels = ["Jun-2x", "Jun-\u00b25", "Jun-+25", "Jun- 25", "Jun-"]
+
+    assert [_parse_month_label(label) for label in labels] == [999999] * len(labels)
+    assert _month_label_sort_keys(labels).tolist() == [999999] * len(labels)
+
+
+def _sheet_contents(excel_buffer):
+    wb = load_workbook(excel_buffer)
+    return {
+        ws.title: (
+            [[cell.value for cell in row] for row in ws.iter_rows()],
+            sorted(str(merged) for merged in ws.merged_cells.ranges),
+            {letter: int(dim.width) for letter, dim in ws.column_dimensions.items()},
+        )
+        for ws in wb.worksheets
+    }
+
+
+def test_export_layout():
+    sheets = _sheet_contents(generate_history_excel(_history_log(), _changes()))
+
+    values, merged, widths = sheets["Changes"]
+    assert values[0][:6] == ["Main LOB", "State", "Case Type", "Case ID", "Target CPH", "Dec-24"]
+    assert values[1][5:9] == ["Client Forecast", "FTE Required", "FTE Available", "Capacity"]
+    assert values[2] == [
+        "Amisys Medicaid DOMESTIC", "TX", "Claims Processing", "CL-001", "12 (10)",
+        1000, 0, 0, 0, 0, 0, "25 (20)", 0,
+    ]
+    assert values[3][4] is None and values[3][12] == 1125.5
+    assert merged == ["A1:A2", "B1:B2", "C1:C2", "D1:D2", "E1:E2", "F1:I1", "J1:M1"]
+    assert widths["A"] == len("Amisys Medicaid DOMESTIC") + 2 and widths["F"] == len("Client Forecast") + 2
+
+    summary_values, _, summary_widths = sheets["Summary"]
+    assert summary_values[0] == ["History Log ID", "log-1"]
+    assert summary_values[-1] == ["Jun-25 Total FTE Available (New)", "25"]
+    assert summary_widths == {"A": len("Jun-25 Total FTE Available (Old)") + 2, "B": len("2025-03-01T00:00:00") + 2}
+
+    ws = load_workbook(generate_history_excel(_history_log(), _changes()))["Changes"]
+    assert ws["F1"].font.b and ws["F1"].fill.fgColor.rgb.endswith("366092")
+    assert ws["F2"].fill.fgColor.rgb.endswith("5B9BD5")
+    assert ws["A3"].border.left.style == "thin"
+
+
+def test_changes_column_widths_from_dataframe():
+    df = pd.DataFrame(
+        [["x" * 80, None, 1000, 0, 0, 0], ["LOB", None, 12345678901234567, 0, 0, 0]],
+        columns=["Main LOB", "Case ID", "Jun-25 Client Forecast", "Jun-25 FTE Required",
+                 "Jun-25 FTE Available", "Jun-25 Capacity"],
+    )
+
+    assert _changes_column_widths(df, ["Jun-25"], ["Main LOB", "Case ID"]) == [
+        50, len("Case ID") + 2, len("12345678901234567") + 2,
+        len("FTE Required") + 2, len("FTE Available") + 2, len("Capacity") + 2,
+    ]
+
+
+def test_cell_text_is_never_a_formula_or_hyperlink():
+    changes = _changes()
+    changes[0].case_id = '=HYPERLINK("http://example.com", "x")'
+    changes[0].main_lob = "https://example.com/lob"
+
+    ws = load_workbook(generate_history_excel(_history_log(), changes[:1]))["Changes"]
+
+    assert ws["D3"].value == '=HYPERLINK("http://example.com", "x")' and ws["D3"].data_type == "s"
+    assert ws["A3"].value == "https://example.com/lob" and ws["A3"].hyperlink is None
@@ -0,0 +1,110 @@
+"""
+Tests for load_forecast_records_by_keys (code.logics.edit_view_utils).
+
+Covers:
+  - Only rows for the requested month/year and keys are returned
+  - Rows that only match the per-column IN superset are dropped
+  - Rows come back ordered by id, each at most once, across multiple IN-filter chunks
+  - Empty key list issues no query and returns []
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from code.logics import edit_view_utils
+from code.logics.db import ForecastModel
+from code.logics.edit_view_utils import load_forecast_records_by_keys
+
+
+KEY_COLUMNS = [
+    ForecastModel.Centene_Capacity_Plan_Main_LOB,
+    ForecastModel.Centene_Capacity_Plan_State,
+    ForecastModel.Centene_Capacity_Plan_Case_Type,
+]
+
+
+@pytest.fixture
+def session(sqlite_session_factory):
+    SessionLocal = sqlite_session_factory(ForecastModel)
+
+    with SessionLocal() as session:
+        yield session
+
+
+def _add_row(session, main_lob, state, case_type, month="April", year=2025):
+    row = ForecastModel(
+        Centene_Capacity_Plan_Main_LOB=main_lob,
+        Centene_Capacity_Plan_State=state,
+        Centene_Capacity_Plan_Case_Type=case_type,
+        Centene_Capacity_Plan_Call_Type_ID=f"{main_lob}-{state}-{case_type}",
+        Month=month,
+        Year=year,
+        UploadedFile="forecast.xlsx",
+        CreatedBy="tester",
+        UpdatedBy="tester",
+    )
+    session.add(row)
+    session.commit()
+    return row.id
+
+
+def test_filters_by_month_year_and_keys(session):
+    wanted = _add_row(session, "Amisys Medicaid DOMESTIC", "CA", "Claims")
+    _add_row(session, "Amisys Medicaid DOMESTIC", "CA", "Claims", month="May")
+    _add_row(session, "Facets Medicare GLOBAL", "TX", "Appeals")
+
+    rows = load_forecast_records_by_keys(
+        session, "April", 2025, KEY_COLUMNS,
+        [("Amisys Medicaid DOMESTIC", "CA", "Claims")]
+    )
+
+    assert [r.id for r in rows] == [wanted]
+
+
+def test_superset_only_rows_are_dropped(session):
+    wanted = [
+        _add_row(session, "LOB A", "CA", "Claims"),
+        _add_row(session, "LOB B", "TX", "Claims"),
+    ]
+    # Matches every IN filter (LOB A, TX, Claims) but is not a requested key
+    _add_row(session, "LOB A", "TX", "Claims")
+
+    rows = load_forecast_records_by_keys(
+        session, "April", 2025, KEY_COLUMNS,
+        [("LOB A", "CA", "Claims"), ("LOB B", "TX", "Claims")]
+    )
+
+    assert [r.id for r in rows] == wanted
+
+
+def test_single_key_column(session):
+    wanted = _add_row(session, "LOB A", "CA", "Claims")
+    _add_row(session, "LOB B", "CA", "Claims")
+
+    rows = load_forecast_records_by_keys(
+        session, "April", 2025, [ForecastModel.Centene_Capacity_Plan_Main_LOB], [("LOB A",)]
+    )
+
+    assert [r.id for r in rows] == [wanted]
+
+
+def test_rows_ordered_by_id_and_unique_across_chunks(session):
+    keys = [("LOB A", "CA", "Claims"), ("LOB B", "TX", "Claims"), ("LOB A", "TX", "Claims")]
+    ids = [_add_row(session, *key) for key in keys]
+    duplicate_id = _add_row(session, *keys[0])
+
+    # Chunk size 1 forces one query per key; ("LOB A", "CA") and ("LOB A", "TX")
+    # share column values, so supersets overlap between chunks
+    with patch.object(edit_view_utils, "FORECAST_KEY_CHUNK_SIZE", 1):
+        rows = load_forecast_records_by_keys(
+            session, "April", 2025, KEY_COLUMNS, list(reversed(keys)) + [keys[0]]
+        )
+
+    assert [r.id for r in rows] == sorted(ids + [duplicate_id])
+
+
+def test_empty_keys_returns_empty_list(session):
+    _add_row(session, "LOB A", "CA", "Claims")
+
+    assert load_forecast_records_by_keys(session, "April", 2025, KEY_COLUMNS, []) == []
@@ -0,0 +1,87 @@
+"""
+Tests for get_month_config_for_forecast (code.logics.cph_update_transformer).
+
+Covers:
+  - Configs for all months are loaded per WorkType, with defaults for missing months
+  - Cached results are returned as copies, so callers cannot mutate the cache
+  - Forecast configs live in their own cache, cleared by month config writes
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from code.cache import (
+    forecast_month_config_cache,
+    invalidate_month_config_cache,
+    month_config_cache,
+)
+from code.logics.db import MonthConfigurationModel
+from code.logics.cph_update_transformer import get_month_config_for_forecast
+
+
+MONTHS_DICT = {"month1": "Jun-25", "month2": "Jul-25", "month3": "Jan-26"}
+
+
+@pytest.fixture
+def core_utils(sqlite_session_factory):
+    SessionLocal = sqlite_session_factory(MonthConfigurationModel)
+
+    with SessionLocal() as session:
+        for month, year, work_type, working_days in [
+            ("June", 2025, "Domestic", 20),
+            ("June", 2025, "Global", 22),
+            ("January", 2026, "Domestic", 19),
+            ("January", 2025, "Domestic", 18),  # same month, other year: must not match
+        ]:
+            session.add(MonthConfigurationModel(
+                Month=month, Year=year, WorkType=work_type, WorkingDays=working_days,
+                Occupancy=0.9, Shrinkage=0.2, WorkHours=8, CreatedBy="tester", UpdatedBy="tester",
+            ))
+        session.commit()
+
+    db_manager = MagicMock()
+    db_manager.SessionLocal = SessionLocal
+    utils = MagicMock()
+    utils.get_db_manager.return_value = db_manager
+
+    month_config_cache.clear()
+    forecast_month_config_cache.clear()
+    with patch("code.logics.cph_update_transformer.get_months_dict", return_value=MONTHS_DICT):
+        yield utils
+    month_config_cache.clear()
+    forecast_month_config_cache.clear()
+
+
+def test_loads_configs_per_work_type_with_defaults(core_utils):
+    config = get_month_config_for_forecast("April", 2025, core_utils, "Domestic")
+
+    assert config["month1"]["working_days"] == 20
+    assert config["month2"] == {'working_days': 21, 'work_hours': 9, 'shrinkage': 0.10, 'occupancy': 0.95}
+    assert config["month3"]["working_days"] == 19
+
+    assert get_month_config_for_forecast("April", 2025, core_utils, "Global")["month1"]["working_days"] == 22
+
+
+def test_cached_result_is_copied(core_utils):
+    first = get_month_config_for_forecast("April", 2025, core_utils, "Domestic")
+    first["month1"]["working_days"] = 0
+
+    assert get_month_config_for_forecast("April", 2025, core_utils, "Domestic")["month1"]["working_days"] == 20
+
+
+def test_endpoint_entries_do_not_evict_forecast_configs(core_utils):
+    get_month_config_for_forecast("April", 2025, core_utils, "Domestic")
+    for i in range(month_config_cache.max_size + 1):
+        month_config_cache.set(f"month_config:v1:m{i}:2025:Domestic", {"data": i})
+
+    with patch("code.logics.cph_update_transformer.get_months_dict") as months_dict:
+        get_month_config_for_forecast("April", 2025, core_utils, "Domestic")
+    months_dict.assert_not_called()
+
+
+def test_month_config_invalidation_clears_forecast_configs(core_utils):
+    get_month_config_for_forecast("April", 2025, core_utils, "Domestic")
+    invalidate_month_config_cache()
+
+    assert forecast_month_config_cache.stats()["size"] == 0
@@ -0,0 +1,79 @@
+"""
+Tests for the fused fte_req/capacity kernel (code.logics.reallocation_kernel).
+
+Covers:
+  - The loop body (run as plain Python here) matches the scalar formulas element for element
+  - compute_fte_req_and_capacity only recalculates fte_req for the selected rows
+  - Invalid inputs raise ValueError on both the numba and NumPy paths
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from code.logics import reallocation_kernel as kernel
+from code.logics.capacity_calculations import calculate_fte_required, calculate_capacity
+
+
+CONFIGS = [
+    {'working_days': 21, 'work_hours': 9, 'shrinkage': 0.10},
+    {'working_days': 20, 'work_hours': 8, 'shrinkage': 0.15},
+    {'working_days': 22, 'work_hours': 7.5, 'shrinkage': 0.0},
+]
+
+
+def _inputs():
+    forecast = np.array([[1000, 0, 50000], [12345, 999, 1]], dtype=float)
+    base_fte = np.array([[10, 0, 7], [3, 25, 1]], dtype=float)
+    fte_req = np.array([[9, 9, 9], [9, 9, 9]], dtype=np.int64)
+    wd = np.tile([c['working_days'] for c in CONFIGS], (2, 1)).astype(float)
+    wh = np.tile([c['work_hours'] for c in CONFIGS], (2, 1)).astype(float)
+    shr = np.tile([c['shrinkage'] for c in CONFIGS], (2, 1)).astype(float)
+    cph = np.array([[50.0], [12.5]])
+    return forecast, base_fte, fte_req, wd, wh, shr, cph
+
+
+@pytest.mark.parametrize("numba_available", [True, False])
+def test_results_match_scalar_formulas(numba_available):
+    forecast, base_fte, fte_req, wd, wh, shr, cph = _inputs()
+    recalc = np.array([True, False])
+
+    # With NUMBA_AVAILABLE forced on and numba absent, the loop runs as plain Python
+    with patch.object(kernel, "NUMBA_AVAILABLE", numba_available):
+        out_fte_req, out_capacity = kernel.compute_fte_req_and_capacity(
+            forecast, base_fte, fte_req, recalc, wd, wh, shr, cph
+        )
+
+    for j, config in enumerate(CONFIGS):
+        assert out_fte_req[0, j] == calculate_fte_required(forecast[0, j], config, cph[0, 0])
+        assert out_fte_req[1, j] == 9  # row not selected for recalculation
+        for i in range(2):
+            assert out_capacity[i, j] == calculate_capacity(base_fte[i, j], config, cph[i, 0])
+
+
+@pytest.mark.parametrize("numba_available", [True, False])
+def test_negative_base_fte_raises(numba_available):
+    forecast, base_fte, fte_req, wd, wh, shr, cph = _inputs()
+    base_fte[1, 2] = -1
+
+    with patch.object(kernel, "NUMBA_AVAILABLE", numba_available):
+        with pytest.raises(ValueError, match="fte_avail cannot be negative"):
+            kernel.compute_fte_req_and_capacity(
+                forecast, base_fte, fte_req, np.array([True, True]), wd, wh, shr, cph
+            )
+
+
+@pytest.mark.parametrize("numba_available", [True, False])
+def test_negative_forecast_only_checked_for_recalculated_rows(numba_available):
+    forecast, base_fte, fte_req, wd, wh, shr, cph = _inputs()
+    forecast[1, 0] = -5
+
+    with patch.object(kernel, "NUMBA_AVAILABLE", numba_available):
+        kernel.compute_fte_req_and_capacity(
+            forecast, base_fte, fte_req, np.array([True, False]), wd, wh, shr, cph
+        )
+        with pytest.raises(ValueError, match="forecast cannot be negative"):
+            kernel.compute_fte_req_and_capacity(
+                forecast, base_fte, fte_req, np.array([False, True]), wd, wh, shr, cph
+            )
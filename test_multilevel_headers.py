@@ -32,10 +32,10 @@ def test_parse_month_label():
     print("=" * 70)
 
     test_cases = [
-        ("Jun-25", (2025, 6)),
-        ("Dec-24", (2024, 12)),
-        ("Jan-26", (2026, 1)),
-        ("Mar-2025", (2025, 3))
+        ("Jun-25", 202506),
+        ("Dec-24", 202412),
+        ("Jan-26", 202601),
+        ("Mar-2025", 202503)
     ]
 
     for month_label, expected in test_cases: